@@ -1,148 +1,354 @@
-#!/usr/bin/python
-# -*- coding: utf8 -*-
-
-## This code can update all stock files in a given folder directory. 
-## Author: Miguel Opeña
-## Version: 4.2.2
-
-import logging
-import os
-import pandas as pd
-import sys
-import time
-
-from command_parser import CCmdParser
-from download import CDownloader
-DATATYPE = "csv"
-LOGDIR = "/Users/openamiguel/Desktop/LOG"
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-# Set file path for logger
-handler = logging.FileHandler('{}/equitysim_update.log'.format(LOGDIR))
-handler.setLevel(logging.DEBUG)
-# Format the logger
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-# Add the new format
-logger.addHandler(handler)
-# Format the console logger
-consoleHandler = logging.StreamHandler()
-consoleHandler.setLevel(logging.INFO)
-consoleHandler.setFormatter(formatter)
-# Add the new format to the logger file
-logger.addHandler(consoleHandler)
-
-logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
-
-# Delay prevents HTTP 503 errors (AlphaVantage recommends 10, but 15 works in practice)
-DELAY = 15
-
-class CUpdater:
-	def __init__(self, api_key, folderpath):
-		self.api_key = api_key
-		self.folderpath = folderpath
-		self.delay = 15
-
-	def get_downloader_object(self):
-		""" Generates an instance of CDownloader used to update the files.
-			Inputs: none
-			Outputs: an instance of CDownloader
-		"""
-		# Assumes that the first file will be of the same function and interval as all other data
-		file_name = os.listdir(self.folderpath)[0]
-		name_split = file_name.split(".{}".format(DATATYPE))[0].split("_")
-		# Gets the function (daily, intradaily, etc.) from the file name
-		filename_suffix = name_split[1] if len(name_split) == 2 else name_split[2]
-		function = filename_suffix
-		interval = ""
-		# The suffix has an ampersand character if and only if the file is intraday
-		if "&" in filename_suffix:
-			function_split = filename_suffix.split("&")
-			function = function_split[0]
-			interval = function_split[1]
-		# Save the function as a property of self
-		self.function = function
-		# Save the output size
-		# If the data is on a DAILY function, then compact is sufficient (100 days of data)
-		output_size = "full" if function == "INTRADAY" else "compact"
-		downloader = None
-		if "FOREX" in self.folderpath:
-			fx_format = "{}function=FX_{}&from_symbol={}&to_symbol={}&apikey={}&datatype={}&outputsize={}"
-			downloader = CDownloader(self.folderpath, self.api_key, function, interval, output_size, url_format=fx_format)
-		else:
-			downloader = CDownloader(self.folderpath, self.api_key, function, interval, output_size)
-		# Return the CDownloader instance
-		return downloader
-
-	def update_files(self, downloader):
-		""" Automatically updates all equity/forex files in a given folder. 
-			Inputs: downloader object initialized with function within file path
-			Outputs: True if everything works
-		"""
-		for curpath, directories, files in os.walk(self.folderpath):
-			for file in files:
-				# Checks if file is relevant to the code
-				if self.function not in file or DATATYPE not in file:
-					continue
-				# Reads the old data from its file location
-				logger.info("Reading file " + str(file) + " from local memory...")
-				inpath = os.path.join(curpath, file)
-				old_data = pd.read_csv(inpath, header=0, index_col='timestamp', encoding="ISO-8859-1")
-				old_data.dropna(how='any',inplace=True)
-				# Removes duplicates
-				old_data = old_data[~old_data.index.duplicated(keep='first')]
-				# Gets the most recent date in the old ticker data
-				last_date = old_data.index[-1]
-				# Parses the file name using the split function (assumes adherence to naming conventions from download.py)
-				file_name = inpath.split(self.folderpath)[1][1:]
-				name_split = file_name.split(".{}".format(DATATYPE))[0].split("_")
-				# Gets a string representing the symbol 
-				symbol = name_split[0] if len(name_split) == 2 else (name_split[0], name_split[1])
-				logger.info("Auto-updating " + str(symbol) + " from AlphaVantage...")
-				new_data = downloader.load_single(symbol, writefile=True)
-				# If unavailable, don't download
-				if new_data is None:
-					# Delay prevents HTTP 503 errors
-					logger.info(str(symbol) + " update failed and skipped.")
-					time.sleep(self.delay)
-					return None
-				# Isolates the data that is new (based on last date/time collected)
-				# Accounts for issues if data has not been updated in a long time
-				if last_date in list(new_data.index.values):
-					new_data = new_data[(new_data.index == last_date).cumsum() > 0]
-					new_data = new_data.drop(index=last_date)
-				# Concatenate along row
-				finished_output = pd.concat([old_data, new_data])
-				# Writes allTickerData to chosen folder path
-				finished_output.to_csv(inpath, index_label='timestamp')
-				logger.info("Data on " + str(symbol) + " successfully updated!")
-				# Delay prevents HTTP 503 errors
-				time.sleep(self.delay)
-		# Returns True if the program runs to completion
-		return True
-
-def main():
-	""" User interacts with interface through command prompt, which obtains several "input" data. 
-		Here is an example of how to run this program: 
-
-		python auto_update.py -folderPath C:/Users/Miguel/Desktop/stockData -apiKey <INSERT KEY>
-			This will update all stock data at the given folderpath.
-
-		Inputs: implicit through command prompt
-		Outputs: True if everything works
-	"""
-	prompts = sys.argv
-	cmdparser = CCmdParser(prompts)
-	## Handles where the user wants to download their files. 
-	# Default folder path is relevant to the author only. 
-	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
-	## Handles the user's API key. 
-	api_key = cmdparser.get_generic(query="-apiKey")
-	## Updates all files in folder
-	updater = CUpdater(api_key, folder_path)
-	downloader = updater.get_downloader_object()
-	updater.update_files(downloader)
-
-if __name__ == "__main__":
-	main()
+#!/usr/bin/python
+# -*- coding: utf8 -*-
+
+## This code can update all stock files in a given folder directory. 
+## Author: Miguel Opeña
+## Version: 5.3.3
+
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import http.client
+import logging
+import numpy as np
+import os
+import pandas as pd
+import sys
+import urllib.error
+
+from command_parser import CCmdParser
+from download import CDownloader
+import http_client
+import io_support
+import manifest
+from price_store import CPriceStore
+DATATYPE = "csv"
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim_update.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Delay prevents HTTP 503 errors (AlphaVantage recommends 10, but 15 works in practice)
+DELAY = 15
+# Number of rows AlphaVantage returns for outputsize=compact
+COMPACT_ROWS = 100
+# Rows of slack kept when choosing compact, in case of holidays or late bars
+COMPACT_MARGIN = 5
+# Approximate number of trading days in a full intraday download
+INTRADAY_FULL_DAYS = 5
+# Number of minutes in a regular trading session
+SESSION_MINUTES = 390
+
+class CUpdater:
+	def __init__(self, api_key, folderpath, main_url="https://www.alphavantage.co/query?", store=None):
+		self.api_key = api_key
+		self.folderpath = folderpath
+		self.delay = 15
+		# Start of the URL for AlphaVantage queries (can point at mock_server.py for offline testing)
+		self.main_url = main_url
+		# Optional price store (see price_store.py) updated instead of the CSV files
+		self.store = store
+
+	def get_downloader_object(self):
+		""" Generates an instance of CDownloader used to update the files.
+			Inputs: none
+			Outputs: an instance of CDownloader
+		"""
+		# Assumes that the first file will be of the same function and interval as all other data
+		file_name = self.store.stems()[0] if self.store is not None else sorted(manifest.get_manifest(self.folderpath).entries)[0]
+		name_split = file_name.split(".{}".format(DATATYPE))[0].split("_")
+		# Gets the function (daily, intradaily, etc.) from the file name
+		filename_suffix = name_split[1] if len(name_split) == 2 else name_split[2]
+		function = filename_suffix
+		interval = ""
+		# The suffix has an ampersand character if and only if the file is intraday
+		if "&" in filename_suffix:
+			function_split = filename_suffix.split("&")
+			function = function_split[0]
+			interval = function_split[1]
+		# Save the function and interval as properties of self
+		self.function = function
+		self.interval = interval
+		# Save the default output size (update_files chooses compact or full for each file)
+		output_size = "full" if function == "INTRADAY" else "compact"
+		downloader = None
+		if "FOREX" in (self.store.rootpath if self.store is not None else self.folderpath):
+			fx_format = "{}function=FX_{}&from_symbol={}&to_symbol={}&apikey={}&datatype={}&outputsize={}"
+			downloader = CDownloader(self.folderpath, self.api_key, function, interval, output_size, url_format=fx_format, main_url=self.main_url)
+		else:
+			downloader = CDownloader(self.folderpath, self.api_key, function, interval, output_size, main_url=self.main_url)
+		# Return the CDownloader instance
+		return downloader
+
+	def estimate_missing_rows(self, last_date, now):
+		""" Estimates how many bars were published after the last stored date/time. 
+			Inputs: last stored date/time (string), current date/time
+			Outputs: estimated number of missing rows
+		"""
+		last_time = pd.Timestamp(last_date)
+		last_day = np.datetime64(last_time.date())
+		today = np.datetime64(now.date())
+		# Business days strictly after the last stored day, up to and including today
+		days = int(np.busday_count(last_day + 1, today + 1))
+		if self.function == "WEEKLY":
+			return int(np.ceil(days / 5.0))
+		if self.function == "MONTHLY":
+			return int(np.ceil(days / 21.0))
+		if self.function != "INTRADAY":
+			return days
+		# Intraday: trading minutes left on the last stored day plus full sessions since
+		minutes = int(self.interval.replace("min", "")) if self.interval else 1
+		close_time = last_time.normalize() + pd.Timedelta(hours=16)
+		left = max(0, (close_time - last_time).total_seconds() / 60.0)
+		return int(np.ceil((left + days * SESSION_MINUTES) / minutes))
+
+	def plan_updates(self, now=None):
+		""" Plans the update of each file from its own last stored timestamp: skip if up to date, 
+			compact if the last 100 bars cover the gap, full otherwise. 
+			Inputs: current date/time (default: now)
+			Outputs: list of dictionaries, one per file, with path (None for the price store), stem, symbol, 
+				columns, last date, estimated missing rows, output size (None if up to date), 
+				estimated bytes per row and estimated bytes of stored history
+		"""
+		now = datetime.datetime.now() if now is None else now
+		plan = []
+		for inpath, stem in self.get_targets():
+			# Reads only the end of the file (or the store metadata), instead of loading its whole history
+			if self.store is not None:
+				meta = self.store.get_meta(stem)
+				last_date = meta['last']
+				columns = meta['columns']
+				row_bytes = 8 * (len(columns) + 1)
+				history_bytes = meta['rows'] * row_bytes
+			else:
+				last_date = io_support.get_last_timestamp(inpath)
+				if last_date is not None:
+					columns = io_support.get_header(inpath)[1:]
+					# Bytes per row, from the length of the last row, to estimate download sizes
+					row_bytes = len(next(io_support.tail_lines(inpath))) + 1
+					history_bytes = os.path.getsize(inpath)
+			if last_date is None:
+				logger.warning("No complete rows found in " + stem + ", skipped.")
+				continue
+			# Parses the file name using the split function (assumes adherence to naming conventions from download.py)
+			name_split = stem.split("_")
+			# Gets a string representing the symbol 
+			symbol = name_split[0] if len(name_split) == 2 else (name_split[0], name_split[1])
+			missing = self.estimate_missing_rows(last_date, now)
+			output_size = None
+			if missing > 0:
+				output_size = "compact" if missing <= COMPACT_ROWS - COMPACT_MARGIN else "full"
+			plan.append({'path': inpath, 'stem': stem, 'symbol': symbol, 'columns': columns, 'last_date': last_date, 
+				'missing': missing, 'output_size': output_size, 'row_bytes': row_bytes, 'history_bytes': history_bytes})
+			logger.debug("Plan for %s: last date %s, about %d rows missing, output size %s", str(symbol), last_date, missing, str(output_size))
+		return plan
+
+	def get_targets(self):
+		""" Lists the series to update: CSV files in the folder, or series in the price store.
+			Inputs: none
+			Outputs: list of (file path or None, file stem) tuples
+		"""
+		if self.store is not None:
+			return [(None, stem) for stem in self.store.stems() if stem.split("_")[-1].split("&")[0] == self.function]
+		# Looks the files up in the manifest, picking up any file added or changed by hand since it was last saved
+		current = manifest.get_manifest(self.folderpath)
+		current.sync()
+		return [(current.get_path(stem), stem) for stem in current.stems(self.function, self.interval)]
+
+	def plan_savings(self, plan):
+		""" Estimates the requests and bytes saved by a plan, relative to always downloading 
+			compact for daily data and full for intraday data. 
+			Inputs: plan from plan_updates
+			Outputs: requests saved, bytes saved (negative if extra data was fetched to close gaps)
+		"""
+		full_rows = INTRADAY_FULL_DAYS * SESSION_MINUTES // int((self.interval or "1min").replace("min", "")) if self.function == "INTRADAY" else None
+		fixed_rows = full_rows if self.function == "INTRADAY" else COMPACT_ROWS
+		requests_saved = 0
+		bytes_saved = 0
+		for item in plan:
+			if item['output_size'] is None:
+				requests_saved += 1
+				bytes_saved += fixed_rows * item['row_bytes']
+			elif item['output_size'] == "compact":
+				bytes_saved += (fixed_rows - COMPACT_ROWS) * item['row_bytes']
+			elif self.function != "INTRADAY":
+				# A full daily download is roughly the size of the stored history
+				bytes_saved -= item['history_bytes'] - COMPACT_ROWS * item['row_bytes']
+		return requests_saved, bytes_saved
+
+	def update_files(self, downloader, workers=1):
+		""" Automatically updates all equity/forex files in a given folder. 
+			Each file is fetched with the smallest output size that covers its gap, 
+			through a pool of threads sharing one rate limit. 
+			Inputs: downloader object initialized with function within file path, 
+				number of concurrent downloads (default: 1)
+			Outputs: True if everything works
+		"""
+		plan = self.plan_updates()
+		to_fetch = [item for item in plan if item['output_size'] is not None]
+		logger.info("%d files to update (%d compact, %d full), %d already up to date.", len(to_fetch), 
+			sum(1 for item in to_fetch if item['output_size'] == "compact"), 
+			sum(1 for item in to_fetch if item['output_size'] == "full"), len(plan) - len(to_fetch))
+		# Delay between calls prevents HTTP 503 errors, whatever the number of threads
+		limiter = http_client.CRateLimiter(self.delay)
+		def update_one(item):
+			symbol = item['symbol']
+			limiter.wait()
+			logger.info("Auto-updating " + str(symbol) + " from AlphaVantage...")
+			# The downloader does not write the file itself; only the new rows are appended below
+			try:
+				new_data = downloader.load_single(symbol, output_size=item['output_size'])
+			except (urllib.error.URLError, OSError, http.client.HTTPException) as e:
+				# One failed request (e.g. HTTP 503, timeout, dropped connection) skips its file instead of stopping the whole run
+				logger.error(str(symbol) + " could not be fetched: %s", e)
+				return 0
+			# If unavailable, don't download
+			if new_data is None:
+				logger.info(str(symbol) + " update failed and skipped.")
+				return 0
+			# Appends the rows collected after the last stored date/time
+			if self.store is not None:
+				num_rows = self.store.append(item['stem'], self.select_new_rows(new_data, item['last_date'], item['stem'])[0])
+			else:
+				num_rows = self.append_new_rows(item['path'], new_data, item['last_date'], item['columns'])
+			logger.info("Data on " + str(symbol) + " successfully updated with %d new rows!", num_rows)
+			return num_rows
+		try:
+			with ThreadPoolExecutor(max_workers=workers) as executor:
+				num_rows = sum(executor.map(update_one, to_fetch))
+		finally:
+			# Records the files already appended, even if the run stops early
+			if self.store is None:
+				manifest.get_manifest(self.folderpath).save()
+		# Reports what the plan saved relative to a fixed output size
+		requests_saved, bytes_saved = self.plan_savings(plan)
+		logger.info("Appended %d rows. Relative to a fixed output size: %d requests saved, about %d bytes saved.", num_rows, requests_saved, bytes_saved)
+		if bytes_saved < 0:
+			logger.info("(More bytes than before were fetched, to fill gaps that compact downloads would have left.)")
+		http_client.get_client().log_metrics()
+		# Returns True if the program runs to completion
+		return True
+
+	def select_new_rows(self, new_data, last_date, label):
+		""" Selects the downloaded rows that are more recent than the last stored date/time.
+			Inputs: newly downloaded data, last date/time stored, name of the series (for logging)
+			Outputs: dataframe of new rows (normalized: sorted, de-duplicated, without blank rows), validation status
+		"""
+		# Timestamps are ISO-formatted strings, so they compare in chronological order
+		new_rows, validation = io_support.normalize_bars(new_data[new_data.index > last_date])
+		# Warns if the download does not reach back to the stored data (the gap stays missing)
+		if not new_data.empty and new_data.index.min() > last_date:
+			logger.warning("Gap in %s: stored data ends %s but download starts %s. Consider a full download.", label, last_date, new_data.index.min())
+		return new_rows, validation
+
+	def append_new_rows(self, inpath, new_data, last_date, columns):
+		""" Appends to a file only the downloaded rows that are more recent than its last stored date/time.
+			Inputs: path of file to update, newly downloaded data, last date/time stored in the file, 
+				columns of the file (in order)
+			Outputs: number of rows appended
+		"""
+		new_rows, validation = self.select_new_rows(new_data, last_date, inpath)
+		if new_rows.empty:
+			logger.info("No rows more recent than %s found for %s.", last_date, inpath)
+			return 0
+		# Keeps the column order of the stored file
+		new_rows = new_rows[columns]
+		# Cuts a partial last row (e.g. from an interrupted write) so that the appended rows start on a fresh line
+		# The partial row was already skipped when reading the last stored date/time, so it is downloaded again
+		with open(inpath, 'rb+') as infile:
+			infile.seek(0, os.SEEK_END)
+			position = infile.tell()
+			while position > 0:
+				step = min(8192, position)
+				infile.seek(position - step)
+				block = infile.read(step)
+				if b'\n' in block:
+					position = position - step + block.rindex(b'\n') + 1
+					break
+				position -= step
+			# A file without any newline holds at most its header, which is kept
+			truncated = 0 < position < infile.seek(0, os.SEEK_END)
+			if truncated:
+				logger.warning("Removing partial last row of %s.", inpath)
+				infile.truncate(position)
+		io_support.write_as_append(new_rows, inpath, index=True, header=False, sep=',')
+		# Only the appended bytes are read to update the row count and checksum (saved once all files are done)
+		# A truncated file no longer starts its new bytes at the recorded size, so it is read again in full
+		if truncated:
+			manifest.get_manifest(self.folderpath).record(inpath, save=False)
+		else:
+			manifest.get_manifest(self.folderpath).record_append(inpath, save=False, validation=validation)
+		return len(new_rows)
+
+	def compact_files(self):
+		""" Occasional maintenance step: rewrites every file in the folder sorted, de-duplicated and without blank rows, 
+			and marks it clean in the manifest (so that loaders stop re-checking it).
+			Inputs: none
+			Outputs: True if everything works
+		"""
+		current = manifest.get_manifest(self.folderpath)
+		for inpath, stem in self.get_targets():
+			logger.info("Compacting file " + str(stem) + "...")
+			data = pd.read_csv(inpath, header=0, index_col='timestamp', encoding="ISO-8859-1")
+			data, validation = io_support.normalize_bars(data)
+			data.to_csv(inpath, index_label='timestamp')
+			current.record(inpath, save=False, validation=validation)
+		current.save()
+		return True
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data. 
+		Here is an example of how to run this program: 
+
+		python auto_update.py -folderPath C:/Users/Miguel/Desktop/stockData -apiKey <INSERT KEY>
+			This will update all stock data at the given folderpath.
+
+		python auto_update.py -folderPath C:/Users/Miguel/Desktop/stockData -apiKey <INSERT KEY> -compact
+			This will also rewrite each file sorted and de-duplicated once the update is done.
+
+		python auto_update.py -folderPath C:/Users/Miguel/Desktop/stockData -apiKey <INSERT KEY> -workers 4
+			This will run up to four downloads at once (still spaced out by the delay between calls).
+
+		python auto_update.py -storePath C:/Users/Miguel/Desktop/storeData -apiKey <INSERT KEY>
+			This will update the price store (see price_store.py) at the given path instead of CSV files.
+
+		Inputs: implicit through command prompt
+		Outputs: True if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	## Handles where the user wants to download their files. 
+	# Default folder path is relevant to the author only. 
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	## Handles the user's API key. 
+	api_key = cmdparser.get_generic(query="-apiKey")
+	## Handles the number of concurrent downloads
+	workers = int(cmdparser.get_generic(query="-workers", default="1", req=False))
+	## Handles the optional price store to update instead of CSV files
+	store_path = cmdparser.get_generic(query="-storePath", default=None, req=False)
+	store = CPriceStore(store_path) if store_path is not None else None
+	## Updates all files in folder
+	updater = CUpdater(api_key, folder_path, store=store)
+	downloader = updater.get_downloader_object()
+	updater.update_files(downloader, workers=workers)
+	## Handles the occasional compaction of the appended files
+	if "-compact" in prompts and store is None:
+		updater.compact_files()
+
+if __name__ == "__main__":
+	main()
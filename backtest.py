@@ -0,0 +1,179 @@
+## This code backtests many symbols and many strategy variants at once, from a price panel and a time x symbol x variant signal tensor.
+## Each (symbol, variant) is its own account, kept the way portfolio.apply_trades keeps one; variants are processed in chunks that fit in memory.
+## Author: Miguel Opeña
+## Version: 1.2.0
+
+import logging
+import numpy as np
+import os
+import pandas as pd
+from psutil import virtual_memory
+import sys
+import time
+
+from command_parser import CCmdParser
+import download
+import portfolio
+import strategy
+import trade_signals
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Approximate bytes used per (time, symbol, variant) cell while a chunk is processed, intermediate arrays included
+BYTES_PER_CELL = 128
+# Share of the available RAM a chunk may use by default
+MEMORY_RATIO = 0.25
+# Full dates x symbols x variants series batch_backtest can return, and the symbols x variants summaries it always returns
+OUTPUTS = ('equity', 'cash', 'positions', 'turnover')
+SUMMARIES = ['final_equity', 'total_return', 'sharpe', 'bankrupt']
+
+def get_chunk_size(num_dates, num_symbols, num_variants, max_bytes=None):
+	""" Returns the number of variants to process at once so that a chunk fits in the memory budget.
+		Inputs: number of dates, symbols and variants, memory budget in bytes (default: a quarter of the available RAM)
+		Outputs: number of variants per chunk (at least 1)
+	"""
+	max_bytes = MEMORY_RATIO * virtual_memory().available if max_bytes is None else max_bytes
+	return int(min(num_variants, max(1, max_bytes // (BYTES_PER_CELL * max(1, num_dates * num_symbols)))))
+
+def batch_backtest(prices, signals, initialval=100000, seed=0.1, numtrades=1, transaction=7, max_bytes=None,
+		outputs=OUTPUTS, periods_per_year=252):
+	""" Backtests every (symbol, variant) pair in one vectorized pass per chunk of variants.
+		Each pair starts with initialval and seeds floor(seed * initialval / first price) positions, as in portfolio.apply_trades.
+		Signals on bars without a price are ignored, and positions are valued at the last known price.
+		Inputs: dates x symbols prices (dataframe from CLoader.load_panel, or array),
+			dates x symbols x variants int8 signals (see trade_signals.py), initial value of each account,
+			proportion of initial value to seed with, number of trades for each transaction, transaction cost,
+			memory budget in bytes for a chunk (default: a quarter of the available RAM),
+			full series to return (default: all of OUTPUTS; pass an empty tuple to keep only the summaries), periods per year
+		Outputs: dictionary of dates x symbols x variants arrays for each of outputs (equity, cash, positions,
+				and turnover as the value traded on each bar),
+			and of symbols x variants summaries: final equity, total return, annualized Sharpe ratio of the bar returns,
+				insufficient (first price above initialval, which apply_trades rejects), and bankrupt (insufficient,
+				or cash ran out before any bar: either way apply_trades would return None)
+	"""
+	time0 = time.time()
+	prices = np.asarray(prices, dtype=float)
+	signals = np.asarray(signals)
+	if signals.ndim == 2:
+		signals = signals[:, :, np.newaxis]
+	num_dates, num_symbols, num_variants = signals.shape
+	if prices.shape != (num_dates, num_symbols):
+		raise ValueError("Prices of shape {} do not match signals of shape {}".format(prices.shape, signals.shape))
+	# Marks positions at the last known price, and seeds nothing in a symbol with no price on the first bar
+	priced = ~np.isnan(prices)
+	trade_prices = np.nan_to_num(prices)[:, :, np.newaxis]
+	marks = np.nan_to_num(pd.DataFrame(prices).ffill().to_numpy())[:, :, np.newaxis]
+	first = trade_prices[0, :, 0]
+	# Checks if the start value can cover one share of each symbol, as apply_trades does
+	insufficient = first > initialval
+	if insufficient.any():
+		logger.error("Error: insufficient funds to start trading %d symbols.", insufficient.sum())
+	start_positions = np.where(first > 0, np.floor(seed * initialval / np.where(first > 0, first, 1)), 0).astype(np.int64)
+	start_cash = initialval - first * start_positions
+	results = {output: np.empty(signals.shape, dtype=np.int64 if output == 'positions' else float) for output in outputs}
+	for summary in SUMMARIES:
+		results[summary] = np.empty((num_symbols, num_variants), dtype=bool if summary == 'bankrupt' else float)
+	results['insufficient'] = np.broadcast_to(insufficient[:, np.newaxis], (num_symbols, num_variants)).copy()
+	chunk = get_chunk_size(num_dates, num_symbols, num_variants, max_bytes=max_bytes)
+	for lo in range(0, num_variants, chunk):
+		hi = min(num_variants, lo + chunk)
+		codes = np.where(priced[:, :, np.newaxis], signals[:, :, lo:hi], trade_signals.HOLD).astype(trade_signals.SIGNAL_DTYPE)
+		cash, positions = portfolio.trade_ledger(trade_prices, codes, start_cash[:, np.newaxis],
+			start_positions[:, np.newaxis], numtrades=numtrades, transaction=transaction)
+		equity = cash + positions * marks
+		if 'cash' in outputs:
+			results['cash'][:, :, lo:hi] = cash
+		if 'positions' in outputs:
+			results['positions'][:, :, lo:hi] = positions
+		if 'equity' in outputs:
+			results['equity'][:, :, lo:hi] = equity
+		if 'turnover' in outputs:
+			traded = np.abs(np.diff(positions, axis=0, prepend=np.broadcast_to(start_positions[:, np.newaxis], positions.shape[1:])[np.newaxis]))
+			results['turnover'][:, :, lo:hi] = traded * trade_prices
+		with np.errstate(divide='ignore', invalid='ignore'):
+			returns = np.diff(equity, axis=0) / equity[:-1]
+			results['sharpe'][:, lo:hi] = returns.mean(axis=0) / returns.std(axis=0) * np.sqrt(periods_per_year)
+			results['total_return'][:, lo:hi] = equity[-1] / equity[0] - 1
+		results['final_equity'][:, lo:hi] = equity[-1]
+		results['bankrupt'][:, lo:hi] = (cash[:-1] <= 0).any(axis=0) | insufficient[:, np.newaxis]
+	logger.info("Backtested %d symbols x %d variants over %d dates in %.2f seconds (%d variants per chunk)",
+		num_symbols, num_variants, num_dates, time.time() - time0, chunk)
+	return results
+
+def weights_backtest(prices, weights, initialval=100000, cost=0.0):
+	""" Backtests target weights (e.g. from portfolio.rank_weights), rebalanced to on every date.
+		The weights of a row are held over the bar ending on that row; between rows, holdings drift with prices, 
+		so turnover counts both changes of target and the trades that bring drifted holdings back to target.
+		Inputs: dates x symbols prices (dataframe or array), dates x symbols weights (or dates x symbols x variants, for many at once),
+			initial value, transaction cost as a fraction of the value traded (default: none)
+		Outputs: dictionary of arrays over dates (and variants): equity, returns (net of cost), and turnover (value traded over equity)
+	"""
+	prices = np.asarray(prices, dtype=float)
+	weights = np.asarray(weights, dtype=float)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		asset_returns = np.nan_to_num(prices[1:] / prices[:-1] - 1, nan=0.0, posinf=0.0, neginf=0.0)
+	if weights.ndim == 3:
+		asset_returns = asset_returns[:, :, np.newaxis]
+	held = np.nan_to_num(weights)
+	gross = (held[1:] * asset_returns).sum(axis=1)
+	# Holdings at the end of each bar, as weights of the portfolio value after that bar's return
+	# (costs are left out of this value, which keeps the pass vectorized at a second-order error in turnover)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		drifted = np.nan_to_num(held[1:] * (1 + asset_returns) / (1 + gross)[:, np.newaxis])
+	drifted = np.concatenate([np.zeros_like(held[:1]), held[:1], drifted[:-1]], axis=0)
+	turnover = np.abs(held - drifted).sum(axis=1)
+	returns = np.concatenate([np.zeros_like(turnover[:1]), gross], axis=0) - cost * turnover
+	return {'equity': initialval * np.cumprod(1 + returns, axis=0), 'returns': returns, 'turnover': turnover}
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here is an example of how to run this program:
+
+		python backtest.py -tickerUniverse DOW30 -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -trends 10,20,30 -baselines 60,90,120
+			This will backtest a crossover strategy for every pair of trend and baseline moving averages on every Dow 30 stock,
+			and log the mean ending equity of each pair.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	tickerverse, _ = cmdparser.get_tickerverse()
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	start_date = cmdparser.get_generic(query="-startDate", default="", req=False)
+	end_date = cmdparser.get_generic(query="-endDate", default="", req=False)
+	trends = [int(window) for window in cmdparser.get_generic(query="-trends", default="10,20,30", req=False).split(",")]
+	baselines = [int(window) for window in cmdparser.get_generic(query="-baselines", default="60,90,120", req=False).split(",")]
+	loader = download.CLoader(folder_path)
+	prices = loader.load_panel(tickerverse, start=start_date or None, end=end_date or None)
+	averages = {window: prices.rolling(window).mean().to_numpy() for window in set(trends + baselines)}
+	variants = [(trend, base) for trend in trends for base in baselines if trend < base]
+	signals = np.stack([strategy.crossover_signals(averages[trend], averages[base]) for trend, base in variants], axis=2)
+	# Only the summaries are kept, so memory does not grow with the number of dates
+	results = batch_backtest(prices, signals, outputs=())
+	for (trend, base), mean_equity, broke in zip(variants, results['final_equity'].mean(axis=0), results['bankrupt'].sum(axis=0)):
+		logger.info("Trend SMA%d, baseline SMA%d: mean ending equity %.2f (%d accounts out of funds)", trend, base, mean_equity, broke)
+	return 0
+
+if __name__ == "__main__":
+	main()
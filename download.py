@@ -1,310 +1,547 @@
-## This code contains the re-consolidated download functions, and can perform any one of the following tasks:
-## Download one stock (one-stock-one-file) from API, load one stock (one-stock-one-variable) from local drive, download many stocks (one-stock-one-file) from API, or load many stocks (many-stocks-one-variable) from local drive
-## Author: Miguel Opeña
-## Version: 2.3.0
-
-import datetime
-import logging
-import numpy as np
-import os
-import pandas as pd
-import time
-import sys
-from urllib.request import urlopen
-
-from command_parser import CCmdParser
-import io_support
-
-LOGDIR = "/Users/openamiguel/Desktop/LOG"
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-# Set file path for logger
-handler = logging.FileHandler('{}/equitysim_download.log'.format(LOGDIR))
-handler.setLevel(logging.DEBUG)
-# Format the logger
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-# Add the new format
-logger.addHandler(handler)
-# Format the console logger
-consoleHandler = logging.StreamHandler()
-consoleHandler.setLevel(logging.INFO)
-consoleHandler.setFormatter(formatter)
-# Add the new format to the logger file
-logger.addHandler(consoleHandler)
-
-logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
-
-# Sample format for stocks: "{}function=TIME_SERIES_{}&symbol={}&apikey={}&datatype={}&outputsize={}"
-# Sample format for forex: "{}function=FX_{}&from_symbol={}&to_symbol={}&apikey={}&datatype={}&outputsize={}"
-
-class CDownloader:
-	""" A class to download one, or many, symbols from AlphaVantage """
-	def __init__(self, folderpath, api_key, function="DAILY", interval="", 
-		    output_size="full", datatype="csv", 
-		    url_format="{}function=TIME_SERIES_{}&symbol={}&apikey={}&datatype={}&outputsize={}"):
-		self.folderpath = folderpath
-		self.api_key = api_key
-		self.function = function
-		self.interval = interval
-		# Checks if user has failed to account for the interval
-		if function == "INTRADAY" and interval == "":
-			logger.warning("Class CDownloader constructor must take interval as a parameter if INTRADAY chosen as function")
-			logger.warning("Default value of interval set to 1 minute")
-			self.interval = "1min"
-		self.output_size = output_size
-		self.datatype = datatype
-		self.url_format = url_format
-		# Number of seconds to delay between each downloader query
-		self.delay = 15
-		# Start of the URL for AlphaVantage queries
-		self.main_url = "https://www.alphavantage.co/query?"
-
-	def load_single(self, symbol, writefile=False):
-		""" Downloads data on a single symbol from AlphaVantage according to user parameters, as a dataframe and (if prompted) as a file. 
-			See the AlphaVantage documentation for more details. 
-			Inputs: symbol (can be a tuple or list of two symbols), order to
-				write file (default: No)
-			Outputs: dataframe with all available data on symbol
-		"""
-		# Checks if the read path involves a stock or forex
-		read_path = ""
-		# Symbol string will come up in the file name
-		symbol_str = ""
-		# Forex case
-		if type(symbol) is tuple or type(symbol) is list and len(symbol) >= 2:
-			logger.info("Downloading the provided symbols: {} and {}".format(symbol[0], symbol[1]))
-			read_path = self.url_format.format(self.main_url, self.function, symbol[0], symbol[1], self.api_key, self.datatype, self.output_size)
-			symbol_str = symbol[0] + "_" + symbol[1]
-		# Equity case
-		elif type(symbol) is str or len(symbol) == 1:
-			symbol_str = symbol[0] if type(symbol) is not str else symbol
-			logger.info("Downloading the symbol {} from AlphaVantage".format(symbol_str))
-			read_path = self.url_format.format(self.main_url, self.function, symbol_str, self.api_key, self.datatype, self.output_size)
-		# Outputs the read path file
-		logger.debug("Attempting to scrape URL: %s", read_path)
-		# Checks if the function is intraday (regardless of the type of data)
-		if self.function == "INTRADAY":
-			read_path = read_path + "&interval=" + self.interval
-		tick_data = None
-		# Accounts for the fact that AlphaVantage lacks certain high-volume ETFs and mutual funds
-		try:
-			tick_data = pd.read_csv(read_path, index_col='timestamp')
-		except ValueError:
-			logger.error(symbol_str + " not found by AlphaVantage. Download unsuccessful.")
-			return tick_data
-		logger.info(symbol_str + " successfully downloaded!")
-		# Flips the data around (AlphaVantage presents it in reverse chronological order, but I prefer regular chronological)
-		tick_data = tick_data.reindex(index=tick_data.index[::-1])
-		# Saves ticker data to file, if requested
-		if writefile:
-			logger.info("Saving data on " + symbol_str + "...")
-			write_path = self.folderpath + "/" + symbol_str + "_" + self.function
-			if self.interval != "": 
-				write_path = write_path + "&" + self.interval
-			tick_data.to_csv(write_path + "." + self.datatype)
-			logger.info("Data on " + symbol_str + " successfully saved!")
-		# Returns the data on symbol
-		return tick_data
-
-	def load_separate(self, tickerverse):
-		""" Downloads OHCLV (open-high-close-low-volume) data on given tickers.
-			Inputs: ticker universe
-			Outputs: True if everything works
-		"""
-		current_symbols = io_support.get_current_symbols(self.folderpath)
-		for symbol in tickerverse:
-			if symbol in current_symbols: continue
-			# Read each symbol and write to file (hence writeFile=True)
-			self.load_single(symbol, writefile=True)
-			# Delay prevents HTTP 503 errors
-			time.sleep(self.delay)
-		return True
-
-class CLoader:
-	""" A class to load one, or several, symbols from local hard drive """
-	def __init__(self, folderpath, function="DAILY", interval="", 
-		    output_size="full", datatype="csv"):
-		self.folderpath = folderpath
-		self.function = function
-		self.interval = interval
-		# Checks if user has failed to account for the interval
-		if function == "INTRADAY" and interval == "":
-			logger.warning("Class CLoader constructor must take interval as a parameter if INTRADAY chosen as function")
-			logger.warning("Default value of interval set to 1 minute")
-			self.interval = "1min"
-		self.output_size = output_size
-		self.datatype = datatype
-
-	def load_single_drive(self, symbol):
-		""" Downloads data on a single file (equity or forex) from local drive. 
-			Inputs: symbol String or tuple object
-			Outputs: dataframe with all available data on symbol
-		"""
-		# Checks if the symbol input is forex or equity
-		readpath = ""
-		symbol_str = ""
-		# Forex case
-		if type(symbol) is tuple or type(symbol) is list and len(symbol) >= 2:
-			symbol_str = symbol[0] + "_" + symbol[1]
-		# Equity case
-		elif type(symbol) is str or len(symbol) == 1:
-			symbol_str = symbol[0] if type(symbol) is not str else symbol
-		readpath = self.folderpath + "/" + symbol_str + "_" + self.function
-		if self.interval != "":
-			readpath = readpath + "&" + self.interval
-		readpath = readpath + "." + self.datatype
-		logger.info("Retrieving " + symbol_str + " from local drive...")
-		tick_data = None
-		try:
-			tick_data = pd.read_csv(readpath, index_col='timestamp')
-		except FileNotFoundError:
-			logger.error("Retrieval unsuccessful. File not found at " + readpath)
-			return tick_data
-		# De-duplicates the index
-		tick_data = tick_data[~tick_data.index.duplicated(keep='first')]
-		logger.info("Data on " + symbol_str + " successfully retrieved!")
-		return tick_data
-
-	def load_combined_drive(self, tickerverse, column_choice="close"):
-		""" Downloads OHCLV (open-high-close-low-volume) data on given tickers in compact or full form.
-			Inputs: ticker universe, choice of column to write (default: close)
-			Outputs: combined output as dataframe
-		"""
-		combined_output = pd.DataFrame()
-		for symbol in tickerverse:
-			# Read each symbol and concatenate with previous symbols
-			tick_data = self.load_single_drive(symbol)
-			combined_output = pd.concat([combined_output, tick_data[column_choice]], axis=1)
-		# Makes each column the symbol of asset (to avoid confusion)
-		combined_output.columns = tickerverse
-		return combined_output
-
-class CMacroDownloader:
-	""" A class to download macro data from handpicked sources. """
-	def __init__(self):
-		# Initialize variables
-		now = datetime.datetime.now()
-		self.current_year = now.year
-		return
-
-	def yield_curve_year(self, year, maturity='10Y'):
-		""" Scrapes the US Treasury's website for yield curve data stored in XML files. 
-			Note: the provided URL gets data from all years
-			Input: year to get data from, maturity of desired bond (default: 10-year T-Note)
-			Output: pandas Series of desired bond's yield curve since January 2, 1990
-		"""
-		# Builds a simple code to parse an XML line
-		def parse_line(line):
-			logger.debug("Currently reading line: %s", line)
-			# Checks if the line entry is null
-			# Interestingly, this happened in 2010 data, but not 1991-2009
-			if "null=\"true\"" in line:
-				return np.NaN
-			start_index = line.index('>') + 1
-			line = line[start_index:]
-			end_index = line.index('<')
-			line = line[:end_index]
-			return line
-		# Checks if the input year is valid
-		if int(year) < 1991 and int(year) > self.current_year:
-			logger.error("Invalid input year given to CMacroDownloader.yield_curve(...)")
-			logger.error("Please give CMacroDownloader.yield_curve(...) an input year between 1991 and %d", self.current_year)
-			return None
-		logger.info("Processing US Treasury yield curve data, year %d", year)
-		# Opens the current link to Treasury yield curve data
-		yield_curve_url = "http://data.treasury.gov/feed.svc/DailyTreasuryYieldCurveRateData?$filter=year(NEW_DATE)%20eq%20{}".format(year)
-		logger.debug("Opening US Treasury webpage...")
-		webpage = urlopen(yield_curve_url)
-		logger.debug("Webpage successfully opened!")
-		html_str = webpage.read()
-		webpage.close()
-		# Builds a String version of the maturity
-		maturity_code = maturity.replace('M', 'MONTH').replace('Y', 'YEAR')
-		# Builds dataframe of timestamped yield curve data
-		yield_curve_df = pd.DataFrame()
-		# Builds new row for each data entry
-		new_row = {'timestamp':'', maturity_code:''}
-		for line in str(html_str).split('\\n'):
-			# Reads the date where provided
-			if "NEW_DATE" in line:
-				date = parse_line(line).split('T')[0]
-				new_row['timestamp'] = date
-			# Reads the value where provided
-			# Also writes to the folder
-			elif maturity_code in line and "DISPLAY" not in line:
-				value = parse_line(line)
-				new_row[maturity_code] = value
-				logger.debug("Adding new row to the dataframe: %s", str(new_row))
-				yield_curve_df = yield_curve_df.append(new_row, ignore_index=True, sort=False)
-				new_row = {'timestamp':'', maturity_code:''}
-		# Returns the dataframe
-		yield_curve_df = yield_curve_df.set_index('timestamp')
-		yield_curve_df = yield_curve_df.sort_index()
-		return yield_curve_df
-
-	def yield_curve_multi(self, start_year=1991, end_year=2018, maturity='10Y'):
-		""" Employs the yield_curve_year to get multiple years of yield curve data, 
-			as a consolidated dataframe.
-			Inputs: start year (default: 1991), end year (default: 2018); 
-				maturity of desired bond (default: 10-year T-Note)
-			Outputs: dataframe with all the desired data
-		"""
-		multi_year_df = pd.DataFrame()
-		for year in range(start_year, end_year + 1):
-			year_df = self.yield_curve_year(year, maturity=maturity)
-			multi_year_df = pd.concat([multi_year_df, year_df], sort=False)
-		return multi_year_df
-
-	def get_world_bank(self):
-		# Gets data from the World Bank
-		# Download file from the World Bank link
-		# Parse it and clean if needed
-		# Save to folderpath
-		return
-
-def main():
-	""" User interacts with interface through command prompt, which obtains several "input" data. 
-		Here are some examples of how to run this program: 
-
-		python download.py -tickerUniverse SNP500 -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -apiKey <INSERT KEY> -function DAILY
-			This will download files of daily data on S&P 500 tickers to the desired folder path.
-
-		python download.py -tickerUniverse AAPL -folderPath C:/Users/Miguel/Documents/EQUITIES/stockIntraday1Min -apiKey <INSERT KEY> -function INTRADAY -interval 1min
-			This will download files of daily data on S&P 500 tickers to the desired folder path.
-
-		Inputs: implicit through command prompt
-		Outputs: 0 if everything works
-	"""
-	prompts = sys.argv
-	## Handles which symbol the user wants to download.
-	cmdparser = CCmdParser(prompts)
-	tickerverse, name = cmdparser.get_tickerverse()
-	## Handles where the user wants to download their files. 
-	# Default folder path is relevant to the author only. 
-	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
-	## Handles the user's API key. 
-	api_key = cmdparser.get_generic(query="-apiKey")
-	## Handles the desired time series function. 
-	function = cmdparser.get_generic(query="-function")
-	## Handles the special case: if INTRADAY selected. 
-	interval = cmdparser.get_generic(query="-interval") if function == "INTRADAY" else ""
-	## Handles user choice of forex or equity (not forex)
-	if name == "FOREX":
-		fx_format = "{}function=FX_{}&from_symbol={}&to_symbol={}&apikey={}&datatype={}&outputsize={}"
-		downloader = CDownloader(folder_path, api_key, function, interval, url_format=fx_format)
-		downloader.load_separate(tickerverse)
-	else:
-		downloader = CDownloader(folder_path, api_key, function, interval)
-		downloader.load_separate(tickerverse)
-	## Closing output
-	logger.info("Download complete. Have a nice day!")
-
-if __name__ == "__main__":
-	"""
-	md = CMacroDownloader()
-	df = md.yield_curve_multi()
-	df.to_csv("/Users/openamiguel/Desktop/UST_10year.txt", sep='\t')
-	"""
-	main()
+## This code contains the re-consolidated download functions, and can perform any one of the following tasks:
+## Download one stock (one-stock-one-file) from API, load one stock (one-stock-one-variable) from local drive, download many stocks (one-stock-one-file) from API, or load many stocks (many-stocks-one-variable) from local drive
+## Author: Miguel Opeña
+## Version: 3.8.2
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import logging
+import numpy as np
+import os
+import pandas as pd
+import threading
+import time
+import sys
+from xml.etree import ElementTree
+
+from command_parser import CCmdParser
+import forex_cross
+import http_client
+import io_support
+import manifest
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim_download.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Memory budget of the frame cache shared by CLoader instances, in bytes
+FRAME_CACHE_BYTES = 512 * 1024 * 1024
+
+# US Treasury daily yield curve feed, by year (the former data.treasury.gov feed was retired)
+YIELD_CURVE_URL = "https://home.treasury.gov/resource-center/data-chart-center/interest-rates/pages/xml?data=daily_treasury_yield_curve&field_tdr_date_value={}"
+# XML namespaces of the feed's fields and of their attributes
+ODATA_NS = "{http://schemas.microsoft.com/ado/2007/08/dataservices}"
+ODATA_META_NS = "{http://schemas.microsoft.com/ado/2007/08/dataservices/metadata}"
+# Folder where closed years of the yield curve are cached
+TREASURY_CACHE = os.path.join(os.path.expanduser("~"), ".equitysim", "treasury")
+
+# Sample format for stocks: "{}function=TIME_SERIES_{}&symbol={}&apikey={}&datatype={}&outputsize={}"
+# Sample format for forex: "{}function=FX_{}&from_symbol={}&to_symbol={}&apikey={}&datatype={}&outputsize={}"
+
+class CDownloader:
+	""" A class to download one, or many, symbols from AlphaVantage """
+	def __init__(self, folderpath, api_key, function="DAILY", interval="", 
+		    output_size="full", datatype="csv", 
+		    url_format="{}function=TIME_SERIES_{}&symbol={}&apikey={}&datatype={}&outputsize={}", 
+		    main_url="https://www.alphavantage.co/query?"):
+		self.folderpath = folderpath
+		self.api_key = api_key
+		self.function = function
+		self.interval = interval
+		# Checks if user has failed to account for the interval
+		if function == "INTRADAY" and interval == "":
+			logger.warning("Class CDownloader constructor must take interval as a parameter if INTRADAY chosen as function")
+			logger.warning("Default value of interval set to 1 minute")
+			self.interval = "1min"
+		self.output_size = output_size
+		self.datatype = datatype
+		self.url_format = url_format
+		# Number of seconds to delay between each downloader query
+		self.delay = 15
+		# Start of the URL for AlphaVantage queries (can point at mock_server.py for offline testing)
+		self.main_url = main_url
+
+	def load_single(self, symbol, writefile=False, output_size=None):
+		""" Downloads data on a single symbol from AlphaVantage according to user parameters, as a dataframe and (if prompted) as a file. 
+			See the AlphaVantage documentation for more details. 
+			Inputs: symbol (can be a tuple or list of two symbols), order to
+				write file (default: No), output size for this call only (default: the downloader's)
+			Outputs: dataframe with all available data on symbol
+		"""
+		output_size = self.output_size if output_size is None else output_size
+		# Checks if the read path involves a stock or forex
+		read_path = ""
+		# Symbol string will come up in the file name
+		symbol_str = ""
+		# Forex case
+		if type(symbol) is tuple or type(symbol) is list and len(symbol) >= 2:
+			logger.info("Downloading the provided symbols: {} and {}".format(symbol[0], symbol[1]))
+			read_path = self.url_format.format(self.main_url, self.function, symbol[0], symbol[1], self.api_key, self.datatype, output_size)
+			symbol_str = symbol[0] + "_" + symbol[1]
+		# Equity case
+		elif type(symbol) is str or len(symbol) == 1:
+			symbol_str = symbol[0] if type(symbol) is not str else symbol
+			logger.info("Downloading the symbol {} from AlphaVantage".format(symbol_str))
+			read_path = self.url_format.format(self.main_url, self.function, symbol_str, self.api_key, self.datatype, output_size)
+		# Outputs the read path file
+		logger.debug("Attempting to scrape URL: %s", read_path)
+		# Checks if the function is intraday (regardless of the type of data)
+		if self.function == "INTRADAY":
+			read_path = read_path + "&interval=" + self.interval
+		tick_data = None
+		# Accounts for the fact that AlphaVantage lacks certain high-volume ETFs and mutual funds
+		try:
+			# Streams the response body straight into the CSV parser over a pooled connection
+			with http_client.get_client().open(read_path) as stream:
+				tick_data = pd.read_csv(stream, index_col='timestamp')
+		except ValueError:
+			logger.error(symbol_str + " not found by AlphaVantage. Download unsuccessful.")
+			return tick_data
+		logger.info(symbol_str + " successfully downloaded!")
+		# Flips the data around (AlphaVantage presents it in reverse chronological order, but I prefer regular chronological)
+		tick_data = tick_data.reindex(index=tick_data.index[::-1])
+		# Saves ticker data to file, if requested
+		if writefile:
+			logger.info("Saving data on " + symbol_str + "...")
+			write_path = self.folderpath + "/" + symbol_str + "_" + self.function
+			if self.interval != "": 
+				write_path = write_path + "&" + self.interval
+			# Sorts, de-duplicates and validates once here, so that loaders can skip it
+			tick_data, validation = io_support.normalize_bars(tick_data)
+			tick_data.to_csv(write_path + "." + self.datatype)
+			manifest.get_manifest(self.folderpath).record(write_path + "." + self.datatype, validation=validation)
+			logger.info("Data on " + symbol_str + " successfully saved!")
+		# Returns the data on symbol
+		return tick_data
+
+	def load_separate(self, tickerverse):
+		""" Downloads OHCLV (open-high-close-low-volume) data on given tickers.
+			Inputs: ticker universe
+			Outputs: True if everything works
+		"""
+		current = manifest.get_manifest(self.folderpath)
+		for symbol in tickerverse:
+			if current.has(symbol, self.function, self.interval): continue
+			# Read each symbol and write to file (hence writeFile=True)
+			self.load_single(symbol, writefile=True)
+			# Delay prevents HTTP 503 errors
+			time.sleep(self.delay)
+		return True
+
+class CFrameCache:
+	""" A class to keep recently loaded dataframes in memory, evicting the least recently used beyond a byte budget.
+		Cached frames are backed by read-only arrays, and callers are handed shallow copies of them.
+	"""
+	def __init__(self, max_bytes=FRAME_CACHE_BYTES):
+		self.max_bytes = max_bytes
+		self.frames = OrderedDict()
+		self.nbytes = 0
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self.lock = threading.Lock()
+
+	def get(self, key):
+		""" Returns a view of the cached frame for a key, or None if absent. """
+		with self.lock:
+			entry = self.frames.get(key)
+			if entry is None:
+				self.misses += 1
+				return None
+			self.frames.move_to_end(key)
+			self.hits += 1
+		return entry[0].copy(deep=False)
+
+	def put(self, key, frame):
+		""" Caches a frame (frozen so that it cannot be modified in place) and returns a view of it. """
+		arrays = {}
+		for column in frame.columns:
+			values = frame[column].to_numpy().copy()
+			values.flags.writeable = False
+			arrays[column] = values
+		frozen = pd.DataFrame(arrays, index=frame.index, columns=frame.columns, copy=False)
+		size = int(frozen.memory_usage(index=True, deep=True).sum())
+		if size > self.max_bytes:
+			return frozen.copy(deep=False)
+		with self.lock:
+			if key in self.frames:
+				self.nbytes -= self.frames.pop(key)[1]
+			self.frames[key] = (frozen, size)
+			self.nbytes += size
+			while self.nbytes > self.max_bytes:
+				_, (_, evicted) = self.frames.popitem(last=False)
+				self.nbytes -= evicted
+				self.evictions += 1
+		return frozen.copy(deep=False)
+
+	def clear(self):
+		with self.lock:
+			self.frames.clear()
+			self.nbytes = 0
+
+	def get_stats(self):
+		""" Returns the hit, miss and eviction counts, and the number of frames and bytes held. """
+		with self.lock:
+			return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'frames': len(self.frames), 'bytes': self.nbytes}
+
+	def log_stats(self):
+		stats = self.get_stats()
+		logger.info("Frame cache: %d hits, %d misses, %d evictions; %d frames in %d bytes", 
+			stats['hits'], stats['misses'], stats['evictions'], stats['frames'], stats['bytes'])
+
+# Cache shared by all the loaders in one process
+frame_cache = CFrameCache()
+
+class CLoader:
+	""" A class to load one, or several, symbols from local hard drive """
+	def __init__(self, folderpath, function="DAILY", interval="", 
+		    output_size="full", datatype="csv", store=None, use_cache=True, datetime_index=True, derive_crosses=False):
+		self.folderpath = folderpath
+		self.function = function
+		self.interval = interval
+		# Checks if user has failed to account for the interval
+		if function == "INTRADAY" and interval == "":
+			logger.warning("Class CLoader constructor must take interval as a parameter if INTRADAY chosen as function")
+			logger.warning("Default value of interval set to 1 minute")
+			self.interval = "1min"
+		self.output_size = output_size
+		self.datatype = datatype
+		# Optional price store (see price_store.py) or shared panel (see shared_panel.py) read instead of the CSV files
+		self.store = store
+		# Loaded frames are kept in the process-wide cache unless told otherwise
+		self.cache = frame_cache if use_cache else None
+		# Parses timestamps into a datetime64 index (as the price store does), so that date slicing is a binary search
+		self.datetime_index = datetime_index
+		# Forex pairs with no file of their own are derived from the stored USD legs (see forex_cross.py)
+		self.crosses = forex_cross.CCrossRates(self) if derive_crosses else None
+
+	def read_drive(self, readpath, start=None, end=None, usecols=None):
+		""" Reads a file from local drive, or only the rows between two dates/times if given. 
+			Files marked clean in the folder's manifest (normalized when written, unchanged since) are read as they are; 
+			other files are de-duplicated and sorted on every load. 
+			Inputs: file path, start and end date/time (inclusive, default: unbounded), columns to parse (default: all)
+			Outputs: dataframe indexed by timestamp, sorted and de-duplicated
+		"""
+		current = manifest.get_manifest(self.folderpath, create=False)
+		if current is not None and current.is_clean(readpath):
+			if start is None and end is None:
+				return self.set_index_type(pd.read_csv(readpath, index_col='timestamp', usecols=usecols))
+			# Locates the range by binary search on the file's byte offsets, so rows outside it are never parsed
+			return self.set_index_type(io_support.read_csv_range(readpath, start=start, end=end, usecols=usecols))
+		tick_data = pd.read_csv(readpath, index_col='timestamp', usecols=usecols)
+		# De-duplicates and sorts the index
+		tick_data = tick_data[~tick_data.index.duplicated(keep='first')]
+		if not tick_data.index.is_monotonic_increasing:
+			tick_data = tick_data.sort_index()
+		if start is not None or end is not None:
+			# Same bounds as the binary search on clean files
+			timestamps = tick_data.index.astype(str)
+			in_range = np.ones(len(tick_data), dtype=bool)
+			if start is not None:
+				in_range &= timestamps >= io_support.get_range_key(start)
+			if end is not None:
+				in_range &= timestamps <= io_support.get_range_key(end, end=True)
+			tick_data = tick_data[in_range]
+		return self.set_index_type(tick_data)
+
+	def set_index_type(self, tick_data):
+		""" Parses the timestamp index into datetime64, if the loader was asked to. """
+		if self.datetime_index:
+			tick_data.index = pd.DatetimeIndex(pd.to_datetime(tick_data.index), name='timestamp')
+		return tick_data
+
+	def load_cross(self, symbol, start=None, end=None):
+		""" Derives a forex pair that is not stored from the legs it shares with the base currency.
+			Inputs: symbol tuple object, start and end date/time (inclusive, default: unbounded)
+			Outputs: dataframe of open, high, low and close, or None if the pair is stored (or cannot be derived)
+		"""
+		if self.crosses is None or not isinstance(symbol, tuple) or symbol[0] == self.crosses.base:
+			return None
+		stem = io_support.get_file_stem(symbol, self.function, self.interval)
+		if self.store is not None and self.store.has(stem):
+			return None
+		if self.store is None and os.path.isfile(self.folderpath + "/" + stem + "." + self.datatype):
+			return None
+		logger.info("Deriving " + io_support.get_symbol_str(symbol) + " from " + self.crosses.base + " legs...")
+		return self.crosses.get_pair(symbol[0], symbol[1], start=start, end=end)
+
+	def load_single_drive(self, symbol, start=None, end=None):
+		""" Downloads data on a single file (equity or forex) from local drive. 
+			Repeated loads of an unchanged file are served from the frame cache, as views that cannot be modified in place. 
+			Inputs: symbol String or tuple object, start and end date/time (inclusive, default: unbounded)
+			Outputs: dataframe with all available data on symbol (within the date range)
+		"""
+		symbol_str = io_support.get_symbol_str(symbol)
+		stem = io_support.get_file_stem(symbol, self.function, self.interval)
+		logger.info("Retrieving " + symbol_str + " from local drive...")
+		tick_data = self.load_cross(symbol, start=start, end=end)
+		if tick_data is not None:
+			return tick_data
+		readpath = self.folderpath + "/" + stem + "." + self.datatype
+		# The cache key includes the modification time and the size, so that rewritten or appended files are read again
+		# (the size catches appends made within the file system's time granularity, as in manifest.is_clean)
+		mtime = None
+		size = None
+		if self.store is not None:
+			source = self.store.rootpath + "/" + stem
+			mtime = self.store.get_mtime(stem)
+			size = self.store.get_size(stem)
+		else:
+			source = readpath
+			if os.path.isfile(readpath):
+				stat = os.stat(readpath)
+				mtime = stat.st_mtime
+				size = stat.st_size
+		key = (source, mtime, size, self.function, self.interval, start, end, self.datetime_index)
+		if self.cache is not None and mtime is not None:
+			tick_data = self.cache.get(key)
+			if tick_data is not None:
+				logger.info("Data on " + symbol_str + " successfully retrieved from cache!")
+				return tick_data
+		# Reads typed arrays from the price store (already sorted and de-duplicated)
+		if self.store is not None:
+			tick_data = self.store.read(stem, start=start, end=end)
+			if tick_data is None:
+				logger.error("Retrieval unsuccessful. " + stem + " not found in price store at " + self.store.rootpath)
+				return tick_data
+		else:
+			try:
+				tick_data = self.read_drive(readpath, start=start, end=end)
+			except FileNotFoundError:
+				logger.error("Retrieval unsuccessful. File not found at " + readpath)
+				return tick_data
+		if self.cache is not None:
+			tick_data = self.cache.put(key, tick_data)
+		logger.info("Data on " + symbol_str + " successfully retrieved!")
+		return tick_data
+
+	def read_column_drive(self, symbol, column_choice="close", start=None, end=None):
+		""" Reads the timestamps and one column of a single file, parsing nothing else. 
+			Inputs: symbol String or tuple object, choice of column to read (default: close), 
+				start and end date/time (inclusive, default: unbounded)
+			Outputs: tuple of (timestamp array, value array), or None if the file is missing
+		"""
+		stem = io_support.get_file_stem(symbol, self.function, self.interval)
+		tick_data = self.load_cross(symbol, start=start, end=end)
+		if tick_data is not None:
+			return tick_data.index.values, tick_data[column_choice].to_numpy(dtype=float)
+		if self.store is not None:
+			tick_data = self.store.read(stem, columns=[column_choice], start=start, end=end)
+			if tick_data is None:
+				logger.error("Retrieval unsuccessful. " + stem + " not found in price store at " + self.store.rootpath)
+				return None
+			return tick_data.index.values, tick_data[column_choice].to_numpy(dtype=float)
+		readpath = self.folderpath + "/" + stem + "." + self.datatype
+		try:
+			tick_data = self.read_drive(readpath, start=start, end=end, usecols=['timestamp', column_choice])
+		except FileNotFoundError:
+			logger.error("Retrieval unsuccessful. File not found at " + readpath)
+			return None
+		return tick_data.index.values, tick_data[column_choice].to_numpy(dtype=float)
+
+	def load_panel(self, tickerverse, column_choice="close", workers=4, start=None, end=None):
+		""" Loads one column of many symbols into a single dates x symbols matrix. 
+			Files are read in parallel threads, then placed on the union of their timestamps in one allocation. 
+			Inputs: ticker universe, choice of column to load (default: close), number of reader threads (default: 4), 
+				start and end date/time (inclusive, default: unbounded)
+			Outputs: dataframe indexed by timestamp, with one column per symbol found (NaN where a symbol has no data)
+		"""
+		# A shared panel (see shared_panel.py) is already aligned, and is sliced without reading any file
+		if hasattr(self.store, 'get_panel'):
+			return self.store.get_panel(tickerverse, field=column_choice, start=start, end=end)
+		time0 = time.time()
+		with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+			columns = list(executor.map(lambda symbol: self.read_column_drive(symbol, column_choice, start=start, end=end), tickerverse))
+		symbols = [io_support.get_symbol_str(symbol) for symbol, column in zip(tickerverse, columns) if column is not None]
+		columns = [column for column in columns if column is not None]
+		if len(columns) == 0:
+			return pd.DataFrame()
+		# Builds the union calendar once, by hashing rather than sorting every timestamp
+		calendar = pd.Index(np.concatenate([timestamp for timestamp, _ in columns])).unique().sort_values()
+		calendar.name = 'timestamp'
+		panel = np.full((len(calendar), len(columns)), np.nan)
+		for j, (timestamp, values) in enumerate(columns):
+			panel[calendar.get_indexer(timestamp), j] = values
+		logger.info("Loaded %d of %d symbols (%d timestamps) in %.2f seconds", len(symbols), len(tickerverse), len(calendar), time.time() - time0)
+		return pd.DataFrame(panel, index=calendar, columns=symbols)
+
+	def load_combined_drive(self, tickerverse, column_choice="close"):
+		""" Downloads OHCLV (open-high-close-low-volume) data on given tickers in compact or full form.
+			Inputs: ticker universe, choice of column to write (default: close)
+			Outputs: combined output as dataframe (see load_panel)
+		"""
+		return self.load_panel(tickerverse, column_choice=column_choice)
+
+class CMacroDownloader:
+	""" A class to download macro data from handpicked sources. """
+	def __init__(self, cachepath=TREASURY_CACHE, workers=4, url_format=YIELD_CURVE_URL):
+		# Initialize variables
+		now = datetime.datetime.now()
+		self.current_year = now.year
+		# Folder where closed years of Treasury data are kept (None disables the cache)
+		self.cachepath = cachepath
+		# Number of years downloaded at once
+		self.workers = workers
+		# URL of the yield curve feed, with a placeholder for the year
+		self.url_format = url_format
+		return
+
+	def is_closed(self, year):
+		""" Checks if a year of data can no longer change (a week into the following year, to allow for late postings). """
+		return datetime.date.today() > datetime.date(int(year) + 1, 1, 7)
+
+	def parse_yield_curve(self, stream):
+		""" Parses the US Treasury's yield curve XML feed incrementally, filling one array per tenor. 
+			Input: binary stream of the XML feed
+			Output: dataframe of yields (in percent) with one column per tenor (e.g. 1MONTH, 10YEAR), indexed by date
+		"""
+		dates = []
+		columns = {}
+		for _, elem in ElementTree.iterparse(stream, events=('end',)):
+			if elem.tag == ODATA_META_NS + 'properties':
+				values = {}
+				for field in elem:
+					name = field.tag[len(ODATA_NS):]
+					if name == 'NEW_DATE':
+						dates.append(field.text.split('T')[0])
+					# Skips the DISPLAY duplicates of each tenor
+					elif name.startswith('BC_') and not name.endswith('DISPLAY'):
+						# Checks if the entry is null (this happened in 2010 data, but not 1991-2009)
+						is_null = field.get(ODATA_META_NS + 'null') == 'true' or not field.text
+						values[name[3:]] = np.nan if is_null else float(field.text)
+				# Tenors added over the years (e.g. 1MONTH in 2001) are blank before their first day
+				for name in values:
+					if name not in columns:
+						columns[name] = [np.nan] * (len(dates) - 1)
+				for name, column in columns.items():
+					column.append(values.get(name, np.nan))
+				elem.clear()
+			elif elem.tag.endswith('entry'):
+				# Frees each parsed entry, so memory stays flat whatever the size of the feed
+				elem.clear()
+		yield_curve_df = pd.DataFrame(columns, index=pd.Index(dates, name='timestamp'))
+		return yield_curve_df[~yield_curve_df.index.duplicated(keep='first')].sort_index()
+
+	def yield_curve_table(self, year):
+		""" Gets one year of US Treasury yield curve data on all tenors, from the disk cache if the year is closed. 
+			Input: year to get data from
+			Output: dataframe of yields with one column per tenor, indexed by date
+		"""
+		cachefile = os.path.join(self.cachepath, "UST_{}.csv".format(year)) if self.cachepath is not None else None
+		if cachefile is not None and os.path.isfile(cachefile):
+			logger.debug("Reading US Treasury yield curve data, year %d, from %s", year, cachefile)
+			return pd.read_csv(cachefile, index_col='timestamp')
+		logger.info("Processing US Treasury yield curve data, year %d", year)
+		# Streams the feed straight into the parser over a pooled connection
+		with http_client.get_client().open(self.url_format.format(year)) as stream:
+			yield_curve_df = self.parse_yield_curve(stream)
+		if cachefile is not None and self.is_closed(year):
+			os.makedirs(self.cachepath, exist_ok=True)
+			yield_curve_df.to_csv(cachefile + ".tmp")
+			os.replace(cachefile + ".tmp", cachefile)
+		return yield_curve_df
+
+	def yield_curve_year(self, year, maturity='10Y'):
+		""" Gets US Treasury yield curve data on one bond for one year. 
+			Input: year to get data from, maturity of desired bond (default: 10-year T-Note)
+			Output: dataframe of desired bond's yields (in percent), indexed by date
+		"""
+		# Checks if the input year is valid
+		if int(year) < 1990 or int(year) > self.current_year:
+			logger.error("Invalid input year given to CMacroDownloader.yield_curve(...)")
+			logger.error("Please give CMacroDownloader.yield_curve(...) an input year between 1990 and %d", self.current_year)
+			return None
+		# Builds a String version of the maturity
+		maturity_code = maturity.replace('M', 'MONTH').replace('Y', 'YEAR')
+		yield_curve_df = self.yield_curve_table(year)
+		# Some tenors were not issued in every year (e.g. the 30-year bond in 2003), so their yields are left blank
+		if maturity_code not in yield_curve_df.columns:
+			logger.warning("No %s yields found for year %s", maturity, year)
+		return yield_curve_df.reindex(columns=[maturity_code])
+
+	def yield_curve_multi(self, start_year=1991, end_year=2018, maturity='10Y'):
+		""" Gets multiple years of yield curve data as a consolidated dataframe, downloading years concurrently. 
+			Inputs: start year (default: 1991), end year (default: 2018); 
+				maturity of desired bond (default: 10-year T-Note; None for all tenors)
+			Outputs: dataframe with all the desired data
+		"""
+		years = [year for year in range(start_year, end_year + 1) if 1990 <= year <= self.current_year]
+		if len(years) == 0:
+			logger.error("No valid years between %d and %d given to CMacroDownloader.yield_curve_multi(...)", start_year, end_year)
+			return None
+		with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+			year_dfs = list(executor.map(self.yield_curve_table, years))
+		multi_year_df = pd.concat(year_dfs, sort=False)
+		if maturity is None:
+			return multi_year_df
+		return multi_year_df.reindex(columns=[maturity.replace('M', 'MONTH').replace('Y', 'YEAR')])
+
+	def get_world_bank(self):
+		# Gets data from the World Bank
+		# Download file from the World Bank link
+		# Parse it and clean if needed
+		# Save to folderpath
+		return
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data. 
+		Here are some examples of how to run this program: 
+
+		python download.py -tickerUniverse SNP500 -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -apiKey <INSERT KEY> -function DAILY
+			This will download files of daily data on S&P 500 tickers to the desired folder path.
+
+		python download.py -tickerUniverse AAPL -folderPath C:/Users/Miguel/Documents/EQUITIES/stockIntraday1Min -apiKey <INSERT KEY> -function INTRADAY -interval 1min
+			This will download files of daily data on S&P 500 tickers to the desired folder path.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	## Handles which symbol the user wants to download.
+	cmdparser = CCmdParser(prompts)
+	tickerverse, name = cmdparser.get_tickerverse()
+	## Handles where the user wants to download their files. 
+	# Default folder path is relevant to the author only. 
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	## Handles the user's API key. 
+	api_key = cmdparser.get_generic(query="-apiKey")
+	## Handles the desired time series function. 
+	function = cmdparser.get_generic(query="-function")
+	## Handles the special case: if INTRADAY selected. 
+	interval = cmdparser.get_generic(query="-interval") if function == "INTRADAY" else ""
+	## Handles user choice of forex or equity (not forex)
+	if name == "FOREX":
+		fx_format = "{}function=FX_{}&from_symbol={}&to_symbol={}&apikey={}&datatype={}&outputsize={}"
+		downloader = CDownloader(folder_path, api_key, function, interval, url_format=fx_format)
+		downloader.load_separate(tickerverse)
+	else:
+		downloader = CDownloader(folder_path, api_key, function, interval)
+		downloader.load_separate(tickerverse)
+	## Closing output
+	logger.info("Download complete. Have a nice day!")
+
+if __name__ == "__main__":
+	"""
+	md = CMacroDownloader()
+	df = md.yield_curve_multi()
+	df.to_csv("/Users/openamiguel/Desktop/UST_10year.txt", sep='\t')
+	"""
+	main()
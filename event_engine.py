@@ -0,0 +1,340 @@
+## This code replays stored bars one at a time through strategy callbacks, for strategies that react to each bar and to their own fills
+## (stops, position limits, orders that depend on fills). Bars are streamed from disk in chunks, so memory does not grow with history.
+## Orders placed on a bar fill at the next bar's open; stops fill at the stop price (or the open, if the bar gaps through it).
+## Author: Miguel Opeña
+## Version: 1.0.1
+
+from collections import deque
+import heapq
+from itertools import repeat
+import logging
+import numpy as np
+import os
+import pandas as pd
+import sys
+import time
+
+from command_parser import CCmdParser
+import download
+import io_support
+import manifest
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Rows read from disk at a time, per symbol
+CHUNK_ROWS = 100000
+# Approximate bytes per row of a CSV file, for sizing the blocks read
+CHUNK_ROW_BYTES = 64
+
+def get_timestamps(index):
+	""" Returns the timestamps of an index as ISO strings (YYYY-MM-DD HH:MM:SS), which sort in time order. 
+		Text indexes (as read from CSV files) are parsed first, so that bars merged from stores and files compare alike.
+	"""
+	if not isinstance(index, pd.DatetimeIndex):
+		index = pd.DatetimeIndex(pd.to_datetime(index))
+	return np.char.replace(np.datetime_as_string(index.values.astype('datetime64[s]'), unit='s'), 'T', ' ')
+
+def iter_chunks(loader, symbol, start=None, end=None, chunk_rows=CHUNK_ROWS):
+	""" Reads the bars of one symbol in chronological chunks.
+		Price stores are read one year partition at a time, and clean CSV files (see manifest.py) a block of rows at a time;
+		other files have to be read whole to be sorted.
+		Inputs: CLoader object, symbol String or tuple object, start and end date/time (inclusive, default: unbounded), rows per chunk
+		Outputs: generator of dataframes indexed by timestamp
+	"""
+	stem = io_support.get_file_stem(symbol, loader.function, loader.interval)
+	if loader.store is not None and hasattr(loader.store, 'get_meta'):
+		meta = loader.store.get_meta(stem)
+		if meta is None:
+			logger.error("Retrieval unsuccessful. " + stem + " not found in price store at " + loader.store.rootpath)
+			return
+		first_year = pd.Timestamp(start).year if start is not None else None
+		last_year = pd.Timestamp(end).year if end is not None else None
+		for year in sorted(int(year) for year in meta['year_starts']):
+			if (first_year is not None and year < first_year) or (last_year is not None and year > last_year):
+				continue
+			frame = loader.store.read(stem, start="{}-01-01".format(year), end="{}-12-31".format(year))
+			yield frame.loc[start:end] if start is not None or end is not None else frame
+		return
+	readpath = loader.folderpath + "/" + stem + "." + loader.datatype
+	current = manifest.get_manifest(loader.folderpath, create=False) if loader.store is None else None
+	if current is not None and os.path.isfile(readpath) and current.is_clean(readpath):
+		# Rows of a clean file are sorted, so the range is found by binary search and read in blocks
+		for chunk in io_support.iter_csv_range(readpath, start=start, end=end, block_bytes=chunk_rows * CHUNK_ROW_BYTES):
+			yield chunk
+		return
+	logger.warning("%s is not known to be sorted, reading it whole...", stem)
+	tick_data = loader.load_single_drive(symbol, start=start, end=end)
+	if tick_data is None:
+		return
+	for lo in range(0, len(tick_data), chunk_rows):
+		yield tick_data.iloc[lo:lo + chunk_rows]
+
+def iter_bars(loader, symbol, start=None, end=None, chunk_rows=CHUNK_ROWS):
+	""" Yields the bars of one symbol as (timestamp, symbol, open, high, low, close, volume) tuples, reading them in chunks. """
+	symbol_str = io_support.get_symbol_str(symbol)
+	for chunk in iter_chunks(loader, symbol, start=start, end=end, chunk_rows=chunk_rows):
+		volume = chunk['volume'].to_numpy(dtype=float) if 'volume' in chunk else np.zeros(len(chunk))
+		yield from zip(get_timestamps(chunk.index).tolist(), repeat(symbol_str), chunk['open'].to_numpy(dtype=float).tolist(),
+			chunk['high'].to_numpy(dtype=float).tolist(), chunk['low'].to_numpy(dtype=float).tolist(),
+			chunk['close'].to_numpy(dtype=float).tolist(), volume.tolist())
+
+def stream_bars(loader, tickerverse, start=None, end=None, chunk_rows=CHUNK_ROWS):
+	""" Streams the bars of several symbols in time order, merging one chunked reader per symbol.
+		Inputs: CLoader object, ticker universe, start and end date/time (inclusive, default: unbounded), rows per chunk
+		Outputs: generator of (timestamp, symbol, open, high, low, close, volume) tuples
+	"""
+	readers = [iter_bars(loader, symbol, start=start, end=end, chunk_rows=chunk_rows) for symbol in tickerverse]
+	if len(readers) == 1:
+		return readers[0]
+	return heapq.merge(*readers)
+
+class CBar:
+	""" The current bar. The engine updates one instance in place, so strategies should copy any field they keep. """
+	__slots__ = ('timestamp', 'symbol', 'open', 'high', 'low', 'close', 'volume')
+
+class CPosition:
+	""" The state of one symbol: quantity held, average entry price, stop price, order waiting for the next bar, and last close """
+	__slots__ = ('quantity', 'entry', 'stop', 'pending', 'last')
+	def __init__(self):
+		self.quantity = 0
+		self.entry = 0.0
+		self.stop = None
+		self.pending = 0
+		self.last = 0.0
+
+class CFill:
+	""" A filled order """
+	__slots__ = ('timestamp', 'symbol', 'quantity', 'price', 'reason')
+	def __init__(self, timestamp, symbol, quantity, price, reason):
+		self.timestamp = timestamp
+		self.symbol = symbol
+		self.quantity = quantity
+		self.price = price
+		self.reason = reason
+
+class CStrategy:
+	""" Base class of event-driven strategies: override the callbacks needed """
+	def on_start(self, engine):
+		pass
+
+	def on_bar(self, engine, bar):
+		pass
+
+	def on_fill(self, engine, fill):
+		pass
+
+	def on_end(self, engine):
+		pass
+
+class CEventEngine:
+	""" A class to replay bars through a strategy, keeping cash, positions and running performance """
+	__slots__ = ('strategy', 'cash', 'market_value', 'transaction', 'max_position', 'positions', 'bar',
+		'num_bars', 'num_fills', 'fees', 'peak', 'max_drawdown', 'equity_curve', 'record_every')
+	def __init__(self, strategy, cash=100000, transaction=7, max_position=None, record_every=0):
+		""" Inputs: strategy (CStrategy instance), starting cash, transaction cost of every fill,
+				largest absolute quantity held per symbol (default: unlimited),
+				number of bars between recorded equity values (default: 0, i.e. keep no curve, so memory stays bounded)
+		"""
+		self.strategy = strategy
+		self.cash = float(cash)
+		# Sum of quantity x last close over all positions, updated as bars arrive
+		self.market_value = 0.0
+		self.transaction = transaction
+		self.max_position = max_position
+		self.positions = {}
+		self.bar = CBar()
+		self.num_bars = 0
+		self.num_fills = 0
+		self.fees = 0.0
+		self.peak = float(cash)
+		self.max_drawdown = 0.0
+		self.equity_curve = []
+		self.record_every = record_every
+
+	def get_position(self, symbol):
+		position = self.positions.get(symbol)
+		if position is None:
+			position = self.positions[symbol] = CPosition()
+		return position
+
+	def get_equity(self):
+		return self.cash + self.market_value
+
+	def order(self, symbol, quantity):
+		""" Places a market order (positive to buy, negative to sell), filled at the next bar's open of the symbol. """
+		self.get_position(symbol).pending += quantity
+
+	def order_target(self, symbol, target):
+		""" Places the market order that brings the position of a symbol to a target quantity. """
+		position = self.get_position(symbol)
+		position.pending = target - position.quantity
+
+	def set_stop(self, symbol, price):
+		""" Sets (or removes, with None) the stop price of the position in a symbol. """
+		self.get_position(symbol).stop = price
+
+	def fill(self, position, symbol, quantity, price, reason):
+		""" Executes a trade at a price, within the position limit. """
+		target = position.quantity + quantity
+		if self.max_position is not None:
+			target = max(-self.max_position, min(self.max_position, target))
+		quantity = target - position.quantity
+		if quantity == 0:
+			return
+		if target == 0:
+			position.entry = 0.0
+			position.stop = None
+		elif position.quantity == 0 or (position.quantity > 0) != (target > 0):
+			position.entry = price
+		elif abs(target) > abs(position.quantity):
+			position.entry = (position.entry * position.quantity + price * quantity) / target
+		self.cash -= quantity * price + self.transaction
+		self.market_value += quantity * position.last
+		position.quantity = target
+		self.fees += self.transaction
+		self.num_fills += 1
+		self.strategy.on_fill(self, CFill(self.bar.timestamp, symbol, quantity, price, reason))
+
+	def run(self, bars):
+		""" Replays a stream of bars (from stream_bars) through the strategy.
+			Outputs: dictionary of statistics (bars, fills, events per second, ending equity, maximum drawdown, fees)
+		"""
+		time0 = time.time()
+		bar = self.bar
+		positions = self.positions
+		strategy = self.strategy
+		self.strategy.on_start(self)
+		for timestamp, symbol, open_price, high, low, close, volume in bars:
+			bar.timestamp = timestamp
+			bar.symbol = symbol
+			bar.open = open_price
+			bar.high = high
+			bar.low = low
+			bar.close = close
+			bar.volume = volume
+			position = positions.get(symbol)
+			if position is None:
+				position = self.get_position(symbol)
+				position.last = open_price
+			# Orders from the previous bar fill at this bar's open
+			if position.pending != 0:
+				pending = position.pending
+				position.pending = 0
+				self.fill(position, symbol, pending, open_price, "order")
+			# Stops fill at the stop price, or at the open if the bar gaps through it
+			if position.stop is not None:
+				if position.quantity > 0 and low <= position.stop:
+					self.fill(position, symbol, -position.quantity, min(open_price, position.stop), "stop")
+				elif position.quantity < 0 and high >= position.stop:
+					self.fill(position, symbol, -position.quantity, max(open_price, position.stop), "stop")
+			self.market_value += position.quantity * (close - position.last)
+			position.last = close
+			equity = self.cash + self.market_value
+			if equity > self.peak:
+				self.peak = equity
+			elif self.peak > 0 and 1 - equity / self.peak > self.max_drawdown:
+				self.max_drawdown = 1 - equity / self.peak
+			self.num_bars += 1
+			if self.record_every and self.num_bars % self.record_every == 0:
+				self.equity_curve.append((timestamp, equity))
+			strategy.on_bar(self, bar)
+		self.strategy.on_end(self)
+		seconds = time.time() - time0
+		events = self.num_bars + self.num_fills
+		stats = {'bars': self.num_bars, 'fills': self.num_fills, 'seconds': seconds,
+			'events_per_sec': events / seconds if seconds > 0 else float('inf'),
+			'equity': self.get_equity(), 'max_drawdown': self.max_drawdown, 'fees': self.fees}
+		logger.info("Replayed %d bars and %d fills in %.2f seconds (%.0f events/sec)", self.num_bars, self.num_fills, seconds, stats['events_per_sec'])
+		return stats
+
+class CMovingAverageStrategy(CStrategy):
+	""" A crossover strategy (see strategy.crossover) run bar by bar, with a stop set off each entry price """
+	def __init__(self, trend=30, baseline=90, size=1, stop=0.02, switch=False):
+		""" Inputs: trend and baseline moving average windows, quantity traded, stop distance as a fraction of the entry price
+				(None for no stop), command to switch buy/sell signals
+		"""
+		self.trend = trend
+		self.baseline = baseline
+		self.size = size
+		self.stop = stop
+		self.switch = switch
+		# Per symbol: window of closes, running sums of the two windows, and last strict side of the baseline
+		self.state = {}
+
+	def on_bar(self, engine, bar):
+		state = self.state.get(bar.symbol)
+		if state is None:
+			state = self.state[bar.symbol] = [deque(maxlen=self.baseline), 0.0, 0.0, None]
+		closes = state[0]
+		if len(closes) == self.baseline:
+			state[2] -= closes[0]
+		if len(closes) >= self.trend:
+			state[1] -= closes[-self.trend]
+		closes.append(bar.close)
+		state[1] += bar.close
+		state[2] += bar.close
+		if len(closes) < self.baseline:
+			return
+		difference = state[1] / self.trend - state[2] / self.baseline
+		side = 1 if difference > 0 else -1 if difference < 0 else 0
+		if side == 0:
+			return
+		# Buys long when the trend crosses below the baseline, sells short when it crosses above
+		if state[3] is not None and side != state[3]:
+			target = -side * self.size
+			engine.order_target(bar.symbol, -target if self.switch else target)
+		state[3] = side
+
+	def on_fill(self, engine, fill):
+		position = engine.positions[fill.symbol]
+		if self.stop is not None and position.quantity != 0 and fill.reason == "order":
+			direction = 1 if position.quantity > 0 else -1
+			engine.set_stop(fill.symbol, position.entry * (1 - direction * self.stop))
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here is an example of how to run this program:
+
+		python event_engine.py -symbol AAPL -folderPath C:/Users/Miguel/Documents/EQUITIES/stockIntraday1Min -function INTRADAY -interval 1min -stop 0.01
+			This will replay every stored 1-minute bar of AAPL through a 30/90-bar crossover strategy with a 1 percent stop.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	symbols = cmdparser.get_generic(query="-symbol").split(",")
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockIntraday1Min", req=False)
+	function = cmdparser.get_generic(query="-function", default="INTRADAY", req=False)
+	interval = cmdparser.get_generic(query="-interval", default="1min", req=False) if function == "INTRADAY" else ""
+	start_date = cmdparser.get_generic(query="-startDate", default="", req=False)
+	end_date = cmdparser.get_generic(query="-endDate", default="", req=False)
+	stop = cmdparser.get_generic(query="-stop", default="", req=False)
+	loader = download.CLoader(folder_path, function=function, interval=interval)
+	engine = CEventEngine(CMovingAverageStrategy(stop=float(stop) if stop != "" else None))
+	stats = engine.run(stream_bars(loader, symbols, start=start_date or None, end=end_date or None))
+	logger.info("Ending equity %.2f, maximum drawdown %.2f%%, fees %.2f", stats['equity'], stats['max_drawdown'] * 100, stats['fees'])
+	return 0
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,156 @@
+## This code derives every forex cross rate (EUR/JPY, GBP/CHF, ...) from the stored USD legs, instead of downloading each pair.
+## With USD_XXX the value of 1 USD in XXX, the value of 1 A in B is USD_B / USD_A, for all dates and pairs at once.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import logging
+import numpy as np
+import os
+import pandas as pd
+import sys
+
+from command_parser import CCmdParser
+import manifest
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+FIELDS = ['open', 'high', 'low', 'close']
+
+class CCrossRates:
+	""" A class to compute forex cross rates from the base-currency legs stored on local drive """
+	def __init__(self, loader, currencies=None, base="USD"):
+		""" Inputs: CLoader object pointed at the folder of legs (e.g. USD_EUR_DAILY.csv),
+				currencies to load (default: every BASE_XXX file in the folder's manifest), base currency (default: USD)
+		"""
+		self.loader = loader
+		self.base = base
+		self.requested = currencies
+		# Filled on first use by load_legs
+		self.currencies = None
+		self.calendar = None
+		self.legs = None
+
+	def load_legs(self):
+		""" Loads every leg once (call again to pick up updated files) and aligns them on their union calendar, as one dates x currencies array per field.
+			The base currency is the first column, at 1.0 throughout.
+		"""
+		currencies = self.requested
+		if currencies is None:
+			prefix = self.base + "_"
+			if self.loader.store is not None:
+				parts = [manifest.parse_stem(stem) for stem in self.loader.store.stems()]
+				symbols = [part[0] for part in parts if part is not None and part[1] == self.loader.function]
+			else:
+				symbols = manifest.get_manifest(self.loader.folderpath).symbols(function=self.loader.function)
+			currencies = sorted(symbol[len(prefix):] for symbol in symbols if symbol.startswith(prefix) and "_" not in symbol[len(prefix):])
+		frames = [self.loader.load_single_drive((self.base, currency)) for currency in currencies]
+		currencies = [currency for currency, frame in zip(currencies, frames) if frame is not None]
+		frames = [frame for frame in frames if frame is not None]
+		if len(frames) == 0:
+			logger.error("No %s legs found in %s", self.base, self.loader.folderpath)
+			self.currencies = [self.base]
+			self.calendar = pd.Index([], name='timestamp')
+			self.legs = {field: np.ones((0, 1)) for field in FIELDS}
+			return
+		self.calendar = pd.Index(np.concatenate([frame.index.values for frame in frames])).unique().sort_values()
+		self.calendar.name = 'timestamp'
+		self.currencies = [self.base] + currencies
+		self.legs = {}
+		for field in FIELDS:
+			values = np.full((len(self.calendar), len(self.currencies)), np.nan)
+			values[:, 0] = 1.0
+			for j, frame in enumerate(frames):
+				values[self.calendar.get_indexer(frame.index), j + 1] = frame[field].to_numpy(dtype=float)
+			self.legs[field] = values
+		logger.info("Loaded %d %s legs over %d timestamps", len(frames), self.base, len(self.calendar))
+
+	def row_range(self, start=None, end=None):
+		""" Returns the rows of the calendar between two dates/times (inclusive, as with dataframe slicing). """
+		if self.legs is None:
+			self.load_legs()
+		if start is None and end is None:
+			return slice(0, len(self.calendar))
+		return self.calendar.slice_indexer(start, end)
+
+	def has(self, currency):
+		if self.legs is None:
+			self.load_legs()
+		return currency in self.currencies
+
+	def matrix(self, field="close", start=None, end=None):
+		""" Computes all N x N cross rates at once.
+			Inputs: field (default: close), start and end date/time (default: unbounded)
+			Outputs: calendar, list of currencies, dates x currencies x currencies array
+				(element [t, i, j] is the value of 1 unit of currency i in currency j)
+		"""
+		rows = self.row_range(start, end)
+		legs = self.legs[field][rows]
+		return self.calendar[rows], list(self.currencies), legs[:, None, :] / legs[:, :, None]
+
+	def get_pair(self, from_currency, to_currency, start=None, end=None):
+		""" Derives the bars of one cross rate.
+			Open and close are exact; high and low are bounds taken from the legs (their extremes need not coincide in time).
+			Inputs: currency to convert from, currency to convert to, start and end date/time (default: unbounded)
+			Outputs: dataframe of open, high, low and close (dates where either leg is missing are left out),
+				or None if a leg is not stored
+		"""
+		if not self.has(from_currency) or not self.has(to_currency):
+			logger.error("Cross %s/%s needs both %s legs, which are not all stored", from_currency, to_currency, self.base)
+			return None
+		rows = self.row_range(start, end)
+		i = self.currencies.index(from_currency)
+		j = self.currencies.index(to_currency)
+		legs = {field: self.legs[field][rows] for field in FIELDS}
+		cross = pd.DataFrame({'open': legs['open'][:, j] / legs['open'][:, i],
+			'high': legs['high'][:, j] / legs['low'][:, i],
+			'low': legs['low'][:, j] / legs['high'][:, i],
+			'close': legs['close'][:, j] / legs['close'][:, i]}, index=self.calendar[rows])
+		return cross.dropna(how='any')
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here is an example of how to run this program:
+
+		python forex_cross.py -folderPath C:/Users/Miguel/Documents/EQUITIES/forexDaily -date 2018-06-29
+			This will log the table of all cross rates (closing prices) derived from the USD pairs in folderPath on that date.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	import download
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/forexDaily", req=False)
+	function = cmdparser.get_generic(query="-function", default="DAILY", req=False)
+	date = cmdparser.get_generic(query="-date", default="", req=False)
+	crosses = CCrossRates(download.CLoader(folder_path, function=function))
+	calendar, currencies, rates = crosses.matrix(start=date or None, end=date or None)
+	if len(calendar) == 0:
+		logger.error("No cross rates found for %s", date)
+		return 1
+	table = pd.DataFrame(rates[-1], index=currencies, columns=currencies)
+	logger.info("Cross rates on %s (1 unit of row currency in column currency):\n%s", calendar[-1], table.to_string())
+	return 0
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,275 @@
+## This code consolidates all network fetches (AlphaVantage, US Treasury, SEC) behind one pooled HTTP client.
+## Connections are kept alive per host, bodies are requested gzip-compressed and streamed straight to the caller.
+## Author: Miguel Opeña
+## Version: 1.2.1
+
+import gzip
+import http.client
+import io
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Number of seconds before a connect or a read is abandoned
+TIMEOUT = 30
+# Number of idle keep-alive connections held per host
+POOL_SIZE = 4
+# Number of redirects followed before giving up
+MAX_REDIRECTS = 5
+# Size of the blocks copied when writing a response to file
+BLOCKSIZE = 1 << 16
+# Errors which indicate that a pooled connection was dropped by the server while idle
+STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, BrokenPipeError, ConnectionResetError)
+
+class _CCountingReader:
+	""" Tallies the bytes read off the wire, before any decompression. """
+	def __init__(self, response):
+		self.response = response
+		self.count = 0
+
+	def read(self, size=-1):
+		data = self.response.read(size) if size is not None and size >= 0 else self.response.read()
+		self.count += len(data)
+		# http.client returns short data without an error when the server closes before Content-Length is reached
+		if len(data) == 0 and size != 0 and self.response.length:
+			raise http.client.IncompleteRead(b'', self.response.length)
+		return data
+
+class _CBodyReader(io.RawIOBase):
+	""" Raw stream over one HTTP response body. Closing it hands the connection back to the pool. """
+	def __init__(self, client, key, conn, response, url, time0):
+		self.client = client
+		self.key = key
+		self.conn = conn
+		self.response = response
+		self.url = url
+		self.time0 = time0
+		self.payload = 0
+		self.failed = False
+		self.wire = _CCountingReader(response)
+		# Decompresses on the fly if the server honoured Accept-Encoding
+		if (response.getheader('Content-Encoding') or '').lower() == 'gzip':
+			self.body = gzip.GzipFile(fileobj=self.wire, mode='rb')
+		else:
+			self.body = self.wire
+
+	def readable(self):
+		return True
+
+	def readinto(self, buffer):
+		try:
+			data = self.body.read(len(buffer))
+		except (OSError, EOFError, http.client.HTTPException) as e:
+			# A body cut short (or a truncated gzip stream) fails like a request error, so that callers skip the file
+			self.failed = True
+			self.client._record(self.key[1], errors=1)
+			raise urllib.error.URLError(e)
+		size = len(data)
+		buffer[:size] = data
+		self.payload += size
+		return size
+
+	def close(self):
+		if self.closed:
+			return
+		# The connection may only be reused once the body has been read to the end
+		reusable = self.response.isclosed() and not self.response.will_close and not self.failed
+		self.client._release(self.key, self.conn, reusable)
+		self.client._record(self.key[1], payload=self.payload, wire=self.wire.count, seconds=time.time() - self.time0)
+		logger.debug("Closed %s after %d bytes (%d on the wire)", self.url, self.payload, self.wire.count)
+		super().close()
+
+class CHttpClient:
+	""" A class to fetch URLs over pooled keep-alive connections, with gzip and timing metrics per host """
+	def __init__(self, timeout=TIMEOUT, pool_size=POOL_SIZE, headers=None):
+		self.timeout = timeout
+		self.pool_size = pool_size
+		self.headers = {'Accept-Encoding': 'gzip', 'Connection': 'keep-alive', 'User-Agent': 'equitysim'}
+		if headers is not None:
+			self.headers.update(headers)
+		# Idle connections, keyed by (scheme, host, port)
+		self.pool = {}
+		# Request counts, byte counts and elapsed seconds, keyed by host
+		self.metrics = {}
+		self.lock = threading.Lock()
+
+	def _connect(self, key):
+		scheme, host, port = key
+		self._record(host, connects=1)
+		if scheme == 'https':
+			return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+		return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+	def _acquire(self, key):
+		""" Returns an idle connection to the given host, or a new one if none is idle, and whether it was pooled. """
+		with self.lock:
+			idle = self.pool.get(key, [])
+			if idle:
+				return idle.pop(), True
+		return self._connect(key), False
+
+	def _release(self, key, conn, reusable):
+		with self.lock:
+			idle = self.pool.setdefault(key, [])
+			if reusable and len(idle) < self.pool_size:
+				idle.append(conn)
+				return
+		conn.close()
+
+	def _record(self, host, requests=0, errors=0, connects=0, payload=0, wire=0, seconds=0.0):
+		with self.lock:
+			stats = self.metrics.setdefault(host, {'requests': 0, 'errors': 0, 'connects': 0, 'bytes': 0, 'wire_bytes': 0, 'seconds': 0.0})
+			stats['requests'] += requests
+			stats['errors'] += errors
+			stats['connects'] += connects
+			stats['bytes'] += payload
+			stats['wire_bytes'] += wire
+			stats['seconds'] += seconds
+
+	def _request(self, key, path):
+		""" Sends a GET over a pooled connection, retrying once on a fresh connection if the pooled one went stale. """
+		conn, pooled = self._acquire(key)
+		try:
+			conn.request('GET', path, headers=self.headers)
+			return conn, conn.getresponse()
+		except STALE_ERRORS:
+			conn.close()
+			if not pooled:
+				raise
+		conn = self._connect(key)
+		conn.request('GET', path, headers=self.headers)
+		return conn, conn.getresponse()
+
+	def open(self, url):
+		""" Opens a URL as a readable binary stream, which can be passed directly to pd.read_csv or a parser.
+			The stream must be closed (or used as a context manager) to return its connection to the pool.
+			Inputs: URL to fetch
+			Outputs: file-like object with the (decompressed) response body
+		"""
+		for _ in range(MAX_REDIRECTS + 1):
+			parsed = urllib.parse.urlsplit(url)
+			scheme = parsed.scheme or 'http'
+			port = parsed.port or (443 if scheme == 'https' else 80)
+			key = (scheme, parsed.hostname, port)
+			path = (parsed.path or '/') + ('?' + parsed.query if parsed.query else '')
+			time0 = time.time()
+			self._record(key[1], requests=1)
+			try:
+				conn, response = self._request(key, path)
+			except (OSError, http.client.HTTPException) as e:
+				self._record(key[1], errors=1, seconds=time.time() - time0)
+				raise urllib.error.URLError(e)
+			# Follows redirects after draining the body, so that the connection can be reused
+			if response.status in (301, 302, 303, 307, 308) and response.getheader('Location'):
+				response.read()
+				self._release(key, conn, not response.will_close)
+				self._record(key[1], seconds=time.time() - time0)
+				url = urllib.parse.urljoin(url, response.getheader('Location'))
+				logger.debug("Redirected to %s", url)
+				continue
+			if response.status >= 400:
+				response.read()
+				self._release(key, conn, not response.will_close)
+				self._record(key[1], errors=1, seconds=time.time() - time0)
+				raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+			return io.BufferedReader(_CBodyReader(self, key, conn, response, url, time0), buffer_size=BLOCKSIZE)
+		raise urllib.error.URLError("Too many redirects fetching {}".format(url))
+
+	def get(self, url):
+		""" Fetches a URL in full.
+			Inputs: URL to fetch
+			Outputs: (decompressed) response body as bytes
+		"""
+		with self.open(url) as stream:
+			return stream.read()
+
+	def get_text(self, url, encoding='utf-8'):
+		""" Fetches a URL in full as text (e.g. a web page for pd.read_html).
+			Inputs: URL to fetch, text encoding (default: utf-8)
+			Outputs: response body as a string
+		"""
+		return self.get(url).decode(encoding, errors='replace')
+
+	def retrieve(self, url, filepath):
+		""" Streams a URL to a file, in place of urllib.request.urlretrieve.
+			Inputs: URL to fetch, file path to write to
+			Outputs: number of bytes written
+		"""
+		written = 0
+		with self.open(url) as stream, open(filepath, 'wb') as outfile:
+			for block in iter(lambda: stream.read(BLOCKSIZE), b''):
+				outfile.write(block)
+				written += len(block)
+		return written
+
+	def get_metrics(self):
+		""" Returns a copy of the per-host request counts, byte counts and elapsed seconds. """
+		with self.lock:
+			return {host: dict(stats) for host, stats in self.metrics.items()}
+
+	def log_metrics(self):
+		""" Writes the per-host metrics to the logger. """
+		for host, stats in self.get_metrics().items():
+			logger.info("%s: %d requests (%d errors, %d connections), %d bytes (%d on the wire) in %.2f seconds",
+				host, stats['requests'], stats['errors'], stats['connects'], stats['bytes'], stats['wire_bytes'], stats['seconds'])
+
+	def close(self):
+		""" Closes all idle connections. """
+		with self.lock:
+			for idle in self.pool.values():
+				for conn in idle:
+					conn.close()
+			self.pool = {}
+
+class CRateLimiter:
+	""" A class to space out API calls made from any number of threads """
+	def __init__(self, delay):
+		# Minimum number of seconds between the starts of two calls
+		self.delay = delay
+		self.next_time = 0.0
+		self.lock = threading.Lock()
+
+	def wait(self):
+		""" Blocks until the next call is allowed to start. """
+		with self.lock:
+			now = time.time()
+			start = max(now, self.next_time)
+			self.next_time = start + self.delay
+		if start > now:
+			time.sleep(start - now)
+
+# Client shared by all the fetchers in one process
+_shared_client = None
+_shared_lock = threading.Lock()
+
+def get_client():
+	""" Returns the process-wide shared HTTP client, creating it on first use. """
+	global _shared_client
+	with _shared_lock:
+		if _shared_client is None:
+			_shared_client = CHttpClient()
+		return _shared_client
@@ -1,82 +1,310 @@
-## Contains support functions for file I/O. 
-## Author: Miguel Opeña
-## Version: 1.1.3
-
-import logging
-import os
-import pandas as pd
-from psutil import virtual_memory
-
-LOGDIR = "/Users/openamiguel/Desktop/LOG"
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-# Set file path for logger
-handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
-handler.setLevel(logging.DEBUG)
-# Format the logger
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-# Add the new format
-logger.addHandler(handler)
-# Format the console logger
-consoleHandler = logging.StreamHandler()
-consoleHandler.setLevel(logging.INFO)
-consoleHandler.setFormatter(formatter)
-# Add the new format to the logger file
-logger.addHandler(consoleHandler)
-
-logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
-
-def get_current_symbols(folderpath, keyword="DAILY", datatype="csv"):
-    """ Returns list of all symbols downloaded to given folder. 
-        Inputs: path of folder directory, file keyword, data type
-        Outputs: list of aforementioned
-    """
-    symbols = []
-    # Walks through the given folderpath
-    for cur_path, directories, files in os.walk(folderpath):
-        for file in files:
-            # Skips all irrelevant files
-            if datatype not in file or keyword not in file:
-                continue
-            # Process the file name for symbol
-            symbols.append(file.split('_')[0])
-    return symbols
-
-def memory_check(filepath, threshold_ratio=10):
-    """ Checks if file occupies too much RAM on the computer. 
-        Inputs: file path to check, threshold ratio
-        Outputs: none as variables
-    """
-    ram = virtual_memory()
-    filesize = os.path.getsize(filepath)
-    # ram[1] gets the available RAM
-    if filesize > threshold_ratio * ram[1] / 100.0:
-        pct = filesize * 100 / ram[1]
-        logger.warning("File occupies %.2f percent of RAM.", pct)
-    return
-
-def merge_chunked(filepath, leftframe, sep='\t', csize=500000, encoding='iso8859-1'):
-    """ Reads dataframe in chunks and inner-joins with dataframe on left
-        Inputs: file path to read dataframe, column to merge on, reference list, 
-            file delimiter (default: tab), chunk size (default: 100000)
-        Outputs: True if everything works
-    """
-    chunks = pd.read_csv(filepath, sep=sep, chunksize=csize, encoding=encoding)
-    out_df = pd.DataFrame()
-    for chunk in chunks:
-        logger.debug("Currently reading row %8d...", chunk.index[0])
-        chunk_filter = leftframe.merge(chunk, how='inner')
-        out_df = pd.concat([out_df, chunk_filter], axis=0)
-    return out_df
-
-def write_as_append(dataframe, filepath, index=False, header=False, sep='\t'):
-    """ Writes dataframe to file in append mode. 
-        Inputs: dataframe, file path to append to
-        Outputs: True if everything works
-    """
-    with open(filepath, 'a') as outfile:
-        dataframe.to_csv(outfile, sep=sep, header=header, index=index)
-    outfile.close()
+## Contains support functions for file I/O. 
+## Author: Miguel Opeña
+## Version: 1.7.1
+
+import io
+import logging
+import numpy as np
+import os
+import pandas as pd
+from psutil import virtual_memory
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+def get_symbol_str(symbol):
+    """ Returns the string used for a symbol in file names. 
+        Inputs: symbol String, or tuple/list of two symbols (forex)
+        Outputs: symbol string (e.g. AAPL or USD_EUR)
+    """
+    # Forex case
+    if type(symbol) is tuple or type(symbol) is list and len(symbol) >= 2:
+        return symbol[0] + "_" + symbol[1]
+    # Equity case
+    return symbol[0] if type(symbol) is not str else symbol
+
+def get_file_stem(symbol, function="DAILY", interval=""):
+    """ Returns the file name (without extension) used for a symbol, following the download.py convention. 
+        Inputs: symbol String or tuple object, time series function, interval (intraday only)
+        Outputs: file stem (e.g. AAPL_DAILY, USD_EUR_DAILY or AAPL_INTRADAY&1min)
+    """
+    stem = get_symbol_str(symbol) + "_" + function
+    if interval != "":
+        stem = stem + "&" + interval
+    return stem
+
+def get_current_symbols(folderpath, keyword="DAILY", datatype="csv"):
+    """ Returns list of all symbols downloaded to given folder. 
+        Price files (CSV files named by time series function) are looked up in the folder's manifest (see manifest.py), 
+        so that DAILY, INTRADAY and forex files are told apart without walking the folder. 
+        Inputs: path of folder directory, file keyword, data type
+        Outputs: list of aforementioned
+    """
+    # Imported here, as manifest.py itself depends on this module
+    import manifest
+    if datatype == manifest.DATATYPE and keyword in manifest.FUNCTIONS:
+        return manifest.get_manifest(folderpath).symbols(function=keyword)
+    symbols = []
+    # Walks through the given folderpath
+    for cur_path, directories, files in os.walk(folderpath):
+        for file in files:
+            # Skips all irrelevant files
+            if datatype not in file or keyword not in file:
+                continue
+            # Process the file name for symbol
+            symbols.append(file.split('_')[0])
+    return symbols
+
+def tail_lines(filepath, blocksize=8192):
+    """ Yields the complete lines of a file from last to first, reading backwards from the end of the file. 
+        A trailing line without a newline (e.g. from an interrupted write) is skipped as incomplete.
+        Inputs: file path to read, size of the blocks read from the end
+        Outputs: generator of lines as strings (without newline)
+    """
+    with open(filepath, 'rb') as infile:
+        infile.seek(0, os.SEEK_END)
+        position = infile.tell()
+        # Start of the line currently being read backwards (None until the last newline is found)
+        carry = None
+        while position > 0:
+            step = min(blocksize, position)
+            position -= step
+            infile.seek(position)
+            block = infile.read(step)
+            if carry is None:
+                # Skips the incomplete line after the last newline
+                if b'\n' not in block:
+                    continue
+                block = block[:block.rindex(b'\n')]
+                carry = b''
+            lines = (block + carry).split(b'\n')
+            carry = lines[0]
+            for line in reversed(lines[1:]):
+                yield line.rstrip(b'\r').decode('iso8859-1')
+        if carry is not None:
+            yield carry.rstrip(b'\r').decode('iso8859-1')
+
+def get_header(filepath, sep=','):
+    """ Reads only the header of a delimited file. 
+        Inputs: file path to read, file delimiter (default: comma)
+        Outputs: list of column names
+    """
+    with open(filepath, 'r', encoding='iso8859-1') as infile:
+        return infile.readline().rstrip('\r\n').split(sep)
+
+def get_last_timestamp(filepath, sep=','):
+    """ Gets the timestamp of the last complete row of a chronological data file, without loading the file. 
+        Rows with blank fields are skipped, as they would be dropped on load. 
+        Inputs: file path to read, file delimiter (default: comma)
+        Outputs: timestamp of last row as string (None if the file has no complete rows)
+    """
+    header = get_header(filepath, sep=sep)
+    for line in tail_lines(filepath):
+        fields = line.split(sep)
+        if len(fields) != len(header) or '' in fields or fields == header:
+            continue
+        return fields[0]
+    return None
+
+def count_ohlc_errors(tick_data):
+    """ Counts the bars whose prices are inconsistent: high below open, close or low, low above open or close, 
+        non-positive prices or negative volume. 
+        Inputs: dataframe of bars (files without all of open, high, low and close are not checked)
+        Outputs: number of inconsistent bars
+    """
+    if not set(['open', 'high', 'low', 'close']).issubset(tick_data.columns):
+        return 0
+    high = tick_data['high'].to_numpy()
+    low = tick_data['low'].to_numpy()
+    body_max = np.maximum(tick_data['open'].to_numpy(), tick_data['close'].to_numpy())
+    body_min = np.minimum(tick_data['open'].to_numpy(), tick_data['close'].to_numpy())
+    errors = (high < body_max) | (low > body_min) | (high < low) | (low <= 0)
+    if 'volume' in tick_data.columns:
+        errors |= tick_data['volume'].to_numpy() < 0
+    return int(errors.sum())
+
+def normalize_bars(tick_data):
+    """ Normalizes bars before they are written: drops blank rows, de-duplicates timestamps (keeping the first) 
+        and sorts them, then checks OHLC consistency (inconsistent bars are kept, but counted). 
+        Inputs: dataframe indexed by timestamp
+        Outputs: normalized dataframe, validation status (dictionary with clean flag and counts of what was fixed or found)
+    """
+    blank = tick_data.isna().any(axis=1).to_numpy()
+    if blank.any():
+        tick_data = tick_data[~blank]
+    duplicated = tick_data.index.duplicated(keep='first')
+    if duplicated.any():
+        tick_data = tick_data[~duplicated]
+    resorted = not tick_data.index.is_monotonic_increasing
+    if resorted:
+        tick_data = tick_data.sort_index()
+    validation = {'clean': True, 'blank_rows': int(blank.sum()), 'duplicates': int(duplicated.sum()), 
+        'resorted': resorted, 'ohlc_errors': count_ohlc_errors(tick_data)}
+    if validation['ohlc_errors'] > 0:
+        logger.warning("%d bars with inconsistent open/high/low/close prices", validation['ohlc_errors'])
+    return tick_data, validation
+
+def get_range_key(value, end=False):
+    """ Turns a date/time bound into a string that compares against ISO timestamps the way pandas slicing does. 
+        A partial end date/time covers its whole period (e.g. an end date without a time covers that whole day). 
+        Inputs: date/time (string or datetime-like), whether it is the end of a range
+        Outputs: string key
+    """
+    if not isinstance(value, str):
+        value = pd.Timestamp(value)
+        # Midnight starts are written as dates, which sort before both daily and intraday rows of that day
+        if not end and value == value.normalize():
+            return value.strftime("%Y-%m-%d")
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    # A partial date/time (e.g. a date alone) sorts before the rows it covers, so its end is marked with a higher character
+    if end and len(value) < len("YYYY-MM-DD HH:MM:SS"):
+        value = value + "~"
+    return value
+
+def get_end_time(value):
+    """ Turns an end date/time bound into the last timestamp it covers, the way pandas partial-string slicing does. 
+        A partial string covers its whole period (e.g. "2020" runs to the end of 2020, "2020-01-31" to the end of that day). 
+        Inputs: date/time (string or datetime-like)
+        Outputs: Timestamp
+    """
+    if not isinstance(value, str):
+        return pd.Timestamp(value)
+    try:
+        return pd.Period(value).end_time
+    except ValueError:
+        return pd.Timestamp(value)
+
+def find_row_offset(infile, key, lo, hi, side='left', sep=',', scan_bytes=8192):
+    """ Binary-searches the byte offsets of an open file sorted by its first field, instead of reading every row. 
+        Inputs: file open in binary mode, key string, byte offset of the first data row, file size, 
+            side (left: first row at or after key; right: first row after key), file delimiter, 
+            size under which the remaining range is scanned row by row
+        Outputs: byte offset of the first row of the range (or hi if none)
+    """
+    encoded = key.encode('iso8859-1')
+    def before(line):
+        field = line.split(sep.encode('iso8859-1'), 1)[0].strip()
+        return field < encoded if side == 'left' else field <= encoded
+    # Invariant: every row starting before lo is before the key, and hi is the end of the file or a row that is not
+    while hi - lo > scan_bytes:
+        mid = (lo + hi) // 2
+        # Moves to the first row starting at or after mid
+        infile.seek(mid - 1)
+        infile.readline()
+        start = infile.tell()
+        if start >= hi:
+            break
+        line = infile.readline()
+        if before(line):
+            lo = start + len(line)
+        else:
+            hi = start
+    infile.seek(lo)
+    position = lo
+    while position < hi:
+        line = infile.readline()
+        if not line or not before(line):
+            return position
+        position += len(line)
+    return hi
+
+def read_csv_range(filepath, start=None, end=None, sep=',', index_col='timestamp', usecols=None):
+    """ Reads only the rows of a chronological file between two dates/times, located by binary search. 
+        Assumes the rows are sorted by timestamp (as written by download.py and auto_update.py). 
+        Inputs: file path to read, start and end date/time (inclusive, default: unbounded), file delimiter, index column, 
+            columns to parse (default: all)
+        Outputs: dataframe of the rows in range
+    """
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as infile:
+        header = infile.readline()
+        lo = infile.tell()
+        hi = size
+        if start is not None:
+            lo = find_row_offset(infile, get_range_key(start), lo, hi, side='left', sep=sep)
+        if end is not None:
+            hi = find_row_offset(infile, get_range_key(end, end=True), lo, hi, side='right', sep=sep)
+        infile.seek(lo)
+        body = infile.read(max(0, hi - lo))
+    return pd.read_csv(io.BytesIO(header + body), sep=sep, index_col=index_col, usecols=usecols)
+
+def iter_csv_range(filepath, start=None, end=None, sep=',', index_col='timestamp', block_bytes=1 << 23):
+    """ Reads the rows of a chronological file between two dates/times in blocks, so that memory does not grow with the range. 
+        Inputs: file path to read, start and end date/time (inclusive, default: unbounded), file delimiter, index column, 
+            bytes read per block (default: 8 MB)
+        Outputs: generator of dataframes, in file order
+    """
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as infile:
+        header = infile.readline()
+        lo = infile.tell()
+        hi = size
+        if start is not None:
+            lo = find_row_offset(infile, get_range_key(start), lo, hi, side='left', sep=sep)
+        if end is not None:
+            hi = find_row_offset(infile, get_range_key(end, end=True), lo, hi, side='right', sep=sep)
+        infile.seek(lo)
+        rest = b''
+        while lo < hi:
+            block = rest + infile.read(min(block_bytes, hi - lo))
+            lo = infile.tell()
+            # Cuts the block after its last complete row, and carries the partial row over
+            cut = block.rfind(b'\n') + 1 if lo < hi else len(block)
+            rest = block[cut:]
+            if cut > 0:
+                yield pd.read_csv(io.BytesIO(header + block[:cut]), sep=sep, index_col=index_col)
+
+def memory_check(filepath, threshold_ratio=10):
+    """ Checks if file occupies too much RAM on the computer. 
+        Inputs: file path to check, threshold ratio
+        Outputs: none as variables
+    """
+    ram = virtual_memory()
+    filesize = os.path.getsize(filepath)
+    # ram[1] gets the available RAM
+    if filesize > threshold_ratio * ram[1] / 100.0:
+        pct = filesize * 100 / ram[1]
+        logger.warning("File occupies %.2f percent of RAM.", pct)
+    return
+
+def merge_chunked(filepath, leftframe, sep='\t', csize=500000, encoding='iso8859-1'):
+    """ Reads dataframe in chunks and inner-joins with dataframe on left
+        Inputs: file path to read dataframe, column to merge on, reference list, 
+            file delimiter (default: tab), chunk size (default: 100000)
+        Outputs: True if everything works
+    """
+    chunks = pd.read_csv(filepath, sep=sep, chunksize=csize, encoding=encoding)
+    out_df = pd.DataFrame()
+    for chunk in chunks:
+        logger.debug("Currently reading row %8d...", chunk.index[0])
+        chunk_filter = leftframe.merge(chunk, how='inner')
+        out_df = pd.concat([out_df, chunk_filter], axis=0)
+    return out_df
+
+def write_as_append(dataframe, filepath, index=False, header=False, sep='\t'):
+    """ Writes dataframe to file in append mode. 
+        Inputs: dataframe, file path to append to
+        Outputs: True if everything works
+    """
+    with open(filepath, 'a') as outfile:
+        dataframe.to_csv(outfile, sep=sep, header=header, index=index)
+    outfile.close()
     return True
\ No newline at end of file
@@ -0,0 +1,266 @@
+## This code keeps a manifest of the price files in a folder, so that lookups do not have to walk the folder and match file names.
+## Each entry (keyed by file stem, e.g. AAPL_DAILY, USD_EUR_DAILY or AAPL_INTRADAY&1min) records symbol, function, interval,
+## file name, row count, first/last timestamp, size, CRC-32 checksum and validation status (whether the file was normalized when written).
+## Writers in download.py and auto_update.py keep it current.
+## Author: Miguel Opeña
+## Version: 1.1.0
+
+import datetime
+import json
+import logging
+import numpy as np
+import os
+import pandas as pd
+import sys
+import threading
+import zlib
+
+from command_parser import CCmdParser
+import io_support
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+MANIFEST_FILE = "manifest.json"
+DATATYPE = "csv"
+# Time series functions, longest first so that DAILY_ADJUSTED is not read as DAILY
+FUNCTIONS = ["DAILY_ADJUSTED", "WEEKLY_ADJUSTED", "MONTHLY_ADJUSTED", "INTRADAY", "DAILY", "WEEKLY", "MONTHLY"]
+BLOCKSIZE = 1 << 20
+
+def parse_stem(stem):
+	""" Splits a file stem into its parts, following the naming convention of download.py.
+		Inputs: file stem (e.g. AAPL_DAILY, USD_EUR_DAILY or AAPL_INTRADAY&1min)
+		Outputs: tuple of (symbol string, function, interval), or None if the stem does not follow the convention
+	"""
+	name, _, interval = stem.partition("&")
+	for function in FUNCTIONS:
+		if name.endswith("_" + function) and len(name) > len(function) + 1:
+			return name[:-len(function) - 1], function, interval
+	return None
+
+class CManifest:
+	""" A class to look up the price files in a folder in constant time """
+	def __init__(self, folderpath):
+		self.folderpath = folderpath
+		self.filepath = os.path.join(folderpath, MANIFEST_FILE)
+		self.entries = {}
+		self.lock = threading.Lock()
+		if os.path.isfile(self.filepath):
+			with open(self.filepath, 'r') as infile:
+				self.entries = json.load(infile)['entries']
+		# Index of stems by (function, interval), for listing one kind of file
+		self.by_kind = {}
+		for stem, entry in self.entries.items():
+			self.by_kind.setdefault((entry['function'], entry['interval']), set()).add(stem)
+
+	def save(self):
+		""" Writes the manifest atomically. """
+		with self.lock:
+			output = json.dumps({'entries': self.entries}, indent=1, sort_keys=True)
+		with open(self.filepath + ".tmp", 'w') as outfile:
+			outfile.write(output)
+		os.replace(self.filepath + ".tmp", self.filepath)
+
+	def _scan(self, filepath, offset=0, checksum=0, newlines=0):
+		""" Reads a file from an offset, continuing a checksum and a newline count. """
+		head = b''
+		with open(filepath, 'rb') as infile:
+			infile.seek(offset)
+			for block in iter(lambda: infile.read(BLOCKSIZE), b''):
+				checksum = zlib.crc32(block, checksum)
+				newlines += block.count(b'\n')
+				if offset == 0 and len(head) < 4096:
+					head += block[:4096]
+		return checksum, newlines, head
+
+	def _set(self, stem, entry):
+		with self.lock:
+			self.entries[stem] = entry
+			self.by_kind.setdefault((entry['function'], entry['interval']), set()).add(stem)
+
+	def record(self, filepath, save=True, validation=None):
+		""" Records a file that was written in full, reading it once for its row count, range and checksum.
+			Inputs: path of file, order to save the manifest (default: Yes), 
+				validation status from io_support.normalize_bars (default: none, i.e. not known to be clean)
+			Outputs: manifest entry (None if the file name does not follow the naming convention)
+		"""
+		file = os.path.basename(filepath)
+		parts = parse_stem(file[:-len(DATATYPE) - 1]) if file.endswith("." + DATATYPE) else None
+		if parts is None:
+			return None
+		checksum, newlines, head = self._scan(filepath)
+		size = os.path.getsize(filepath)
+		lines = head.split(b'\n')
+		first = lines[1].decode('iso8859-1').split(',')[0] if len(lines) > 1 and lines[1].strip() else None
+		entry = {'symbol': parts[0], 'function': parts[1], 'interval': parts[2], 'file': file,
+			'rows': max(0, newlines - 1), 'first': first, 'last': io_support.get_last_timestamp(filepath),
+			'size': size, 'mtime': os.path.getmtime(filepath), 'newlines': newlines, 'checksum': "{:08x}".format(checksum),
+			'clean': validation is not None and validation['clean'], 'ohlc_errors': validation['ohlc_errors'] if validation is not None else None}
+		self._set(file[:-len(DATATYPE) - 1], entry)
+		if save:
+			self.save()
+		return entry
+
+	def record_append(self, filepath, save=True, validation=None):
+		""" Records rows appended to a file, reading only the bytes past the recorded size.
+			Falls back to record if the file is unknown or shrank.
+			Inputs: path of file, order to save the manifest (default: Yes), 
+				validation status of the appended rows (default: none, i.e. the file is no longer known to be clean)
+			Outputs: manifest entry
+		"""
+		stem = os.path.basename(filepath)[:-len(DATATYPE) - 1]
+		old = self.entries.get(stem)
+		if old is None or os.path.getsize(filepath) < old['size']:
+			return self.record(filepath, save=save)
+		# Appended rows keep a clean file clean only if they were normalized and all come after its last row
+		clean = old.get('clean', False) and validation is not None and validation['clean']
+		checksum, newlines, _ = self._scan(filepath, offset=old['size'], checksum=int(old['checksum'], 16), newlines=old['newlines'])
+		entry = dict(old)
+		entry.update({'rows': max(0, newlines - 1), 'last': io_support.get_last_timestamp(filepath), 'size': os.path.getsize(filepath),
+			'mtime': os.path.getmtime(filepath), 'newlines': newlines, 'checksum': "{:08x}".format(checksum), 'clean': clean,
+			'ohlc_errors': old['ohlc_errors'] + validation['ohlc_errors'] if clean else None})
+		if entry['first'] is None:
+			return self.record(filepath, save=save)
+		self._set(stem, entry)
+		if save:
+			self.save()
+		return entry
+
+	def sync(self, save=True):
+		""" Brings the manifest in line with the folder: new or changed files are recorded, deleted files dropped.
+			Only file sizes and modification times are compared, so unchanged files are not read.
+			Inputs: order to save the manifest (default: Yes)
+			Outputs: number of entries recorded or dropped
+		"""
+		changes = 0
+		seen = set()
+		for dir_entry in os.scandir(self.folderpath):
+			if not dir_entry.is_file() or not dir_entry.name.endswith("." + DATATYPE):
+				continue
+			stem = dir_entry.name[:-len(DATATYPE) - 1]
+			stat = dir_entry.stat()
+			seen.add(stem)
+			old = self.entries.get(stem)
+			if old is not None and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime:
+				continue
+			if self.record(dir_entry.path, save=False) is not None:
+				changes += 1
+		with self.lock:
+			for stem in set(self.entries) - seen:
+				entry = self.entries.pop(stem)
+				self.by_kind[(entry['function'], entry['interval'])].discard(stem)
+				changes += 1
+		if save:
+			self.save()
+		return changes
+
+	def is_clean(self, filepath):
+		""" Checks if a file was normalized when written (sorted, de-duplicated, no blank rows) and has not changed since. """
+		entry = self.entries.get(os.path.basename(filepath)[:-len(DATATYPE) - 1])
+		if entry is None or not entry.get('clean', False):
+			return False
+		stat = os.stat(filepath)
+		return entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime
+
+	def get(self, symbol, function="DAILY", interval=""):
+		""" Returns the entry of a symbol (String or tuple object), or None if it has no file. """
+		return self.entries.get(io_support.get_file_stem(symbol, function, interval))
+
+	def has(self, symbol, function="DAILY", interval=""):
+		return io_support.get_file_stem(symbol, function, interval) in self.entries
+
+	def get_path(self, stem):
+		return os.path.join(self.folderpath, self.entries[stem]['file'])
+
+	def stems(self, function="DAILY", interval=None):
+		""" Returns the stems of one kind of file (any interval if interval is None). """
+		return sorted(stem for (entry_function, entry_interval), stems in self.by_kind.items() for stem in stems
+			if entry_function == function and (interval is None or entry_interval == interval))
+
+	def symbols(self, function="DAILY", interval=None):
+		""" Returns the symbols (forex pairs as FROM_TO) with a file of one kind (any interval if interval is None). """
+		return [self.entries[stem]['symbol'] for stem in self.stems(function, interval)]
+
+	def stale(self, function="DAILY", interval=None, now=None, max_days=1):
+		""" Returns the stems whose last timestamp is more than a number of business days old.
+			Inputs: function, interval (default: any), current date/time (default: now),
+				business days allowed since the last timestamp (default: 1)
+			Outputs: list of stems
+		"""
+		now = datetime.datetime.now() if now is None else now
+		stems = self.stems(function, interval)
+		last = [self.entries[stem]['last'] for stem in stems]
+		# Files without a complete row are always stale
+		last_days = np.array([str(pd.Timestamp(date).date()) if date is not None else '1900-01-01' for date in last], dtype='datetime64[D]')
+		age = np.busday_count(last_days, np.datetime64(now.date()))
+		return [stem for stem, days in zip(stems, age) if days > max_days]
+
+# Manifests already loaded, keyed by folder path
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+def get_manifest(folderpath, create=True):
+	""" Returns the manifest of a folder, shared within the process. The first use builds it if the folder has none.
+		Inputs: path of folder, order to build the manifest if the folder has none (default: Yes)
+		Outputs: CManifest instance (None if the folder has none and create is False)
+	"""
+	key = os.path.abspath(folderpath)
+	with _manifests_lock:
+		manifest = _manifests.get(key)
+		if manifest is None:
+			if not create and not os.path.isfile(os.path.join(folderpath, MANIFEST_FILE)):
+				return None
+			manifest = CManifest(folderpath)
+			if not os.path.isfile(manifest.filepath):
+				logger.info("No manifest found in %s, building one...", folderpath)
+				manifest.sync()
+			_manifests[key] = manifest
+	return manifest
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here are some examples of how to run this program:
+
+		python manifest.py -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily
+			This will bring the manifest of the folder up to date with the files in it.
+
+		python manifest.py -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -stale 1
+			This will also list the DAILY files whose last row is more than 1 business day old.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	function = cmdparser.get_generic(query="-function", default="DAILY", req=False)
+	max_days = cmdparser.get_generic(query="-stale", default="", req=False)
+	manifest = get_manifest(folder_path)
+	changes = manifest.sync()
+	logger.info("Manifest of %s: %d entries, %d changed", folder_path, len(manifest.entries), changes)
+	if max_days != "":
+		for stem in manifest.stale(function=function, max_days=int(max_days)):
+			logger.info("Stale: %s (last row %s)", stem, manifest.entries[stem]['last'])
+	return 0
+
+if __name__ == "__main__":
+	main()
@@ -1,12 +1,14 @@
 ## General program to add metadata to the Financials JSON files.
 ## Author: Miguel Opeña
-## Version: 1.0.7
+## Version: 1.1.0
 
 from datetime import datetime
+import io
 import logging
 import os
 import pandas as pd
 
+import http_client
 import io_support
 
 LOGDIR = "/Users/openamiguel/Desktop/LOG"
@@ -44,7 +46,7 @@ def stock_split(folderpath, link="http://eoddata.com/splits.aspx", datasource="E
         Outputs: table of relevant stock split data
 	"""
 	# Reads data from link
-	data = pd.read_html(link)
+	data = pd.read_html(io.StringIO(http_client.get_client().get_text(link)))
 	# Hardcoded for the default link (no other choice?)
 	table = data[2]
 	table.columns = ['exchange', 'symbol', 'date', 'ratio']
@@ -60,7 +62,7 @@ def stock_split(folderpath, link="http://eoddata.com/splits.aspx", datasource="E
 	logger.debug("List of symbols: %s", str(table.symbol))
 	for idx in table.index:
 		this_symbol = table.symbol[idx]
-		if this_symbol not rrin current_symbols: continue
+		if this_symbol not in current_symbols: continue
 		# Saves date effective and ratio
 		this_date_effective = table.date[idx]
 		this_ratio = table.ratio[idx]
@@ -0,0 +1,317 @@
+## This code runs a local stand-in for the AlphaVantage API, for offline load testing of the downloaders.
+## Serves TIME_SERIES_* and FX_* CSV responses from recorded fixtures or synthetic random walks.
+## Author: Miguel Opeña
+## Version: 1.0.1
+
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import numpy as np
+import os
+import pandas as pd
+import random
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import zlib
+
+from command_parser import CCmdParser
+import http_client
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Number of rows AlphaVantage returns for outputsize=compact
+COMPACT_ROWS = 100
+# Number of trading days generated for synthetic daily data (about 20 years)
+FULL_DAYS = 5000
+# Number of trading days generated for synthetic intraday data
+INTRADAY_DAYS = 5
+# Responses AlphaVantage gives (with HTTP 200) for unknown symbols and for exceeding the call frequency
+NOT_FOUND_MESSAGE = "Invalid API call. Please retry or visit the documentation (https://www.alphavantage.co/documentation/) for {}."
+THROTTLE_MESSAGE = "Thank you for using Alpha Vantage! Our standard API call frequency is {} calls per minute. Please visit https://www.alphavantage.co/premium/ if you would like to target a higher API call frequency."
+
+class CMockAlphaVantage:
+	""" A class to serve AlphaVantage-style CSV responses from a local HTTP server """
+	def __init__(self, host="127.0.0.1", port=0, fixture_path=None, latency=0.0, jitter=0.0,
+		    rate_limit=0, error_rate=0.0, missing=None, compress=True, seed=0):
+		self.host = host
+		self.port = port
+		# Folder of files named as CDownloader writes them (e.g. AAPL_DAILY.csv); synthetic data if None
+		self.fixture_path = fixture_path
+		# Seconds added to every response, plus uniform random jitter
+		self.latency = latency
+		self.jitter = jitter
+		# Maximum calls per minute before the throttle note is returned (0 means unlimited)
+		self.rate_limit = rate_limit
+		# Fraction of requests answered with HTTP 503
+		self.error_rate = error_rate
+		# Symbols which are answered with the "not found" error message
+		self.missing = set(missing) if missing is not None else set()
+		self.compress = compress
+		self.seed = seed
+		self.random = random.Random(seed)
+		# Cache of full CSV bodies, keyed by (function, symbol, interval)
+		self.bodies = {}
+		self.calls = []
+		self.stats = {'requests': 0, 'served': 0, 'not_found': 0, 'throttled': 0, 'errors': 0, 'bytes': 0}
+		self.lock = threading.Lock()
+		self.server = None
+		self.thread = None
+
+	@property
+	def main_url(self):
+		""" Start of the URL for queries, to be passed to CDownloader as main_url """
+		return "http://{}:{}/query?".format(self.host, self.port)
+
+	def start(self):
+		""" Starts serving in a background thread.
+			Inputs: none
+			Outputs: main URL to point the downloaders at
+		"""
+		mock = self
+		class Handler(CMockHandler):
+			server_mock = mock
+		self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+		self.server.daemon_threads = True
+		self.port = self.server.server_address[1]
+		self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+		self.thread.start()
+		logger.info("Mock AlphaVantage server listening at %s", self.main_url)
+		return self.main_url
+
+	def stop(self):
+		""" Stops the background server. """
+		if self.server is not None:
+			self.server.shutdown()
+			self.server.server_close()
+			self.server = None
+		logger.info("Mock AlphaVantage server stopped: %s", str(self.stats))
+
+	def _count(self, key, num=1):
+		with self.lock:
+			self.stats[key] += num
+
+	def _throttled(self):
+		""" Checks the sliding one-minute window of calls against the rate limit. """
+		if self.rate_limit <= 0:
+			return False
+		now = time.time()
+		with self.lock:
+			self.calls = [t for t in self.calls if now - t < 60]
+			if len(self.calls) >= self.rate_limit:
+				return True
+			self.calls.append(now)
+		return False
+
+	def _synthetic(self, function, symbol_str, interval, forex):
+		""" Generates a reproducible random walk of OHLC(V) bars for the symbol, in chronological order. """
+		rng = np.random.RandomState(zlib.crc32("{}|{}|{}".format(symbol_str, function, interval).encode()) ^ self.seed)
+		end = pd.Timestamp.today().normalize()
+		if function == "INTRADAY":
+			minutes = int(interval.replace("min", "")) if interval else 1
+			days = pd.bdate_range(end=end, periods=INTRADAY_DAYS)
+			offsets = pd.timedelta_range(start="09:30:00", end="16:00:00", freq="{}min".format(minutes))[1:]
+			timestamp = pd.DatetimeIndex([day + offset for day in days for offset in offsets])
+			fmt = "%Y-%m-%d %H:%M:%S"
+		else:
+			timestamp = pd.bdate_range(end=end, periods=FULL_DAYS)
+			# Weekly and monthly bars are stamped on the last trading day of each period
+			if function in ("WEEKLY", "MONTHLY"):
+				periods = timestamp.to_period("W-FRI" if function == "WEEKLY" else "M")
+				timestamp = pd.DatetimeIndex(pd.Series(timestamp, index=timestamp).groupby(periods).max().values)
+			fmt = "%Y-%m-%d"
+		num = len(timestamp)
+		scale = 0.005 if forex else 0.02
+		close = (1.0 if forex else 50.0) * np.exp(np.cumsum(rng.normal(0, scale, num)))
+		spread = np.abs(rng.normal(0, scale / 2, (2, num))) * close
+		open_price = close * np.exp(rng.normal(0, scale / 4, num))
+		frame = pd.DataFrame({'open': open_price, 'high': np.maximum(open_price, close) + spread[0],
+			'low': np.minimum(open_price, close) - spread[1], 'close': close}, index=timestamp.strftime(fmt))
+		if not forex:
+			frame['volume'] = rng.randint(100000, 10000000, num)
+		frame.index.name = 'timestamp'
+		return frame.round(4)
+
+	def _fixture(self, function, symbol_str, interval):
+		""" Reads a recorded fixture in chronological order, or None if absent. """
+		filepath = os.path.join(self.fixture_path, symbol_str + "_" + function + ("&" + interval if interval else "") + ".csv")
+		if not os.path.isfile(filepath):
+			return None
+		return pd.read_csv(filepath, index_col='timestamp')
+
+	def get_body(self, query):
+		""" Builds the response for one parsed query.
+			Inputs: dictionary of query parameters
+			Outputs: HTTP status, content type, response body as bytes
+		"""
+		api_function = query.get('function', '')
+		forex = api_function.startswith("FX_")
+		if not forex and not api_function.startswith("TIME_SERIES_"):
+			return 200, 'application/json', json.dumps({"Error Message": NOT_FOUND_MESSAGE.format(api_function)}, indent=4).encode()
+		function = api_function.split("_")[-1]
+		interval = query.get('interval', '') if function == "INTRADAY" else ''
+		symbol_str = query.get('from_symbol', '') + "_" + query.get('to_symbol', '') if forex else query.get('symbol', '')
+		# Injects AlphaVantage's unknown-symbol case, which load_single handles through ValueError
+		if symbol_str in self.missing or query.get('datatype', 'csv') != 'csv':
+			self._count('not_found')
+			return 200, 'application/json', json.dumps({"Error Message": NOT_FOUND_MESSAGE.format(api_function)}, indent=4).encode()
+		key = (function, symbol_str, interval)
+		with self.lock:
+			body = self.bodies.get(key)
+		if body is None:
+			frame = self._fixture(function, symbol_str, interval) if self.fixture_path else self._synthetic(function, symbol_str, interval, forex)
+			if frame is None:
+				self._count('not_found')
+				return 200, 'application/json', json.dumps({"Error Message": NOT_FOUND_MESSAGE.format(api_function)}, indent=4).encode()
+			# AlphaVantage serves the most recent rows first
+			body = frame.iloc[::-1].to_csv().encode()
+			with self.lock:
+				self.bodies[key] = body
+		if query.get('outputsize', 'compact') == 'compact':
+			body = b'\n'.join(body.split(b'\n')[:COMPACT_ROWS + 1]) + b'\n'
+		return 200, 'application/x-download', body
+
+class CMockHandler(BaseHTTPRequestHandler):
+	""" Request handler for CMockAlphaVantage, bound to one server through server_mock """
+	protocol_version = "HTTP/1.1"
+	server_mock = None
+
+	def log_message(self, format, *args):
+		logger.debug("%s - %s", self.address_string(), format % args)
+
+	def _send(self, status, content_type, body):
+		mock = self.server_mock
+		if mock.compress and 'gzip' in self.headers.get('Accept-Encoding', ''):
+			body = gzip.compress(body, compresslevel=1)
+			encoding = 'gzip'
+		else:
+			encoding = None
+		self.send_response(status)
+		self.send_header('Content-Type', content_type)
+		self.send_header('Content-Length', str(len(body)))
+		if encoding:
+			self.send_header('Content-Encoding', encoding)
+		self.end_headers()
+		self.wfile.write(body)
+		mock._count('bytes', len(body))
+
+	def do_GET(self):
+		mock = self.server_mock
+		mock._count('requests')
+		delay = mock.latency + (mock.random.uniform(0, mock.jitter) if mock.jitter else 0)
+		if delay > 0:
+			time.sleep(delay)
+		parsed = urllib.parse.urlsplit(self.path)
+		if parsed.path != "/query":
+			self._send(404, 'text/plain', b'Not found')
+			return
+		if mock.error_rate > 0 and mock.random.random() < mock.error_rate:
+			mock._count('errors')
+			self._send(503, 'text/plain', b'Service temporarily unavailable')
+			return
+		if mock._throttled():
+			mock._count('throttled')
+			self._send(200, 'application/json', json.dumps({"Note": THROTTLE_MESSAGE.format(mock.rate_limit)}, indent=4).encode())
+			return
+		query = dict(urllib.parse.parse_qsl(parsed.query))
+		status, content_type, body = mock.get_body(query)
+		mock._count('served')
+		self._send(status, content_type, body)
+
+def throughput_test(main_url, tickerverse, workers=1, function="DAILY", interval="", output_size="full", forex=False):
+	""" Measures end-to-end download throughput of CDownloader.load_single against a (mock) server.
+		Inputs: main URL of server, ticker universe, number of concurrent download threads,
+			time series function, interval, output size, order to use the forex URL format
+		Outputs: dictionary of symbols downloaded, failures, seconds elapsed, symbols per second, bytes received
+	"""
+	# Imported here so that the server itself does not depend on the downloader
+	from download import CDownloader
+	url_format = "{}function=FX_{}&from_symbol={}&to_symbol={}&apikey={}&datatype={}&outputsize={}" if forex else \
+		"{}function=TIME_SERIES_{}&symbol={}&apikey={}&datatype={}&outputsize={}"
+	folderpath = tempfile.mkdtemp()
+	downloader = CDownloader(folderpath, "demo", function, interval, output_size, url_format=url_format, main_url=main_url)
+	host = urllib.parse.urlsplit(main_url).hostname
+	bytes0 = http_client.get_client().get_metrics().get(host, {}).get('bytes', 0)
+	def fetch(symbol):
+		# Injected errors (e.g. HTTP 503) count as failed downloads instead of stopping the benchmark
+		try:
+			return downloader.load_single(symbol)
+		except urllib.error.URLError as e:
+			logger.debug("%s failed: %s", symbol, e)
+			return None
+	time0 = time.time()
+	with ThreadPoolExecutor(max_workers=workers) as executor:
+		results = list(executor.map(fetch, tickerverse))
+	elapsed = time.time() - time0
+	received = http_client.get_client().get_metrics().get(host, {}).get('bytes', 0) - bytes0
+	failures = sum(1 for result in results if result is None)
+	report = {'symbols': len(results), 'failures': failures, 'seconds': elapsed,
+		'symbols_per_second': len(results) / elapsed if elapsed > 0 else float('inf'), 'bytes': received}
+	logger.info("%d workers: %d symbols (%d failed) in %.2f seconds, %.1f symbols per second, %d bytes",
+		workers, report['symbols'], failures, elapsed, report['symbols_per_second'], received)
+	return report
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here are some examples of how to run this program:
+
+		python mock_server.py -port 8080 -latency 0.2 -rateLimit 5 -errorRate 0.01
+			This will serve synthetic data at http://127.0.0.1:8080/query? until interrupted.
+
+		python mock_server.py -fixturePath C:/Users/Miguel/Documents/EQUITIES/stockDaily -benchmark 1,4,16 -tickerUniverse AAPL,MSFT,GS
+			This will serve recorded files and report download throughput for 1, 4 and 16 concurrent workers.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	port = int(cmdparser.get_generic(query="-port", default="0", req=False))
+	fixture_path = cmdparser.get_generic(query="-fixturePath", default=None, req=False)
+	latency = float(cmdparser.get_generic(query="-latency", default="0", req=False))
+	rate_limit = int(cmdparser.get_generic(query="-rateLimit", default="0", req=False))
+	error_rate = float(cmdparser.get_generic(query="-errorRate", default="0", req=False))
+	missing = cmdparser.get_generic(query="-missing", default="", req=False)
+	mock = CMockAlphaVantage(port=port, fixture_path=fixture_path, latency=latency, rate_limit=rate_limit,
+		error_rate=error_rate, missing=[x for x in missing.split(",") if x])
+	main_url = mock.start()
+	## Handles the optional throughput benchmark
+	if "-benchmark" in prompts:
+		tickerverse, name = cmdparser.get_tickerverse()
+		for workers in cmdparser.get_generic(query="-benchmark").split(","):
+			throughput_test(main_url, tickerverse, workers=int(workers))
+		mock.stop()
+		return 0
+	try:
+		while True:
+			time.sleep(1)
+	except KeyboardInterrupt:
+		mock.stop()
+	return 0
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,156 @@
+## This code resamples the returns of a portfolio into many synthetic equity paths at once, to give distributions instead of point estimates
+## of terminal return, Sharpe ratio and maximum drawdown. Paths are drawn i.i.d. or in blocks (which keeps short-range dependence),
+## and built in chunks of paths so that memory stays bounded; chunks can run on a process pool.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import numpy as np
+import os
+import pandas as pd
+from psutil import virtual_memory
+import sys
+import time
+
+from command_parser import CCmdParser
+import download
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Approximate bytes used per (path, period) cell while a chunk is built, intermediate arrays included
+BYTES_PER_CELL = 48
+# Largest chunk of paths by default, and share of the available RAM it may use
+MAX_CHUNK_BYTES = 1 << 28
+MEMORY_RATIO = 0.25
+STATISTICS = ['terminal_return', 'sharpe', 'max_drawdown']
+
+def get_returns(portfolio):
+	""" Returns the simple returns of a portfolio value (or price) series, as an array without missing values. """
+	values = np.asarray(portfolio, dtype=float)
+	values = values[~np.isnan(values)]
+	return values[1:] / values[:-1] - 1
+
+def sample_indices(rng, num_paths, num_periods, num_returns, block=None):
+	""" Draws which historical returns make up each path.
+		Inputs: NumPy random generator, number of paths and periods, number of historical returns,
+			block length (default: None, i.e. i.i.d. draws; otherwise circular blocks of consecutive returns)
+		Outputs: paths x periods array of indices
+	"""
+	if block is None or block <= 1:
+		return rng.integers(0, num_returns, size=(num_paths, num_periods))
+	num_blocks = -(-num_periods // block)
+	starts = rng.integers(0, num_returns, size=(num_paths, num_blocks, 1))
+	return ((starts + np.arange(block)) % num_returns).reshape(num_paths, num_blocks * block)[:, :num_periods]
+
+def simulate_paths(returns, indices):
+	""" Builds the equity paths (starting at 1) of resampled returns.
+		Inputs: array of historical returns, paths x periods array of indices
+		Outputs: paths x periods array of equity
+	"""
+	return np.cumprod(1 + returns[indices], axis=1)
+
+def path_statistics(returns, indices, periods_per_year=252, risk_free_rate=0.0):
+	""" Computes the statistics of each resampled path.
+		Inputs: array of historical returns, paths x periods array of indices, periods per year, annual risk-free rate (decimal)
+		Outputs: dictionary of arrays, one value per path (terminal return, annualized Sharpe ratio, maximum drawdown)
+	"""
+	path_returns = returns[indices]
+	equity = np.cumprod(1 + path_returns, axis=1)
+	excess = path_returns - risk_free_rate / periods_per_year
+	with np.errstate(divide='ignore', invalid='ignore'):
+		sharpe = excess.mean(axis=1) / path_returns.std(axis=1, ddof=1) * np.sqrt(periods_per_year)
+	# Drawdowns are measured from the running peak, which starts at the initial value of 1
+	peak = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+	return {'terminal_return': equity[:, -1] - 1, 'sharpe': sharpe, 'max_drawdown': (1 - equity / peak).max(axis=1)}
+
+def simulate_chunk(returns, num_paths, num_periods, block, seed, periods_per_year=252, risk_free_rate=0.0):
+	""" Draws and summarizes one chunk of paths (the unit of work of a process pool). """
+	rng = np.random.default_rng(seed)
+	indices = sample_indices(rng, num_paths, num_periods, len(returns), block=block)
+	return path_statistics(returns, indices, periods_per_year=periods_per_year, risk_free_rate=risk_free_rate)
+
+def bootstrap(returns, num_paths=10000, num_periods=None, block=None, seed=0, workers=0, max_bytes=None,
+		periods_per_year=252, risk_free_rate=0.0):
+	""" Resamples returns into many synthetic paths, and reports the statistics of each path.
+		Results do not depend on the number of workers: every chunk draws from its own seed, spawned from the given one.
+		Inputs: array of historical returns (see get_returns), number of paths, periods per path (default: as many as the history),
+			block length (default: None, i.i.d.), random seed, number of processes (default: 0, i.e. this process),
+			memory budget in bytes for a chunk (default: the smaller of 256 MB and a quarter of the available RAM),
+			periods per year, annual risk-free rate (decimal)
+		Outputs: dataframe with one row per path (terminal return, Sharpe ratio, maximum drawdown)
+	"""
+	time0 = time.time()
+	returns = np.asarray(returns, dtype=float)
+	num_periods = len(returns) if num_periods is None else num_periods
+	max_bytes = min(MAX_CHUNK_BYTES, MEMORY_RATIO * virtual_memory().available) if max_bytes is None else max_bytes
+	chunk = int(min(num_paths, max(1, max_bytes // (BYTES_PER_CELL * num_periods))))
+	sizes = [min(chunk, num_paths - lo) for lo in range(0, num_paths, chunk)]
+	seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+	args = [(returns, size, num_periods, block, chunk_seed, periods_per_year, risk_free_rate) for size, chunk_seed in zip(sizes, seeds)]
+	if workers == 0:
+		outputs = [simulate_chunk(*arg) for arg in args]
+	else:
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			outputs = list(executor.map(simulate_chunk, *zip(*args)))
+	results = pd.DataFrame({statistic: np.concatenate([output[statistic] for output in outputs]) for statistic in STATISTICS})
+	logger.info("Simulated %d paths of %d periods in %.2f seconds (%d chunks)", num_paths, num_periods, time.time() - time0, len(sizes))
+	return results
+
+def summarize(results, quantiles=[0.05, 0.25, 0.5, 0.75, 0.95]):
+	""" Summarizes the distribution of each statistic across paths.
+		Inputs: dataframe from bootstrap, list of quantiles
+		Outputs: dataframe with one row per statistic (mean, standard deviation and quantiles)
+	"""
+	summary = results.quantile(quantiles).T
+	summary.columns = ["q{:g}".format(100 * quantile) for quantile in quantiles]
+	summary.insert(0, 'std', results.std())
+	summary.insert(0, 'mean', results.mean())
+	return summary
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here is an example of how to run this program:
+
+		python monte_carlo.py -symbol AAPL -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -paths 100000 -block 20 -workers 4
+			This will resample the daily returns of AAPL into 100,000 paths in blocks of 20 days, on 4 processes,
+			and log the distributions of terminal return, Sharpe ratio and maximum drawdown.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	symbol = cmdparser.get_generic(query="-symbol")
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	num_paths = int(cmdparser.get_generic(query="-paths", default="10000", req=False))
+	block = int(cmdparser.get_generic(query="-block", default="0", req=False))
+	workers = int(cmdparser.get_generic(query="-workers", default="0", req=False))
+	loader = download.CLoader(folder_path)
+	tick_data = loader.load_single_drive(symbol)
+	results = bootstrap(get_returns(tick_data.close), num_paths=num_paths, block=block or None, workers=workers)
+	logger.info("Distributions over %d paths:\n%s", num_paths, summarize(results).to_string())
+	return 0
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,219 @@
+## This code searches grids of strategy parameters across a universe of symbols, on a pool of processes.
+## The price panel is placed once in shared memory, which every worker maps instead of receiving a copy.
+## Walk-forward windows train on one range of dates and test on the next; all results go to one columnar table.
+## Author: Miguel Opeña
+## Version: 1.0.2
+
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import numpy as np
+import os
+import pandas as pd
+from multiprocessing import shared_memory
+import sys
+import time
+
+from command_parser import CCmdParser
+import backtest
+import download
+import strategy
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+CROSSOVER = "crossover"
+ZSCORE = "zscore"
+METRICS = ['mean_return', 'sharpe', 'bankrupt']
+# Price panel and moving averages of the current process (set by attach_panel)
+_panel = {'prices': None, 'memory': None, 'averages': {}}
+
+def crossover_grid(trends, baselines, switches=(False,)):
+	""" Builds the grid of crossover parameters (trend window shorter than baseline window).
+		Inputs: lists of trend and baseline moving average windows, list of switch options
+		Outputs: dataframe with one row per configuration (trend, baseline, switch)
+	"""
+	rows = [(trend, base, switch) for trend in trends for base in baselines for switch in switches if trend < base]
+	return pd.DataFrame(rows, columns=['trend', 'baseline', 'switch'])
+
+def zscore_grid(trends, baselines, buys, clears, sells, windows=(0,), switches=(False,)):
+	""" Builds the grid of z-score distance parameters.
+		Inputs: lists of trend and baseline moving average windows, of buy, clear and sell z-scores,
+			of normalization windows (0 for expanding, or a rolling window in bars; the full-sample option looks ahead and is left out),
+			and of switch options
+		Outputs: dataframe with one row per configuration (trend, baseline, buy, clear, sell, window, switch)
+	"""
+	rows = [(trend, base, buy, clear, sell, window, switch) for trend in trends for base in baselines if trend < base
+		for buy in buys for clear in clears for sell in sells if buy < sell for window in windows for switch in switches]
+	return pd.DataFrame(rows, columns=['trend', 'baseline', 'buy', 'clear', 'sell', 'window', 'switch'])
+
+def walk_forward_folds(num_dates, train_size, test_size, step=None):
+	""" Splits a range of dates into rolling train/test windows.
+		Inputs: number of dates, train and test window lengths in bars, step between folds (default: test length)
+		Outputs: list of (train start, train end, test start, test end) row bounds
+	"""
+	step = test_size if step is None else step
+	return [(lo, lo + train_size, lo + train_size, lo + train_size + test_size)
+		for lo in range(0, num_dates - train_size - test_size + 1, step)]
+
+def attach_panel(name, shape, dtype):
+	""" Maps the shared price panel into the current process (worker initializer). """
+	memory = shared_memory.SharedMemory(name=name)
+	_panel['memory'] = memory
+	_panel['prices'] = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+	_panel['averages'] = {}
+
+def get_average(window):
+	""" Returns the moving average of every symbol in the panel, computed once per process and window. """
+	if window not in _panel['averages']:
+		_panel['averages'][window] = pd.DataFrame(_panel['prices']).rolling(window).mean().to_numpy()
+	return _panel['averages'][window]
+
+def get_signals(strategy_name, params, lo, hi):
+	""" Computes the signals of a chunk of configurations between two rows of the panel.
+		Outputs: dates x symbols x configurations int8 array
+	"""
+	signals = []
+	for config in params:
+		# Moving averages use only past prices, so they are sliced from the full panel without looking ahead
+		trend = get_average(int(config['trend']))[lo:hi]
+		baseline = get_average(int(config['baseline']))[lo:hi]
+		if strategy_name == CROSSOVER:
+			signals.append(strategy.crossover_signals(trend, baseline, switch=bool(config['switch'])))
+		else:
+			window = "expanding" if config['window'] == 0 else int(config['window'])
+			zscores = [config['buy'], config['clear'], config['sell']]
+			signals.append(strategy.zscore_signals(trend, baseline, zscores=zscores, window=window, switch=bool(config['switch'])))
+	return np.stack(signals, axis=2)
+
+def evaluate_chunk(strategy_name, params, segments, periods_per_year=252, backtest_args=None):
+	""" Backtests a chunk of configurations on every symbol, over each segment of dates.
+		Inputs: strategy name, list of configuration dictionaries, list of (start row, end row) segments,
+			periods per year (for annualizing), keyword arguments of backtest.batch_backtest (default: none)
+		Outputs: dictionary of segments x configurations arrays, one per metric (averaged over symbols)
+	"""
+	backtest_args = backtest_args or {}
+	metrics = {metric: np.empty((len(segments), len(params))) for metric in METRICS}
+	for k, (lo, hi) in enumerate(segments):
+		# Only the per-account summaries are needed, so no dates x symbols x configurations series is kept
+		results = backtest.batch_backtest(_panel['prices'][lo:hi], get_signals(strategy_name, params, lo, hi),
+			**dict(backtest_args, outputs=(), periods_per_year=periods_per_year))
+		sharpe = results['sharpe']
+		metrics['mean_return'][k] = np.nanmean(results['total_return'], axis=0)
+		metrics['sharpe'][k] = np.nanmean(np.where(np.isfinite(sharpe), sharpe, np.nan), axis=0)
+		metrics['bankrupt'][k] = results['bankrupt'].sum(axis=0)
+	return metrics
+
+def optimize(prices, strategy_name, grid, folds=None, workers=4, chunk_size=64, periods_per_year=252, backtest_args=None):
+	""" Evaluates every configuration of a grid on every symbol, in parallel processes sharing one copy of the prices.
+		Inputs: dates x symbols prices (dataframe from CLoader.load_panel), strategy name (crossover or zscore),
+			grid of parameters (from crossover_grid or zscore_grid), walk-forward folds (default: one segment of all dates),
+			number of processes (0 to run in this process), configurations per task, periods per year,
+			keyword arguments of backtest.batch_backtest (default: none)
+		Outputs: results table with one row per configuration, fold and phase (train, test or full):
+			the grid's parameters, then mean return, Sharpe ratio (both averaged over symbols) and accounts out of funds
+	"""
+	time0 = time.time()
+	backtest_args = backtest_args or {}
+	values = np.ascontiguousarray(prices, dtype=float)
+	if folds is None:
+		segments = [(0, len(values))]
+		labels = [(0, "full")]
+	else:
+		segments = [segment for fold in folds for segment in (fold[:2], fold[2:])]
+		labels = [(k, phase) for k in range(len(folds)) for phase in ("train", "test")]
+	params = grid.to_dict('records')
+	chunks = [params[lo:lo + chunk_size] for lo in range(0, len(params), chunk_size)]
+	if workers == 0:
+		_panel.update({'prices': values, 'memory': None, 'averages': {}})
+		outputs = [evaluate_chunk(strategy_name, chunk, segments, periods_per_year, backtest_args) for chunk in chunks]
+	else:
+		memory = shared_memory.SharedMemory(create=True, size=values.nbytes)
+		try:
+			np.ndarray(values.shape, dtype=values.dtype, buffer=memory.buf)[:] = values
+			with ProcessPoolExecutor(max_workers=workers, initializer=attach_panel, initargs=(memory.name, values.shape, values.dtype)) as executor:
+				futures = [executor.submit(evaluate_chunk, strategy_name, chunk, segments, periods_per_year, backtest_args) for chunk in chunks]
+				outputs = [future.result() for future in futures]
+		finally:
+			memory.close()
+			memory.unlink()
+	# Lays the results out column by column: segments vary slowest, then configurations
+	columns = {name: np.tile(grid[name].to_numpy(), len(segments)) for name in grid.columns}
+	columns['config'] = np.tile(np.arange(len(grid)), len(segments))
+	columns['fold'] = np.repeat([fold for fold, _ in labels], len(grid))
+	columns['phase'] = np.repeat([phase for _, phase in labels], len(grid))
+	for metric in METRICS:
+		columns[metric] = np.concatenate([output[metric] for output in outputs], axis=1).ravel()
+	results = pd.DataFrame(columns)
+	logger.info("Evaluated %d configurations on %d symbols over %d segments in %.2f seconds", len(grid), values.shape[1], len(segments), time.time() - time0)
+	return results
+
+def walk_forward_summary(results, metric="sharpe"):
+	""" Picks the best configuration of each fold on its train window, and reports how it did on the test window.
+		Inputs: results table from optimize with walk-forward folds, metric to rank by (default: sharpe)
+		Outputs: dataframe with one row per fold (best configuration, its train and test metrics)
+	"""
+	train = results[results.phase == "train"]
+	test = results[results.phase == "test"].set_index(['fold', 'config'])
+	best = train.loc[train.groupby('fold')[metric].idxmax().dropna()]
+	summary = best.set_index(['fold', 'config'])
+	summary = summary.join(test[METRICS], rsuffix='_test').reset_index()
+	return summary.drop(columns='phase')
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here is an example of how to run this program:
+
+		python optimizer.py -tickerUniverse DOW30 -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -strategy crossover -train 504 -test 126 -outPath C:/Users/Miguel/Documents/results.csv
+			This will search crossover windows on every Dow 30 stock, walking forward two years of training and half a year of testing at a time,
+			and write the results table to outPath.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	tickerverse, _ = cmdparser.get_tickerverse()
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	strategy_name = cmdparser.get_generic(query="-strategy", default=CROSSOVER, req=False)
+	train_size = int(cmdparser.get_generic(query="-train", default="0", req=False))
+	test_size = int(cmdparser.get_generic(query="-test", default="0", req=False))
+	workers = int(cmdparser.get_generic(query="-workers", default="4", req=False))
+	out_path = cmdparser.get_generic(query="-outPath", default="", req=False)
+	loader = download.CLoader(folder_path)
+	prices = loader.load_panel(tickerverse)
+	windows = [5, 10, 20, 30, 50, 90, 120, 200]
+	if strategy_name == CROSSOVER:
+		grid = crossover_grid(windows, windows, switches=(False, True))
+	else:
+		grid = zscore_grid(windows, windows, buys=[-2, -1.5, -1], clears=[0.25, 0.5], sells=[1, 1.5, 2], windows=(0, 60))
+	folds = walk_forward_folds(len(prices), train_size, test_size) if train_size > 0 and test_size > 0 else None
+	results = optimize(prices, strategy_name, grid, folds=folds, workers=workers)
+	if out_path != "":
+		results.to_csv(out_path, index=False)
+	if folds is None:
+		logger.info("Best configurations:\n%s", results.sort_values('sharpe', ascending=False).head(10).to_string())
+	else:
+		logger.info("Walk-forward selections:\n%s", walk_forward_summary(results).to_string())
+	return 0
+
+if __name__ == "__main__":
+	main()
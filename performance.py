@@ -1,116 +1,178 @@
-## This code assesses portfolios from portfolio.py using risk metrics and return plots. 
-## Author: Miguel Opeña
-## Version: 1.4.4
-
-import logging
-import numpy as np
-import os
-import pandas as pd
-
-import download
-import plotter
-import portfolio
-import return_calculator
-import strategy
-import technicals as ti
-
-LOGDIR = "/Users/openamiguel/Desktop/LOG"
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-# Set file path for logger
-handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
-handler.setLevel(logging.DEBUG)
-# Format the logger
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-# Add the new format
-logger.addHandler(handler)
-# Format the console logger
-consoleHandler = logging.StreamHandler()
-consoleHandler.setLevel(logging.INFO)
-consoleHandler.setFormatter(formatter)
-# Add the new format to the logger file
-logger.addHandler(consoleHandler)
-
-logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
-
-def beta(price, baseline):
-    """ Calculates the Sharpe ratio of the given asset/portfolio against baseline.
-        Inputs: price Series, baseline Series
-        Outputs: beta of portfolio
-    """
-    price_baseline = pd.concat([price, baseline], axis=1)
-    price_baseline.columns = ['price', 'baseline']
-    cov = price_baseline.cov()
-    var = baseline.var()
-    return cov.baseline[0] / var
-
-def sharpe_ratio(portfolio, risk_free_rate=1.94):
-    """ Calculates the Sharpe ratio of the given portfolio.
-        Inputs: portfolio Series, risk-free interest rate
-        Outputs: Sharpe ratio of portfolio
-    """
-    price = portfolio.values.tolist()
-    returns = np.array(return_calculator.get_rolling_returns(price))
-    # Uses the classic formula for Sharpe
-    sharpe = (returns.mean() - risk_free_rate) / (returns.std())
-    return sharpe
-
-def treynor_ratio(portfolio, baseline, risk_free_rate=1.94):
-    """ Calculates the Treynor ratio of the given portfolio.
-        Inputs: portfolio Series, baseline Series, risk-free interest rate
-        Outputs: Treynor ratio of portfolio
-    """
-    price = portfolio.values.tolist()
-    price_returns = np.array(return_calculator.get_rolling_returns(price))
-    treynor = (price_returns.mean() - risk_free_rate) / np.array(beta(price, baseline))
-    return treynor
-
-def returns_valuation(portfolio, baseline):
-    """    Values the portfolio against a baseline, such as an index. 
-        Inputs: portfolio and baseline Series over time
-        Outputs: the portfolio's initial value, final value, overall returns; the baseline's returns
-    """
-    # Calculate start value, end value, returns on portfolio, and returns on baseline
-    initial_value = portfolio[0]
-    final_value = portfolio[-1]
-    returns = return_calculator.overall_returns(portfolio.values.tolist())
-    baseline_returns = return_calculator.overall_returns(baseline.values.tolist())
-    return initial_value, final_value, returns, baseline_returns
-
-def main():
-    symbol="AAPL"
-    folder_path="/Users/openamiguel/Documents/EQUITIES/stockDaily"
-    start_date = "2010-01-05"
-    end_date = "2018-06-28"
-    tick_data = download.load_single_drive(symbol, folderpath=folder_path)
-    tick_data = tick_data[start_date:end_date]
-    prices = pd.concat([tick_data.close], axis=1)
-    trend = ti.simple_moving_average(tick_data.close, num_periods=30)
-    baseline = ti.simple_moving_average(tick_data.close, num_periods=90)
-    trend_baseline = pd.concat([trend, baseline], axis=1)
-    trend_baseline.columns = ['trend','baseline']
-    trades = strategy.zscore_distance(trend_baseline)
-    port = portfolio.apply_trades(prices, trades)
-
-    portfolio_baseline = download.load_single_drive("^GSPC", folderpath=folder_path)
-    portfolio_baseline = portfolio_baseline[start_date:end_date]
-
-    start_value, end_value, returns, baseline_returns = returns_valuation(port.price, portfolio_baseline.close)
-
-    logger.info("Starting portfolio value: {}".format(start_value))
-    logger.info("Ending portfolio value: {}".format(end_value))
-    logger.info("Return on this strategy: {}".format(returns))
-    logger.info("Return on S&P500 index: {}".format(baseline_returns))
-    logger.info("Sharpe ratio: {}".format(sharpe_ratio(port.price)))
-
-    # Plots the portfolio
-    plot_name = "Strategy01"
-    port_price = pd.concat([port.price, portfolio_baseline.close], axis=1)
-    port_price.columns = ['portfolio', 'baseline']
-    plotter.price_plot(port_price, symbol=plot_name, folderpath=folder_path, subplot=[True,True], returns=[True,True], showPlot=True)
-
-
-if __name__ == "__main__":
+## This code assesses portfolios from portfolio.py using risk metrics and return plots. 
+## Author: Miguel Opeña
+## Version: 1.5.1
+
+import logging
+import numpy as np
+import os
+import pandas as pd
+
+import download
+import plotter
+import portfolio
+import return_calculator
+import strategy
+import technicals as ti
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Metrics computed by panel_metrics and rolling_metrics
+METRICS = ['sharpe', 'sortino', 'treynor', 'beta', 'max_drawdown', 'calmar']
+# Approximate bytes used per (window row, date, portfolio) cell by rolling_metrics, and its default memory budget
+BYTES_PER_CELL = 64
+MAX_CHUNK_BYTES = 1 << 28
+
+def metric_arrays(values, baseline=None, risk_free_rate=1.94, periods_per_year=252):
+    """ Computes every metric along axis 0 of an array of portfolio values, for all other axes at once. 
+        Returns follow get_rolling_returns (percent return at each date relative to the first date), 
+        so that Sharpe and Treynor match sharpe_ratio and treynor_ratio; beta compares value levels, as beta does. 
+        Inputs: array of values (dates first, then any shape of portfolios), baseline values broadcastable to it (default: none), 
+            risk-free rate (percent, like the returns), periods per year (for annualizing the return in the Calmar ratio)
+        Outputs: dictionary of arrays, one per metric (Treynor and beta are NaN without a baseline)
+    """
+    first = values[0]
+    returns = 100 * (values - first) / np.abs(first)
+    excess = np.nanmean(returns, axis=0) - risk_free_rate
+    downside = np.sqrt(np.nanmean(np.minimum(returns - risk_free_rate, 0) ** 2, axis=0))
+    drawdown = np.nanmax(1 - values / np.fmax.accumulate(values, axis=0), axis=0)
+    years = (values.shape[0] - 1) / periods_per_year
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annual_return = (values[-1] / first) ** (1 / years) - 1 if years > 0 else np.full(first.shape, np.nan)
+        metrics = {'sharpe': excess / np.nanstd(returns, axis=0), 'sortino': excess / downside, 
+            'max_drawdown': drawdown, 'calmar': annual_return / drawdown}
+        if baseline is None:
+            metrics['beta'] = np.full(first.shape, np.nan)
+        else:
+            # Covariance over the dates where both are known, as with dataframe cov
+            baseline = np.broadcast_to(baseline, values.shape)
+            valid = ~np.isnan(values) & ~np.isnan(baseline)
+            values_dev = np.where(valid, values - np.nanmean(np.where(valid, values, np.nan), axis=0), 0)
+            baseline_dev = np.where(valid, baseline - np.nanmean(np.where(valid, baseline, np.nan), axis=0), 0)
+            metrics['beta'] = (values_dev * baseline_dev).sum(axis=0) / (baseline_dev ** 2).sum(axis=0)
+        metrics['treynor'] = excess / metrics['beta']
+    return metrics
+
+def panel_metrics(portfolios, baseline=None, risk_free_rate=1.94, periods_per_year=252):
+    """ Calculates Sharpe, Sortino and Treynor ratios, beta, maximum drawdown and Calmar ratio of every portfolio in one pass. 
+        Inputs: dataframe of portfolio values (dates x portfolios), baseline Series on the same dates (default: none), 
+            risk-free interest rate, periods per year
+        Outputs: dataframe with one row per portfolio and one column per metric
+    """
+    values = portfolios.to_numpy(dtype=float)
+    if baseline is not None:
+        baseline = baseline.reindex(portfolios.index).to_numpy(dtype=float)[:, np.newaxis]
+    metrics = metric_arrays(values, baseline=baseline, risk_free_rate=risk_free_rate, periods_per_year=periods_per_year)
+    return pd.DataFrame({metric: metrics[metric] for metric in METRICS}, index=portfolios.columns)
+
+def rolling_metrics(portfolios, window, baseline=None, risk_free_rate=1.94, periods_per_year=252, max_bytes=MAX_CHUNK_BYTES):
+    """ Calculates every metric over a rolling window, for every portfolio. 
+        Windows are strided views of the data, processed a group of portfolios at a time to stay within the memory budget. 
+        Inputs: dataframe of portfolio values (dates x portfolios), window length in dates, baseline Series on the same dates (default: none), 
+            risk-free interest rate, periods per year, memory budget in bytes (default: 256 MB)
+        Outputs: dictionary of dataframes (dates x portfolios, NaN until the first full window), one per metric
+    """
+    values = portfolios.to_numpy(dtype=float)
+    num_dates, num_portfolios = values.shape
+    results = {metric: np.full(values.shape, np.nan) for metric in METRICS}
+    if num_dates >= window:
+        # Window views are (window x windows x portfolios), without copying the data
+        windows = np.moveaxis(np.lib.stride_tricks.sliding_window_view(values, window, axis=0), -1, 0)
+        baseline_windows = None
+        if baseline is not None:
+            baseline_values = baseline.reindex(portfolios.index).to_numpy(dtype=float)
+            baseline_windows = np.lib.stride_tricks.sliding_window_view(baseline_values, window)[:, :, np.newaxis].transpose(1, 0, 2)
+        chunk = int(max(1, max_bytes // (BYTES_PER_CELL * window * (num_dates - window + 1))))
+        for lo in range(0, num_portfolios, chunk):
+            hi = min(num_portfolios, lo + chunk)
+            metrics = metric_arrays(windows[:, :, lo:hi], baseline=baseline_windows, risk_free_rate=risk_free_rate, periods_per_year=periods_per_year)
+            for metric in METRICS:
+                results[metric][window - 1:, lo:hi] = metrics[metric]
+    return {metric: pd.DataFrame(results[metric], index=portfolios.index, columns=portfolios.columns) for metric in METRICS}
+
+def beta(price, baseline):
+    """ Calculates the beta of the given asset/portfolio against baseline.
+        Inputs: price Series, baseline Series
+        Outputs: beta of portfolio
+    """
+    return panel_metrics(price.to_frame(), baseline=baseline)['beta'].iloc[0]
+
+def sharpe_ratio(portfolio, risk_free_rate=1.94):
+    """ Calculates the Sharpe ratio of the given portfolio.
+        Inputs: portfolio Series, risk-free interest rate
+        Outputs: Sharpe ratio of portfolio
+    """
+    return panel_metrics(portfolio.to_frame(), risk_free_rate=risk_free_rate)['sharpe'].iloc[0]
+
+def treynor_ratio(portfolio, baseline, risk_free_rate=1.94):
+    """ Calculates the Treynor ratio of the given portfolio.
+        Inputs: portfolio Series, baseline Series, risk-free interest rate
+        Outputs: Treynor ratio of portfolio
+    """
+    return panel_metrics(portfolio.to_frame(), baseline=baseline, risk_free_rate=risk_free_rate)['treynor'].iloc[0]
+
+def returns_valuation(portfolio, baseline):
+    """    Values the portfolio against a baseline, such as an index. 
+        Inputs: portfolio and baseline Series over time
+        Outputs: the portfolio's initial value, final value, overall returns; the baseline's returns
+    """
+    # Calculate start value, end value, returns on portfolio, and returns on baseline
+    initial_value = portfolio[0]
+    final_value = portfolio[-1]
+    returns = return_calculator.overall_returns(portfolio.values.tolist())
+    baseline_returns = return_calculator.overall_returns(baseline.values.tolist())
+    return initial_value, final_value, returns, baseline_returns
+
+def main():
+    symbol="AAPL"
+    folder_path="/Users/openamiguel/Documents/EQUITIES/stockDaily"
+    start_date = "2010-01-05"
+    end_date = "2018-06-28"
+    loader = download.CLoader(folder_path)
+    # Reads only the rows between the start and end dates
+    tick_data = loader.load_single_drive(symbol, start=start_date, end=end_date)
+    prices = pd.concat([tick_data.close], axis=1)
+    trend = ti.simple_moving_average(tick_data.close, num_periods=30)
+    baseline = ti.simple_moving_average(tick_data.close, num_periods=90)
+    trend_baseline = pd.concat([trend, baseline], axis=1)
+    trend_baseline.columns = ['trend','baseline']
+    trades = strategy.zscore_distance(trend_baseline)
+    port = portfolio.apply_trades(prices, trades)
+
+    portfolio_baseline = loader.load_single_drive("^GSPC", start=start_date, end=end_date)
+
+    start_value, end_value, returns, baseline_returns = returns_valuation(port.price, portfolio_baseline.close)
+
+    logger.info("Starting portfolio value: {}".format(start_value))
+    logger.info("Ending portfolio value: {}".format(end_value))
+    logger.info("Return on this strategy: {}".format(returns))
+    logger.info("Return on S&P500 index: {}".format(baseline_returns))
+    logger.info("Sharpe ratio: {}".format(sharpe_ratio(port.price)))
+
+    # Plots the portfolio
+    plot_name = "Strategy01"
+    port_price = pd.concat([port.price, portfolio_baseline.close], axis=1)
+    port_price.columns = ['portfolio', 'baseline']
+    plotter.price_plot(port_price, symbol=plot_name, folderpath=folder_path, subplot=[True,True], returns=[True,True], showPlot=True)
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
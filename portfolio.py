@@ -1,169 +1,224 @@
-## This code uses trading signals from strategy.py to model a portfolio across one or many stocks.
-## Author: Miguel Opeña
-## Version: 1.5.8
-
-import logging
-from math import floor
-import os
-import pandas as pd
-
-import download
-import performance
-import plotter
-import return_calculator
-import strategy
-import ticker_universe
-
-LOGDIR = "/Users/openamiguel/Desktop/LOG"
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-# Set file path for logger
-handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
-handler.setLevel(logging.DEBUG)
-# Format the logger
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-# Add the new format
-logger.addHandler(handler)
-# Format the console logger
-consoleHandler = logging.StreamHandler()
-consoleHandler.setLevel(logging.INFO)
-consoleHandler.setFormatter(formatter)
-# Add the new format to the logger file
-logger.addHandler(consoleHandler)
-
-logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
-
-def asset_ranker(prices, ranking_method, lowquant=0.2, highquant=0.8, switch=False):
-	"""	Applies a ranking methodology to a set of asset data, selecting quantiles of data to go long or short on.
-		Inputs: dataframe of prices for multiple symbols, numbers for quantiles, order to switch long and short (default: no)
-		Outputs: dataframes representing long-position assets and short-position assets
-	"""
-	# Sets up rank as empty dataframe, with rows indexed by symbols in prices
-	rank = pd.DataFrame(index=list(prices.columns.values), columns=['ranking'])
-	for column in prices:
-		# Assumes that ranking_method takes Series as input
-		rank.ranking[column] = ranking_method(prices[column])
-	# Sorts and cleans the dataframe
-	rank.sort_values(by=['ranking'], ascending=False, inplace=True)
-	rank.reset_index(drop=True, inplace=True)
-	# Isolates the stocks in the bottom quantile and top quantile of ranking, respectively
-	bottom_bound = rank.ranking.quantile(lowquant)
-	top_bound = rank.ranking.quantile(highquant)
-	long_prices = prices.iloc[:,list(rank.index[rank.ranking < bottom_bound])]
-	short_prices = prices.iloc[:,list(rank.index[rank.ranking > top_bound])]
-	# If prompted to switch, the long and short positions are safely switched
-	if switch:
-		temp = long_prices
-		long_prices = short_prices
-		short_prices = temp
-	# Returns the long and short prices
-	return long_prices, short_prices
-
-def apply_trades(prices, trades, initialval=100000, seed=0.1, numtrades=1, transaction=7):
-	"""	Applies a set of trades to a set of assets to calculate portfolio value over time
-		Inputs: dataframe of prices for multiple symbols, dataframe of trade signals, initial value to invest in, 
-			proportion of initial value to seed the portfolio with, number of trades for each transaction, 
-			transaction cost (same currency units as initialval) for every buy and sell
-		Outputs: portfolio performance over time
-	"""
-	# Saves timestamp to give the portfolio output an index
-	timestamp = prices.index
-	# Merges all the price columns into a consolidated column
-	prices['all_prices'] = prices.sum(axis=1)
-	# Saves starting portfolio value
-	startval = prices.all_prices[timestamp[0]]
-	# Checks if start value can cover one share of each asset
-	# Note: one could instead assume fractional shares
-	if startval > initialval:
-		logger.error("Error: insufficient funds to start trading.")
-		return None
-	# Saves the number of positions total
-	# Starts with as many positions as one can fill with given initial value
-	numpositions = int(floor(seed * initialval / startval))
-	# Sets up the portfolio as a dataframe
-	portfolio = pd.DataFrame(initialval - startval * numpositions, index=timestamp, columns=['price'])
-	# Saves the previous date
-	last_date = timestamp[0]
-	# Adds logger statement to indicate new portfolio
-	logger.info("Initializing new portfolio with initial value ${0} and seed {1}%%".format(initialval, seed * 100))
-	# Iterates through all the dates (starts on second given date)
-	for date in timestamp[1:]:
-		current_price = prices.all_prices[date]
-		current_trade = trades.all_trades[date]
-		# Buys positions, reducing portfolio value
-		if current_trade == 1:
-			portfolio.price[date] = portfolio.price[last_date] - current_price * numtrades - transaction
-			numpositions += numtrades
-			logger.debug('Date: {0}\tPortfolio modified by {1} LONG positions.'.format(date, numtrades))
-		# Holds positions, leaving portfolio value unchanged
-		elif current_trade == 0:
-			portfolio.price[date] = portfolio.price[last_date]
-			logger.debug('Date: {0}\tPortfolio positions held.'.format(date))
-		# Sells positions, increasing portfolio value
-		elif current_trade == -1:
-			portfolio.price[date] = portfolio.price[last_date] + current_price * numtrades - transaction
-			numpositions -= numtrades
-			logger.debug('Date: {0}\tPortfolio modified by {1} SHORT positions.'.format(date, numtrades))
-		# Clears portfolio positions
-		elif current_trade == 'X':
-			portfolio.price[date] = portfolio.price[last_date] + current_price * numpositions 
-			if numpositions == 0:
-				logger.debug('Date: {0}\tNo portfolio positions to clear.'.format(date))
-			else:
-				logger.debug('Date: {0}\tPortfolio cleared {1} positions.'.format(date, numpositions))
-				portfolio.price[date] = portfolio.price[date] - transaction
-			numpositions = 0
-		# No other values are currently permitted
-		else:
-			logger.error("Error: bad trading signal found at date {0}".format(date))
-		# Checks if any assets left to trade
-		if portfolio.price[last_date] <= 0:
-			logger.error("Error: Portfolio has run out of funds at {}.".format(date))
-			return None
-		logger.info('Date: {0}\tPortfolio value at ${1}.'.format(date, portfolio.price[date]))
-		last_date = date
-	return portfolio
-
-def main():
-	tickerverse = ticker_universe.obtain_parse_wiki("SNP500")
-	tickerverse_copy = tickerverse
-	folder_path="/Users/openamiguel/Documents/EQUITIES/stockDaily"
-	start_date = "2014-01-06"
-	end_date = "2018-06-28"
-
-	prices = pd.DataFrame()
-	column_choice = "close"
-	for symbol in tickerverse_copy:
-		symboldata = download.load_single_drive(symbol, folderpath=folder_path)
-		if symboldata is not None: 
-			prices = pd.concat([prices, symboldata[column_choice]], axis=1)
-		else:
-			tickerverse.remove(symbol)
-	prices = prices[start_date:end_date]
-	print(prices.columns)
-	prices.columns  = tickerverse
-	long_prices, short_prices = asset_ranker(prices, ranking_method=return_calculator.overall_returns)
-	port = apply_trades(long_prices, strategy.hold_clear(long_prices, switch=True)) + apply_trades(short_prices, strategy.hold_clear(short_prices))
-
-	portfolio_baseline = download.load_single_drive("^GSPC", folderpath=folder_path)
-	portfolio_baseline = portfolio_baseline[~portfolio_baseline.index.duplicated(keep='first')]
-	portfolio_baseline = portfolio_baseline[start_date:end_date]
-
-	start_value, end_value, returns, baseline_returns = performance.returns_valuation(port.price, portfolio_baseline.close)
-
-	logger.info("Starting portfolio value: {}".format(start_value))
-	logger.info("Ending portfolio value: {}".format(end_value))
-	logger.info("Return on this strategy: {}".format(returns))
-	logger.info("Return on S&P500 index: {}".format(baseline_returns))
-	logger.info("Sharpe ratio: {}".format(performance.sharpe_ratio(port.price)))
-
-	# Plots the portfolio
-	plot_name = "SNP500Ranking_New_01"
-	port_price = pd.concat([port.price, portfolio_baseline.close], axis=1)
-	port_price.columns = ['portfolio', 'baseline']
-	plotter.price_plot(port_price, symbol=plot_name, folderpath=folder_path, subplot=[True,True], returns=[True,True], showPlot=True)
-
-if __name__ == "__main__":
+## This code uses trading signals from strategy.py to model a portfolio across one or many stocks.
+## Author: Miguel Opeña
+## Version: 1.9.2
+
+import logging
+from math import floor
+import numpy as np
+import os
+import pandas as pd
+
+import download
+import performance
+import plotter
+import ticker_universe
+import trade_signals
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+def asset_ranker(prices, ranking_method, lowquant=0.2, highquant=0.8, switch=False):
+	"""	Applies a ranking methodology to a set of asset data, selecting quantiles of data to go long or short on.
+		Ranks once over the whole period; see rank_weights to re-rank on every rebalance date. 
+		Inputs: dataframe of prices for multiple symbols, function ranking a series of prices, numbers for quantiles, 
+			order to switch long and short (default: no)
+		Outputs: dataframes representing long-position assets and short-position assets
+	"""
+	# Ranks all symbols at once over the whole period, then picks the quantiles the way rank_weights does on each rebalance date
+	# (assumes that ranking_method takes Series as input)
+	scores = prices.apply(ranking_method).to_numpy(dtype=float)[np.newaxis]
+	long_prices = prices.loc[:, select_quantile(scores, lowquant)[0]]
+	short_prices = prices.loc[:, select_quantile(scores, 1 - highquant, largest=True)[0]]
+	# If prompted to switch, the long and short positions are safely switched
+	if switch:
+		temp = long_prices
+		long_prices = short_prices
+		short_prices = temp
+	# Returns the long and short prices
+	return long_prices, short_prices
+
+def rebalance_rows(index, freq="M"):
+	"""	Returns the rows of the last date of each period (month, week, quarter...) of a date index, on which the portfolio is rebalanced. 
+		Inputs: date index, period frequency (default: M for monthly; W for weekly, Q for quarterly)
+		Outputs: array of row positions
+	"""
+	periods = pd.DatetimeIndex(index).to_period(freq)
+	return np.flatnonzero(np.r_[periods[1:] != periods[:-1], True])
+
+def momentum_scores(values, rows, lookback):
+	"""	Computes the return of every symbol over the lookback window ending on each rebalance row. 
+		Inputs: dates x symbols array of prices, rebalance rows, lookback in dates
+		Outputs: rebalance rows x symbols array of returns (NaN without a full window or a price)
+	"""
+	past = rows - lookback
+	with np.errstate(divide='ignore', invalid='ignore'):
+		scores = values[rows] / values[past.clip(0)] - 1
+	scores[past < 0] = np.nan
+	return scores
+
+def select_quantile(scores, quant, largest=False):
+	"""	Picks the symbols in the lowest (or highest) share of the scores on each row, with argpartition rather than a full sort. 
+		Inputs: rows x symbols array of scores (NaN are never picked), share of the symbols with a score to pick, 
+			order to pick the highest scores instead (default: no)
+		Outputs: rows x symbols boolean array
+	"""
+	valid = ~np.isnan(scores)
+	# Rounds first so that shares such as 1 - 0.8 do not lose a symbol to floating point
+	counts = np.floor(np.round(quant * valid.sum(axis=1), 9)).astype(int)
+	chosen = np.zeros(scores.shape, dtype=bool)
+	most = counts.max() if len(counts) > 0 else 0
+	if most == 0:
+		return chosen
+	filled = np.where(valid, -scores if largest else scores, np.inf)
+	candidates = np.argpartition(filled, most - 1, axis=1)[:, :most]
+	# Orders the few candidates of each row, then keeps as many as that row's count
+	order = np.argsort(np.take_along_axis(filled, candidates, axis=1), axis=1)
+	candidates = np.take_along_axis(candidates, order, axis=1)
+	keep = np.arange(most) < counts[:, np.newaxis]
+	rows = np.broadcast_to(np.arange(len(scores))[:, np.newaxis], candidates.shape)
+	chosen[rows[keep], candidates[keep]] = True
+	return chosen
+
+def rank_weights(prices, freq="M", lookback=252, lowquant=0.2, highquant=0.8, switch=False, scorer=momentum_scores):
+	"""	Ranks the symbols on every rebalance date in one pass, going long the bottom quantile and short the top quantile (as asset_ranker does). 
+		Each side is equally weighted and sums to 1 (long) or -1 (short). Weights are set on a rebalance date 
+		and held from the next date until the next rebalance, so that no date trades on its own price. 
+		Inputs: dataframe of prices (dates x symbols, e.g. from CLoader.load_panel), period frequency of rebalancing (default: M, monthly), 
+			lookback of the ranking in dates, numbers for quantiles, order to switch long and short (default: no, i.e. buy the losers), 
+			function of (prices array, rebalance rows, lookback) giving the scores to rank on (default: momentum_scores)
+		Outputs: dataframe of weights (dates x symbols), for backtest.weights_backtest
+	"""
+	values = prices.to_numpy(dtype=float)
+	rows = rebalance_rows(prices.index, freq=freq)
+	scores = scorer(values, rows, lookback)
+	longs = select_quantile(scores, lowquant)
+	shorts = select_quantile(scores, 1 - highquant, largest=True)
+	# If prompted to switch, the long and short positions are safely switched
+	if switch:
+		longs, shorts = shorts, longs
+	targets = longs / np.maximum(longs.sum(axis=1), 1)[:, np.newaxis] - shorts / np.maximum(shorts.sum(axis=1), 1)[:, np.newaxis]
+	# Each date holds the targets of the last rebalance strictly before it
+	last = np.searchsorted(rows, np.arange(len(values)), side='left') - 1
+	weights = np.where((last >= 0)[:, np.newaxis], targets[last.clip(0)], 0.0)
+	return pd.DataFrame(weights, index=prices.index, columns=prices.columns)
+
+def trade_ledger(prices, codes, start_cash, start_positions, numtrades=1, transaction=7):
+	"""	Computes cash and positions after every bar from trade signals, with cumulative sums instead of a loop over dates. 
+		Works on one series or, along the time axis 0, on many columns at once (broadcasting prices, cash and positions). 
+		The signal on the first bar is ignored, as the portfolio is seeded on it. 
+		Inputs: array of prices, array of int8 codes (see trade_signals.py), cash and positions held on the first bar, 
+			number of trades for each transaction, transaction cost for every buy, sell and non-empty clear
+		Outputs: tuple of (cash array, positions array)
+	"""
+	codes = np.array(codes, dtype=trade_signals.SIGNAL_DTYPE)
+	codes[0] = trade_signals.HOLD
+	prices = np.asarray(prices, dtype=float)
+	start_positions = np.asarray(start_positions, dtype=np.int64)
+	# Signed trade quantities, accumulated from the starting positions
+	delta = numtrades * ((codes == trade_signals.LONG).astype(np.int64) - (codes == trade_signals.SHORT).astype(np.int64))
+	cumulative = start_positions + np.cumsum(delta, axis=0)
+	# A clear resets positions to zero, so later positions count from the cumulative sum at the last clear
+	clear = codes == trade_signals.CLEAR
+	rows = np.arange(codes.shape[0]).reshape((-1,) + (1,) * (codes.ndim - 1))
+	last_clear = np.maximum.accumulate(np.where(clear, rows, -1), axis=0)
+	positions = cumulative - np.where(last_clear >= 0, np.take_along_axis(cumulative, last_clear.clip(0), axis=0), 0)
+	held = np.concatenate([np.broadcast_to(start_positions, positions.shape[1:])[np.newaxis], positions[:-1]], axis=0)
+	# Buys and sells pay the price and the cost; clears sell everything held, and pay the cost only if something was held
+	flows = -prices * delta - transaction * (delta != 0) + np.where(clear, prices * held - transaction * (held != 0), 0.0)
+	return start_cash + np.cumsum(flows, axis=0), positions
+
+def apply_trades(prices, trades, initialval=100000, seed=0.1, numtrades=1, transaction=7, verbose=False):
+	"""	Applies a set of trades to a set of assets to calculate portfolio value over time
+		Inputs: dataframe of prices for multiple symbols, dataframe of trade signals (see trade_signals.py), initial value to invest in, 
+			proportion of initial value to seed the portfolio with, number of trades for each transaction, 
+			transaction cost (same currency units as initialval) for every buy and sell, order to log every bar (default: No)
+		Outputs: portfolio performance over time
+	"""
+	# Saves timestamp to give the portfolio output an index
+	timestamp = prices.index
+	# Lines the signals up with the prices by timestamp, holding on bars without a signal
+	if isinstance(trades, (pd.DataFrame, pd.Series)) and not trades.index.equals(timestamp):
+		trades = trades.reindex(timestamp, fill_value=trade_signals.HOLD)
+	# Reads the signals as int8 codes (older dataframes with 'X' for clear are converted)
+	codes = trade_signals.to_codes(trades)
+	# Merges all the price columns into a consolidated column (missing prices count as zero)
+	all_prices = np.nansum(prices.to_numpy(dtype=float).reshape(len(timestamp), -1), axis=1)
+	# Saves starting portfolio value
+	startval = all_prices[0]
+	# Checks if start value can cover one share of each asset
+	# Note: one could instead assume fractional shares
+	if startval > initialval:
+		logger.error("Error: insufficient funds to start trading.")
+		return None
+	# Saves the number of positions total
+	# Starts with as many positions as one can fill with given initial value
+	numpositions = int(floor(seed * initialval / startval))
+	# Adds logger statement to indicate new portfolio
+	logger.info("Initializing new portfolio with initial value ${0} and seed {1}%%".format(initialval, seed * 100))
+	cash, positions = trade_ledger(all_prices, codes, initialval - startval * numpositions, numpositions, 
+		numtrades=numtrades, transaction=transaction)
+	# Checks if any assets were left to trade before each bar
+	broke = np.flatnonzero(cash[:-1] <= 0)
+	if len(broke) > 0:
+		logger.error("Error: Portfolio has run out of funds at {}.".format(timestamp[broke[0] + 1]))
+		return None
+	if verbose:
+		for date, code, held, value in zip(timestamp[1:], codes[1:], positions[1:], cash[1:]):
+			logger.debug('Date: {0}\tSignal {1}, {2} positions held.'.format(date, code, held))
+			logger.info('Date: {0}\tPortfolio value at ${1}.'.format(date, value))
+	return pd.DataFrame({'price': cash}, index=timestamp)
+
+def main():
+	tickerverse = ticker_universe.obtain_parse_wiki("SNP500")
+	folder_path="/Users/openamiguel/Documents/EQUITIES/stockDaily"
+	start_date = "2014-01-06"
+	end_date = "2018-06-28"
+
+	column_choice = "close"
+	loader = download.CLoader(folder_path)
+	# Symbols without a file are left out of the panel
+	prices = loader.load_panel(tickerverse, column_choice=column_choice, start=start_date, end=end_date)
+	print(prices.columns)
+	# Imported here because backtest.py builds on this module
+	import backtest
+	# Re-ranks every month on the trailing year's return, going long the winners and short the losers
+	weights = rank_weights(prices, freq="M", lookback=252, switch=True)
+	results = backtest.weights_backtest(prices, weights)
+	port = pd.DataFrame({'price': results['equity']}, index=prices.index)
+
+	portfolio_baseline = loader.load_single_drive("^GSPC", start=start_date, end=end_date)
+
+	start_value, end_value, returns, baseline_returns = performance.returns_valuation(port.price, portfolio_baseline.close)
+
+	logger.info("Starting portfolio value: {}".format(start_value))
+	logger.info("Ending portfolio value: {}".format(end_value))
+	logger.info("Return on this strategy: {}".format(returns))
+	logger.info("Return on S&P500 index: {}".format(baseline_returns))
+	logger.info("Sharpe ratio: {}".format(performance.sharpe_ratio(port.price)))
+
+	# Plots the portfolio
+	plot_name = "SNP500Ranking_New_01"
+	port_price = pd.concat([port.price, portfolio_baseline.close], axis=1)
+	port_price.columns = ['portfolio', 'baseline']
+	plotter.price_plot(port_price, symbol=plot_name, folderpath=folder_path, subplot=[True,True], returns=[True,True], showPlot=True)
+
+if __name__ == "__main__":
 	main()
\ No newline at end of file
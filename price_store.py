@@ -0,0 +1,243 @@
+## This code stores price data as typed NumPy arrays, one binary file per column, in place of one text CSV per symbol.
+## Layout: <root>/<SYMBOL_FUNCTION[&interval]>/<column>.bin (raw arrays, datetime64 timestamps) plus meta.json, 
+## which records the column dtypes, the row count and the first row of each year (the year partitions).
+## Author: Miguel Opeña
+## Version: 1.2.2
+
+import json
+import logging
+import numpy as np
+import os
+import pandas as pd
+import sys
+import time
+
+from command_parser import CCmdParser
+import io_support
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+META_FILE = "meta.json"
+# Timestamps are stored as datetime64 with nanosecond resolution
+TIMESTAMP_DTYPE = 'datetime64[ns]'
+
+def format_timestamp(timestamp):
+	""" Formats a timestamp the way AlphaVantage files do: date only for daily bars, date and time for intraday. """
+	timestamp = pd.Timestamp(timestamp)
+	if timestamp == timestamp.normalize():
+		return timestamp.strftime("%Y-%m-%d")
+	return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+class CPriceStore:
+	""" A class to read and write price data as typed arrays, partitioned by symbol and year """
+	def __init__(self, rootpath):
+		self.rootpath = rootpath
+		os.makedirs(rootpath, exist_ok=True)
+
+	def _dirpath(self, stem):
+		return os.path.join(self.rootpath, stem)
+
+	def _colpath(self, stem, column):
+		return os.path.join(self.rootpath, stem, column + ".bin")
+
+	def stems(self):
+		""" Returns the list of stored series (file stems such as AAPL_DAILY or USD_EUR_DAILY). """
+		return sorted(name for name in os.listdir(self.rootpath) if os.path.isfile(os.path.join(self.rootpath, name, META_FILE)))
+
+	def has(self, stem):
+		return os.path.isfile(os.path.join(self._dirpath(stem), META_FILE))
+
+	def get_mtime(self, stem):
+		""" Returns the time the series was last written (None if absent). """
+		metapath = os.path.join(self._dirpath(stem), META_FILE)
+		return os.path.getmtime(metapath) if os.path.isfile(metapath) else None
+
+	def get_size(self, stem):
+		""" Returns the number of rows stored for a series (None if absent). """
+		meta = self.get_meta(stem)
+		return meta['rows'] if meta is not None else None
+
+	def get_meta(self, stem):
+		""" Returns the metadata of a stored series (columns, dtypes, rows, first row of each year, 
+			first and last timestamp), or None if absent. 
+		"""
+		metapath = os.path.join(self._dirpath(stem), META_FILE)
+		if not os.path.isfile(metapath):
+			return None
+		with open(metapath, 'r') as metafile:
+			return json.load(metafile)
+
+	def _write_meta(self, stem, meta):
+		# The metadata is replaced atomically and written last, so readers never see partial rows
+		metapath = os.path.join(self._dirpath(stem), META_FILE)
+		with open(metapath + ".tmp", 'w') as metafile:
+			json.dump(meta, metafile, indent=1)
+		os.replace(metapath + ".tmp", metapath)
+
+	@staticmethod
+	def _prepare(frame):
+		""" Normalizes a frame (see io_support.normalize_bars) and gives it a datetime64 index. """
+		frame = frame.copy()
+		frame.index = pd.to_datetime(frame.index)
+		frame, validation = io_support.normalize_bars(frame)
+		frame.index.name = 'timestamp'
+		return frame, validation
+
+	@staticmethod
+	def _year_starts(timestamp, offset, year_starts):
+		""" Adds the first row of each new year among the given timestamps to the year index. """
+		years = pd.DatetimeIndex(timestamp).year
+		for idx in np.flatnonzero(np.r_[True, years[1:] != years[:-1]]):
+			year_starts.setdefault(str(years[idx]), int(offset + idx))
+		return year_starts
+
+	def _row_range(self, meta, start, end):
+		""" Narrows the rows that can hold a date range using the year index. """
+		years = sorted(meta['year_starts'].items())
+		lo = 0
+		hi = meta['rows']
+		for year, row in years:
+			if start is not None and int(year) <= start.year:
+				lo = row
+			if end is not None and int(year) > end.year:
+				hi = row
+				break
+		return lo, hi
+
+	def write(self, stem, frame):
+		""" Replaces a stored series with the given data.
+			Inputs: file stem, dataframe indexed by timestamp (strings or datetimes)
+			Outputs: number of rows written
+		"""
+		frame, validation = self._prepare(frame)
+		os.makedirs(self._dirpath(stem), exist_ok=True)
+		timestamp = frame.index.values.astype(TIMESTAMP_DTYPE)
+		timestamp.tofile(self._colpath(stem, 'timestamp'))
+		dtypes = {}
+		for column in frame.columns:
+			values = frame[column].to_numpy()
+			values.tofile(self._colpath(stem, column))
+			dtypes[column] = values.dtype.str
+		meta = {'columns': list(frame.columns), 'dtypes': dtypes, 'rows': len(frame), 
+			'year_starts': self._year_starts(timestamp, 0, {}), 
+			'first': format_timestamp(frame.index[0]) if len(frame) else None,
+			'last': format_timestamp(frame.index[-1]) if len(frame) else None,
+			'clean': True, 'ohlc_errors': validation['ohlc_errors']}
+		self._write_meta(stem, meta)
+		return len(frame)
+
+	def append(self, stem, frame):
+		""" Appends rows more recent than the last stored timestamp to the end of each column file.
+			Inputs: file stem, dataframe indexed by timestamp (strings or datetimes)
+			Outputs: number of rows appended
+		"""
+		meta = self.get_meta(stem)
+		if meta is None:
+			return self.write(stem, frame)
+		frame, _ = self._prepare(frame)
+		if meta['last'] is not None:
+			frame = frame[frame.index > pd.Timestamp(meta['last'])]
+		if frame.empty:
+			return 0
+		frame = frame[meta['columns']]
+		timestamp = frame.index.values.astype(TIMESTAMP_DTYPE)
+		arrays = [('timestamp', timestamp)] + [(column, frame[column].to_numpy().astype(meta['dtypes'][column])) for column in meta['columns']]
+		for column, values in arrays:
+			with open(self._colpath(stem, column), 'r+b') as colfile:
+				# Drops any rows left over from an interrupted append
+				colfile.truncate(meta['rows'] * values.dtype.itemsize)
+				colfile.seek(0, os.SEEK_END)
+				values.tofile(colfile)
+		meta['year_starts'] = self._year_starts(timestamp, meta['rows'], meta['year_starts'])
+		meta['rows'] += len(frame)
+		meta['first'] = meta['first'] if meta['first'] is not None else format_timestamp(frame.index[0])
+		meta['last'] = format_timestamp(frame.index[-1])
+		meta['ohlc_errors'] = meta.get('ohlc_errors', 0) + io_support.count_ohlc_errors(frame)
+		self._write_meta(stem, meta)
+		return len(frame)
+
+	def _read_column(self, stem, column, dtype, lo, hi):
+		dtype = np.dtype(dtype)
+		return np.fromfile(self._colpath(stem, column), dtype=dtype, count=hi - lo, offset=lo * dtype.itemsize)
+
+	def read(self, stem, columns=None, start=None, end=None):
+		""" Reads a stored series, touching only the columns and year partitions requested.
+			Inputs: file stem, list of columns (default: all), start and end date/time (inclusive, default: unbounded)
+			Outputs: dataframe with datetime64 index named timestamp (None if the series is not stored)
+		"""
+		meta = self.get_meta(stem)
+		if meta is None:
+			return None
+		columns = meta['columns'] if columns is None else list(columns)
+		start_time = pd.Timestamp(start) if start is not None else None
+		# A partial end (e.g. a date without a time, or a month) includes its whole period, as with string slicing
+		end_time = io_support.get_end_time(end) if end is not None else None
+		lo, hi = self._row_range(meta, start_time, end_time)
+		timestamp = self._read_column(stem, 'timestamp', TIMESTAMP_DTYPE, lo, hi)
+		# Timestamps are sorted, so the exact date range is found by binary search
+		first = np.searchsorted(timestamp, start_time.to_datetime64(), side='left') if start_time is not None else 0
+		last = np.searchsorted(timestamp, end_time.to_datetime64(), side='right') if end_time is not None else len(timestamp)
+		index = pd.DatetimeIndex(timestamp[first:last], name='timestamp')
+		data = {column: self._read_column(stem, column, meta['dtypes'][column], lo + first, lo + last) for column in columns}
+		return pd.DataFrame(data, index=index)
+
+def migrate_folder(folderpath, rootpath, datatype="csv"):
+	""" One-shot migration of a folder of CSV files (as written by download.py) into a price store.
+		Inputs: path of folder with CSV files, path of store root, data type of files (default: csv)
+		Outputs: the CPriceStore instance
+	"""
+	store = CPriceStore(rootpath)
+	time0 = time.time()
+	num_files = 0
+	for file in sorted(os.listdir(folderpath)):
+		# Skips everything that does not follow the SYMBOL_FUNCTION naming convention
+		if not file.endswith("." + datatype) or "_" not in file:
+			continue
+		stem = file[:-len(datatype) - 1]
+		logger.info("Migrating %s into the price store...", file)
+		tick_data = pd.read_csv(os.path.join(folderpath, file), index_col='timestamp')
+		store.write(stem, tick_data)
+		num_files += 1
+	logger.info("Migrated %d files in %.2f seconds.", num_files, time.time() - time0)
+	return store
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here is an example of how to run this program:
+
+		python price_store.py -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -storePath C:/Users/Miguel/Documents/EQUITIES/storeDaily
+			This will copy every CSV file in folderPath into a price store at storePath.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	## Handles where the CSV files are, and where the store goes
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	store_path = cmdparser.get_generic(query="-storePath")
+	migrate_folder(folder_path, store_path)
+	return 0
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,223 @@
+## This code persists a ticker universe as one dates x symbols x fields array on disk, which any number of processes can memory-map.
+## Layout: <root>/current names the live build folder, which holds header.json (symbols, fields, file stems, shape),
+## calendar.npy (datetime64 timestamps) and data.dat (float64 array). A rebuild writes a new folder and switches current last.
+## Every reader maps the same file, so concurrent feature builds, backtests and plots share one physical copy in the page cache.
+## Author: Miguel Opeña
+## Version: 1.2.2
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import sys
+import time
+
+from command_parser import CCmdParser
+import download
+import io_support
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+CURRENT_FILE = "current"
+HEADER_FILE = "header.json"
+CALENDAR_FILE = "calendar.npy"
+DATA_FILE = "data.dat"
+DATA_DTYPE = 'float64'
+FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+class CSharedPanel:
+	""" A class to read a memory-mapped dates x symbols x fields panel,
+		usable by CLoader in place of a folder of files (through its store parameter)
+	"""
+	def __init__(self, rootpath):
+		self.rootpath = rootpath
+		# The pointer is read once, so this reader keeps the build it opened even if the panel is rebuilt meanwhile
+		self.path = get_build_path(rootpath)
+		with open(os.path.join(self.path, HEADER_FILE), 'r') as headerfile:
+			self.header = json.load(headerfile)
+		self.symbols = self.header['symbols']
+		self.fields = self.header['fields']
+		self.symbol_map = {symbol: j for j, symbol in enumerate(self.symbols)}
+		self.stem_map = {stem: j for j, stem in enumerate(self.header['stems'])}
+		self.field_map = {field: k for k, field in enumerate(self.fields)}
+		# Both arrays are mapped read-only: nothing is read until a slice is used
+		self.calendar = np.load(os.path.join(self.path, CALENDAR_FILE), mmap_mode='r')
+		self.data = np.memmap(os.path.join(self.path, DATA_FILE), dtype=self.header['dtype'], mode='r', shape=tuple(self.header['shape']))
+
+	def date_range(self, start=None, end=None):
+		""" Returns the row bounds of a date range (inclusive; a partial end such as a date or a month includes that whole period). """
+		lo = 0
+		hi = len(self.calendar)
+		if start is not None:
+			lo = np.searchsorted(self.calendar, pd.Timestamp(start).to_datetime64(), side='left')
+		if end is not None:
+			hi = np.searchsorted(self.calendar, io_support.get_end_time(end).to_datetime64(), side='right')
+		return int(lo), int(hi)
+
+	def get_array(self, field="close", start=None, end=None):
+		""" Returns a zero-copy dates x symbols view of one field.
+			Inputs: field name (default: close), start and end date/time (default: unbounded)
+			Outputs: read-only NumPy view into the mapped file
+		"""
+		lo, hi = self.date_range(start, end)
+		return self.data[lo:hi, :, self.field_map[field]]
+
+	def get_symbol(self, symbol, start=None, end=None):
+		""" Returns a zero-copy dates x fields view of one symbol.
+			Inputs: symbol String or tuple object, start and end date/time (default: unbounded)
+			Outputs: read-only NumPy view into the mapped file
+		"""
+		lo, hi = self.date_range(start, end)
+		return self.data[lo:hi, self.symbol_map[io_support.get_symbol_str(symbol)], :]
+
+	def get_panel(self, tickerverse=None, field="close", start=None, end=None):
+		""" Returns one field of many symbols as a dates x symbols dataframe (see CLoader.load_panel).
+			Inputs: ticker universe (default: all symbols), field name (default: close), start and end date/time
+			Outputs: dataframe indexed by timestamp, with one column per symbol found
+		"""
+		lo, hi = self.date_range(start, end)
+		if tickerverse is None:
+			symbols = self.symbols
+			values = self.data[lo:hi, :, self.field_map[field]]
+		else:
+			symbols = [io_support.get_symbol_str(symbol) for symbol in tickerverse]
+			missing = [symbol for symbol in symbols if symbol not in self.symbol_map]
+			if len(missing) > 0:
+				logger.warning("Symbols not found in shared panel at %s: %s", self.rootpath, ", ".join(missing))
+			symbols = [symbol for symbol in symbols if symbol in self.symbol_map]
+			values = self.data[lo:hi, [self.symbol_map[symbol] for symbol in symbols], self.field_map[field]]
+		index = pd.DatetimeIndex(self.calendar[lo:hi], name='timestamp')
+		return pd.DataFrame(values, index=index, columns=symbols, copy=False)
+
+	def has(self, stem):
+		return stem in self.stem_map
+
+	def get_mtime(self, stem):
+		""" Returns the time the panel was built (None if the stem is absent). """
+		return os.path.getmtime(os.path.join(self.path, HEADER_FILE)) if stem in self.stem_map else None
+
+	def get_size(self, stem):
+		""" Returns the number of dates in the panel (None if the stem is absent). """
+		return len(self.calendar) if stem in self.stem_map else None
+
+	def stems(self):
+		return list(self.header['stems'])
+
+	def read(self, stem, columns=None, start=None, end=None):
+		""" Reads one symbol the way CPriceStore.read does, so that CLoader can load from the panel.
+			Inputs: file stem, list of fields (default: all), start and end date/time (default: unbounded)
+			Outputs: dataframe with datetime64 index named timestamp, restricted to the symbol's own dates (None if absent)
+		"""
+		if stem not in self.stem_map:
+			return None
+		columns = self.fields if columns is None else list(columns)
+		lo, hi = self.date_range(start, end)
+		values = self.data[lo:hi, self.stem_map[stem], [self.field_map[column] for column in columns]]
+		# Dates on which the symbol did not trade are NaN in every field
+		present = ~np.isnan(values).all(axis=1)
+		index = pd.DatetimeIndex(self.calendar[lo:hi][present], name='timestamp')
+		return pd.DataFrame(values[present], index=index, columns=columns)
+
+def get_build_path(rootpath):
+	""" Returns the folder of the live build of a panel (the root itself for panels written before builds were versioned). """
+	pointer = os.path.join(rootpath, CURRENT_FILE)
+	if not os.path.exists(pointer):
+		return rootpath
+	with open(pointer, 'r') as pointerfile:
+		return os.path.join(rootpath, pointerfile.read().strip())
+
+def build_panel(loader, tickerverse, rootpath, fields=FIELDS, workers=4):
+	""" Writes a shared panel from files on the local drive. An existing panel at rootpath is replaced.
+		Inputs: CLoader object, ticker universe, path of panel folder, fields to keep (default: OHLCV),
+			number of reader threads (default: 4)
+		Outputs: the CSharedPanel instance
+	"""
+	time0 = time.time()
+	with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+		frames = list(executor.map(loader.load_single_drive, tickerverse))
+	symbols = [io_support.get_symbol_str(symbol) for symbol, frame in zip(tickerverse, frames) if frame is not None]
+	stems = [io_support.get_file_stem(symbol, loader.function, loader.interval) for symbol, frame in zip(tickerverse, frames) if frame is not None]
+	frames = [frame for frame in frames if frame is not None]
+	if len(frames) == 0:
+		logger.error("No files found to build shared panel at %s", rootpath)
+		return None
+	indexes = [pd.to_datetime(frame.index).values.astype('datetime64[ns]') for frame in frames]
+	calendar = pd.Index(np.concatenate(indexes)).unique().sort_values()
+	shape = (len(calendar), len(symbols), len(fields))
+	# Writes a complete new build, then switches the pointer to it in one atomic replace, so readers never pick up a half-built panel
+	build = "build_{}".format(time.time_ns())
+	buildpath = os.path.join(rootpath, build)
+	os.makedirs(buildpath)
+	data = np.memmap(os.path.join(buildpath, DATA_FILE), dtype=DATA_DTYPE, mode='w+', shape=shape)
+	data[:] = np.nan
+	for j, (frame, index) in enumerate(zip(frames, indexes)):
+		# Fields a file lacks (e.g. volume for forex) are left NaN
+		data[calendar.get_indexer(index), j, :] = frame.reindex(columns=fields).to_numpy(dtype=DATA_DTYPE)
+	data.flush()
+	del data
+	with open(os.path.join(buildpath, CALENDAR_FILE), 'wb') as calendarfile:
+		np.save(calendarfile, calendar.values)
+	header = {'symbols': symbols, 'stems': stems, 'fields': list(fields), 'dtype': DATA_DTYPE, 'shape': list(shape),
+		'function': loader.function, 'interval': loader.interval}
+	with open(os.path.join(buildpath, HEADER_FILE), 'w') as headerfile:
+		json.dump(header, headerfile, indent=1)
+	previous = os.path.basename(get_build_path(rootpath))
+	pointer = os.path.join(rootpath, CURRENT_FILE)
+	with open(pointer + ".tmp", 'w') as pointerfile:
+		pointerfile.write(build)
+	os.replace(pointer + ".tmp", pointer)
+	# The replaced build is kept for readers still opening it; older ones are removed where the system allows it
+	for name in os.listdir(rootpath):
+		if name.startswith("build_") and name not in (build, previous):
+			shutil.rmtree(os.path.join(rootpath, name), ignore_errors=True)
+	logger.info("Built shared panel of %d dates x %d symbols x %d fields in %.2f seconds", shape[0], shape[1], shape[2], time.time() - time0)
+	return CSharedPanel(rootpath)
+
+def main():
+	""" User interacts with interface through command prompt, which obtains several "input" data.
+		Here is an example of how to run this program:
+
+		python shared_panel.py -tickerUniverse SNP500 -folderPath C:/Users/Miguel/Documents/EQUITIES/stockDaily -panelPath C:/Users/Miguel/Documents/EQUITIES/panelDaily
+			This will write the daily data on S&P 500 tickers into one memory-mapped panel at panelPath.
+
+		Inputs: implicit through command prompt
+		Outputs: 0 if everything works
+	"""
+	prompts = sys.argv
+	cmdparser = CCmdParser(prompts)
+	tickerverse, _ = cmdparser.get_tickerverse()
+	## Handles where the source files are, and where the panel goes
+	# Default folder path is relevant to the author only.
+	folder_path = cmdparser.get_generic(query="-folderPath", default="/Users/openamiguel/Documents/EQUITIES/stockDaily", req=False)
+	panel_path = cmdparser.get_generic(query="-panelPath")
+	## Handles the desired time series function
+	function = cmdparser.get_generic(query="-function", default="DAILY", req=False)
+	interval = cmdparser.get_generic(query="-interval") if function == "INTRADAY" else ""
+	loader = download.CLoader(folder_path, function=function, interval=interval)
+	build_panel(loader, tickerverse, panel_path)
+	return 0
+
+if __name__ == "__main__":
+	main()
@@ -1,128 +1,130 @@
-## This code models assorted strategies and returns a dataframe of trades.
-## -1 corresponds to sell short, 0 to hold, 1 to buy long, and 'X' to clear all positions
-## Author: Miguel Opeña
-## Version: 1.3.3
-
-import logging
-import os
-import pandas as pd
-
-LOGDIR = "/Users/openamiguel/Desktop/LOG"
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-# Set file path for logger
-handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
-handler.setLevel(logging.DEBUG)
-# Format the logger
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-# Add the new format
-logger.addHandler(handler)
-# Format the console logger
-consoleHandler = logging.StreamHandler()
-consoleHandler.setLevel(logging.INFO)
-consoleHandler.setFormatter(formatter)
-# Add the new format to the logger file
-logger.addHandler(consoleHandler)
-
-logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
-
-def hold_clear(trend_baseline, switch=False):
-	"""	Simulates a very basic strategy: 
-		Inputs: trend and baseline data, order to switch start from long to short
-	"""
-	timestamp = trend_baseline.index
-	# Initializes the portfolio trades dataframe
-	trades = pd.DataFrame(0, index=timestamp, columns=['all_trades'])
-	# Gets the second date in the input data and fills it with long/short
-	second_date = timestamp[1]
-	trades.all_trades[second_date] = -1 if switch else 1
-	# Gets the last date in the input data and fills it with clear
-	last_date = timestamp[-1]
-	trades.all_trades[last_date] = 'X'
-	return trades
-
-def crossover(trend_baseline, switch=False):
-	"""	Simulates a crossover strategy for a trend and baseline. 
-		Sells if trend crosses down below baseline, buys if trend crosses up above baseline. 
-		Inputs: trend and baseline data (price data unnecessary for this function), command to switch buy/sell signals
-		Outputs: dataframe of timestamp index and trade signals
-	"""
-	# Saves timestamp to give the portfolio output an index
-	timestamp = trend_baseline.index
-	# Saves start date as variable
-	start_date = timestamp[0]
-	# Initializes the portfolio trades dataframe
-	trades = pd.DataFrame(0, index=timestamp, columns=['all_trades'])
-	# Initialize boolean check variable
-	was_greater = (trend_baseline.trend[start_date] > trend_baseline.baseline[start_date])
-	# Start iterating through the trend-baseline dataframe
-	for date in timestamp:
-		current_trend = trend_baseline.trend[date]
-		current_base = trend_baseline.baseline[date]
-		# Buys long if trend crosses below baseline
-		if current_trend < current_base and was_greater: 
-			logger.debug('Date:{}\tLONG position added.'.format(date))
-			was_greater = not was_greater
-			# 1 is the code for long positions
-			trades.all_trades[date] = 1
-		# Sells short if trend crosses above baseline
-		elif current_trend > current_base and not was_greater:
-			logger.debug('Date:{}\tSHORT position added.'.format(date))
-			was_greater = not was_greater
-			# -1 is the code for short positions
-			trades.all_trades[date] = -1
-		# Otherwise, hold all positions
-		else:
-			logger.debug('Date:{}\tAll positions held.'.format(date))
-			continue
-	# If prompted to switch, the long and short positions are safely switched
-	if switch:
-		trades.replace(-1, 7, inplace=True)
-		trades.replace(1, -1, inplace=True)
-		trades.replace(7, 1, inplace=True)
-	return trades
-	
-def zscore_distance(trend_baseline, zscores=[-1,0.5,1], switch=False):
-	"""	Simulates a zscore proximity strategy for a trend and baseline. 
-		Sells if trend is too far above baseline, buys if trend is too far below baseline, unloads if insufficient distance. 
-		Inputs: price data with trend and baseline, list of z-scores to use as buy, sell, and clear signals, command to switch buy/sell signals
-		Outputs: dataframe of timestamp index and trade signals
-	"""
-	# Saves timestamp to give the portfolio output an index
-	timestamp = trend_baseline.index
-	# Initializes the portfolio positions dataframe
-	trades = pd.DataFrame(0, index=timestamp, columns=['all_trades'])
-	# Initialize the z-score data
-	zscore_running = (trend_baseline.trend - trend_baseline.baseline) / trend_baseline.trend.std()
-	# Start iterating through the trend-baseline dataframe
-	for date in timestamp:
-		current_trend = trend_baseline.trend[date]
-		current_base = trend_baseline.baseline[date]
-		current_zscore = zscore_running[date]
-		# Buys long if trend crosses below baseline
-		if current_zscore < zscores[0]:
-			logger.debug('Date:{}\tLONG position added.'.format(date))
-			# 1 is the code for long positions
-			trades.all_trades[date] = 1
-		# Sells short if trend crosses above baseline
-		elif current_zscore > zscores[-1]: 
-			logger.debug('Date:{}\tSHORT position added.'.format(date))
-			# -1 is the code for short positions
-			trades.all_trades[date] = -1
-		# Clears positions if trend is too close to baseline
-		elif abs(current_zscore) < zscores[1]:
-			logger.debug('Date:{}\tCLEAR positions.'.format(date))
-			# 'X' is the code to clear positions
-			trades.all_trades[date] = 'X'
-		# Otherwise, hold all positions
-		else:
-			logger.debug('Date:{}\tAll positions held.'.format(date))
-			continue
-	# If prompted to switch, the long and short positions are safely switched
-	if switch:
-		trades.replace(-1, 7, inplace=True)
-		trades.replace(1, -1, inplace=True)
-		trades.replace(7, 1, inplace=True)
-	return trades
\ No newline at end of file
+## This code models assorted strategies and returns a dataframe of trades, with the int8 codes of trade_signals.py.
+## -1 corresponds to sell short, 0 to hold, 1 to buy long, and 2 to clear all positions
+## Author: Miguel Opeña
+## Version: 1.6.2
+
+import logging
+import numpy as np
+import os
+import pandas as pd
+
+import trade_signals
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Signal codes (see trade_signals.py)
+LONG = trade_signals.LONG
+HOLD = trade_signals.HOLD
+SHORT = trade_signals.SHORT
+CLEAR = trade_signals.CLEAR
+
+def hold_clear(trend_baseline, switch=False):
+	"""	Simulates a very basic strategy: 
+		Inputs: trend and baseline data, order to switch start from long to short
+	"""
+	signals = np.zeros(len(trend_baseline.index), dtype=trade_signals.SIGNAL_DTYPE)
+	# Fills the second date with long/short
+	signals[1] = SHORT if switch else LONG
+	# Fills the last date with clear
+	signals[-1] = CLEAR
+	return trade_signals.to_frame(signals, trend_baseline.index)
+
+def crossover_signals(trend, baseline, switch=False):
+	"""	Computes crossover signals with array operations, for one (trend, baseline) pair or many at once. 
+		A bar where the trend is strictly below (above) the baseline, after last being strictly above (below) it, is a cross; 
+		the first bar counts as above only if the trend starts strictly above the baseline. 
+		Inputs: trend and baseline arrays (1D, or 2D with one column per pair, along the time axis 0), command to switch buy/sell signals
+		Outputs: int8 array of the same shape, 1 (buy long) on crosses below, -1 (sell short) on crosses above, 0 elsewhere
+	"""
+	trend = np.asarray(trend, dtype=float)
+	baseline = np.asarray(baseline, dtype=float)
+	# Strict side of the baseline on each bar: 1 above, -1 below, 0 when equal (or NaN)
+	side = (trend > baseline).astype(np.int8) - (trend < baseline).astype(np.int8)
+	if side.shape[0] == 0:
+		return side
+	initial = np.where(side[0] == 1, 1, -1).astype(np.int8)
+	# Carries the last strict side forward, starting from the initial side
+	rows = np.arange(side.shape[0]).reshape((-1,) + (1,) * (side.ndim - 1))
+	last_row = np.maximum.accumulate(np.where(side != 0, rows, -1), axis=0)
+	state = np.where(last_row >= 0, np.take_along_axis(side, last_row.clip(0), axis=0), initial)
+	previous = np.concatenate([initial[np.newaxis], state[:-1]], axis=0)
+	signals = np.where((side != 0) & (side != previous), -side, HOLD).astype(trade_signals.SIGNAL_DTYPE)
+	return -signals if switch else signals
+
+def crossover(trend_baseline, switch=False):
+	"""	Simulates a crossover strategy for a trend and baseline. 
+		Sells if trend crosses down below baseline, buys if trend crosses up above baseline. 
+		Inputs: trend and baseline data (price data unnecessary for this function), command to switch buy/sell signals
+		Outputs: dataframe of timestamp index and trade signals
+	"""
+	signals = crossover_signals(trend_baseline.trend.to_numpy(), trend_baseline.baseline.to_numpy(), switch=switch)
+	logger.debug('%d LONG and %d SHORT positions added.', (signals == 1).sum(), (signals == -1).sum())
+	return trade_signals.to_frame(signals, trend_baseline.index)
+	
+def running_std(values, window=None):
+	"""	Computes the standard deviation (ddof=1) of each bar's trailing data in one pass, with the rolling kernels of pandas 
+		(linear in the number of bars). Flat windows give exactly zero. 
+		NaN values are skipped. 
+		Inputs: 1D or 2D array (along the time axis 0), window length in bars (default: None, i.e. expanding from the first bar)
+		Outputs: array of the same shape, NaN until the window is full (or until two values are available, if expanding)
+	"""
+	values = np.asarray(values, dtype=float)
+	frame = pd.DataFrame(values.reshape(len(values), -1))
+	trailing = frame.expanding(min_periods=2) if window is None else frame.rolling(window)
+	std = trailing.std()
+	# The online updates of pandas leave rounding noise on flat windows, which are set to exactly zero
+	std = std.mask(std.notna() & (trailing.max() == trailing.min()), 0.0)
+	return std.to_numpy().reshape(values.shape)
+
+def zscore_signals(trend, baseline, zscores=[-1,0.5,1], window="full", switch=False):
+	"""	Computes z-score proximity signals with array operations, for one (trend, baseline) pair or many at once. 
+		Inputs: trend and baseline arrays (1D, or 2D with one column per pair, along the time axis 0), 
+			list of z-scores to use as buy, clear, and sell thresholds, 
+			standard deviation of the trend to normalize by: "full" for the full sample (default, which looks ahead), 
+			"expanding" for all bars so far, or a window length in bars for a rolling one, 
+			command to switch buy/sell signals
+		Outputs: int8 array of the same shape, with LONG, SHORT, CLEAR and HOLD codes
+	"""
+	trend = np.asarray(trend, dtype=float)
+	baseline = np.asarray(baseline, dtype=float)
+	if window == "full":
+		scale = np.nanstd(trend, axis=0, ddof=1)
+	else:
+		scale = running_std(trend, window=None if window == "expanding" else int(window))
+	with np.errstate(divide='ignore', invalid='ignore'):
+		zscore = (trend - baseline) / scale
+	# Conditions are checked in order: buy, then sell, then clear (NaN z-scores fall through to hold)
+	conditions = [zscore < zscores[0], zscore > zscores[-1], np.abs(zscore) < zscores[1]]
+	choices = [SHORT if switch else LONG, LONG if switch else SHORT, CLEAR]
+	return np.select(conditions, choices, default=HOLD).astype(trade_signals.SIGNAL_DTYPE)
+
+def zscore_distance(trend_baseline, zscores=[-1,0.5,1], switch=False, window="full"):
+	"""	Simulates a zscore proximity strategy for a trend and baseline. 
+		Sells if trend is too far above baseline, buys if trend is too far below baseline, unloads if insufficient distance. 
+		Inputs: price data with trend and baseline, list of z-scores to use as buy, sell, and clear signals, command to switch buy/sell signals, 
+			standard deviation to normalize by (see zscore_signals; default: full sample)
+		Outputs: dataframe of timestamp index and trade signals
+	"""
+	signals = zscore_signals(trend_baseline.trend.to_numpy(), trend_baseline.baseline.to_numpy(), zscores=zscores, 
+		window=window, switch=switch)
+	logger.debug('%d LONG, %d SHORT and %d CLEAR signals added.', (signals == LONG).sum(), (signals == SHORT).sum(), (signals == CLEAR).sum())
+	return trade_signals.to_frame(signals, trend_baseline.index)
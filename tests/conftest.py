@@ -0,0 +1,43 @@
+## This code sets up the tests: modules are imported from the repository root, and each one opens its log file on import.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Same folder as LOGDIR in every module, which must exist before any of them is imported
+os.makedirs("/Users/openamiguel/Desktop/LOG", exist_ok=True)
+
+# Symbols written by daily_folder, and date ranges (whole, partial and out of bounds) to read them over
+SYMBOLS = ['AAA', 'BBB', ('EUR', 'USD')]
+RANGES = [(None, None), ("2016-03-15", "2017-11-02"), ("2016-01", "2016-01"), (None, "2015"), ("2018", None),
+	("2016-07-04", "2016-07-04"), ("2010-01-01", "2013-01-01"), (pd.Timestamp("2016-02-29"), pd.Timestamp("2016-06-30"))]
+
+@pytest.fixture(scope="module")
+def daily_folder(tmp_path_factory):
+	""" Writes daily files as download.py does: two equities (one listed later) and a forex pair without volume. """
+	folder = tmp_path_factory.mktemp("stockDaily")
+	rng = np.random.default_rng(0)
+	for symbol, first in [('AAA', "2014-01-01"), ('BBB', "2015-06-15"), ('EUR_USD', "2014-01-01")]:
+		index = pd.bdate_range(first, "2018-12-31")
+		close = 100 + np.cumsum(rng.normal(0, 1, len(index)))
+		frame = pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1, 'close': close},
+			index=pd.Index(index.strftime("%Y-%m-%d"), name='timestamp'))
+		if symbol != 'EUR_USD':
+			frame['volume'] = rng.integers(1000, 9000, len(index))
+		frame.to_csv(str(folder / (symbol + "_DAILY.csv")))
+	return str(folder)
+
+def check_same(result, expected):
+	""" Checks that a store read has the rows and values of the CSV read. """
+	assert result is not None
+	assert len(result) == len(expected)
+	if len(expected) > 0:
+		assert result.index.equals(pd.DatetimeIndex(expected.index))
+		np.testing.assert_allclose(result[expected.columns].to_numpy(dtype=float), expected.to_numpy(dtype=float))
@@ -0,0 +1,34 @@
+## This code checks that event_engine.py streams the same bars from CSV files and from the price store.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import os
+import shutil
+
+import download
+import event_engine
+import manifest
+import price_store
+
+def test_bars_match_across_sources(daily_folder, tmp_path):
+	store = price_store.migrate_folder(daily_folder, str(tmp_path / "store"))
+	# Files marked clean (the daily files are written sorted) are read in blocks, with the timestamps left as text
+	clean_folder = str(tmp_path / "clean")
+	shutil.copytree(daily_folder, clean_folder)
+	current = manifest.get_manifest(clean_folder)
+	for name in os.listdir(clean_folder):
+		current.record(os.path.join(clean_folder, name), validation={'clean': True, 'ohlc_errors': 0})
+	csv_loader = download.CLoader(clean_folder, use_cache=False)
+	store_loader = download.CLoader(daily_folder, store=store, use_cache=False)
+	for symbol in ['AAA', ('EUR', 'USD')]:
+		csv_bars = list(event_engine.iter_bars(csv_loader, symbol, start="2016-03-15", end="2017-11-02", chunk_rows=100))
+		store_bars = list(event_engine.iter_bars(store_loader, symbol, start="2016-03-15", end="2017-11-02", chunk_rows=100))
+		assert len(csv_bars) > 0
+		assert [bar[0] for bar in csv_bars] == [bar[0] for bar in store_bars]
+		assert csv_bars[0][0] == "2016-03-15 00:00:00"
+
+def test_stream_bars_in_time_order(daily_folder):
+	loader = download.CLoader(daily_folder, use_cache=False)
+	timestamps = [bar[0] for bar in event_engine.stream_bars(loader, ['AAA', 'BBB'], end="2016-01-31")]
+	assert len(timestamps) > 0
+	assert timestamps == sorted(timestamps)
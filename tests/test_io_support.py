@@ -0,0 +1,61 @@
+## This code checks the binary-search range reads of io_support.py against slicing a full load of the same file.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import io_support
+
+def write_file(folder, index, name):
+	""" Writes a chronological OHLCV file the way download.py does, and returns its path. """
+	rng = np.random.default_rng(len(index))
+	close = 100 + np.cumsum(rng.normal(0, 1, len(index)))
+	frame = pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+		'volume': rng.integers(1000, 9000, len(index))}, index=pd.Index(index, name='timestamp'))
+	filepath = str(folder / name)
+	frame.to_csv(filepath)
+	return filepath
+
+def full_slice(filepath, start, end):
+	""" Loads the whole file and slices it on a datetime index (pandas partial-string rules). """
+	frame = pd.read_csv(filepath, index_col='timestamp')
+	frame.index = pd.DatetimeIndex(frame.index)
+	return frame.loc[start:end]
+
+def check_range(filepath, start, end):
+	expected = full_slice(filepath, start, end)
+	result = io_support.read_csv_range(filepath, start=start, end=end)
+	if len(expected) == 0:
+		# An empty index has no timestamps to parse, so only the rows and columns are compared
+		assert len(result) == 0 and list(result.columns) == list(expected.columns)
+	else:
+		result.index = pd.DatetimeIndex(result.index)
+		pd.testing.assert_frame_equal(result, expected, check_freq=False)
+	# Reading in small blocks gives the same rows
+	blocks = list(io_support.iter_csv_range(filepath, start=start, end=end, block_bytes=4096))
+	if len(expected) > 0:
+		streamed = pd.concat(blocks)
+		streamed.index = pd.DatetimeIndex(streamed.index)
+		pd.testing.assert_frame_equal(streamed, expected, check_freq=False)
+	else:
+		assert sum(len(block) for block in blocks) == 0
+
+DAILY_RANGES = [(None, None), ("2005-03-15", "2007-11-02"), ("2006-01", "2006-01"), (None, "2004"), ("2010", None),
+	("2006-07-04", "2006-07-04"), ("1990-01-01", "1995-01-01"), ("2030-01-01", None), (pd.Timestamp("2008-02-29"), pd.Timestamp("2008-06-30"))]
+
+@pytest.mark.parametrize("start,end", DAILY_RANGES)
+def test_daily_range_matches_full_load(tmp_path, start, end):
+	index = pd.bdate_range("2000-01-03", "2012-12-31").strftime("%Y-%m-%d")
+	check_range(write_file(tmp_path, index, "AAA_DAILY.csv"), start, end)
+
+INTRADAY_RANGES = [(None, None), ("2018-03-05 10:00", "2018-03-05 10:30"), ("2018-03-06", "2018-03-06"),
+	("2018-03-05 15:59:00", "2018-03-07 09:30:00"), ("2018-03-08 12", None), (None, "2018-03")]
+
+@pytest.mark.parametrize("start,end", INTRADAY_RANGES)
+def test_intraday_range_matches_full_load(tmp_path, start, end):
+	days = pd.bdate_range("2018-02-01", "2018-04-30")
+	index = pd.DatetimeIndex(np.concatenate([pd.date_range(day + pd.Timedelta("9h30min"), day + pd.Timedelta("16h"), freq="min").values
+		for day in days])).strftime("%Y-%m-%d %H:%M:%S")
+	check_range(write_file(tmp_path, index, "AAA_INTRADAY&1min.csv"), start, end)
@@ -0,0 +1,36 @@
+## This code checks that the process pool of optimizer.py, reading prices from shared memory, gives the same results as one process.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# optimizer.py backtests through portfolio.py, which imports the plotting modules
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+
+import optimizer
+
+@pytest.fixture(scope="module")
+def prices():
+	rng = np.random.default_rng(0)
+	values = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (400, 6)), axis=0))
+	# One symbol lists later than the others
+	values[:30, 2] = np.nan
+	return pd.DataFrame(values, index=pd.bdate_range("2015-01-01", periods=400), columns=['S{}'.format(j) for j in range(6)])
+
+@pytest.mark.parametrize("strategy_name", [optimizer.CROSSOVER, optimizer.ZSCORE])
+def test_pool_matches_serial(prices, strategy_name):
+	if strategy_name == optimizer.CROSSOVER:
+		grid = optimizer.crossover_grid([5, 10, 20], [30, 60], switches=(False, True))
+	else:
+		grid = optimizer.zscore_grid([5, 10], [30], buys=[-1.5, -1], clears=[0.5], sells=[1, 1.5], windows=(0, 40))
+	folds = optimizer.walk_forward_folds(len(prices), 200, 100)
+	serial = optimizer.optimize(prices, strategy_name, grid, folds=folds, workers=0, chunk_size=5)
+	pooled = optimizer.optimize(prices, strategy_name, grid, folds=folds, workers=2, chunk_size=5)
+	pd.testing.assert_frame_equal(pooled, serial)
+	assert len(serial) == len(grid) * 2 * len(folds)
+
+def test_walk_forward_folds():
+	assert optimizer.walk_forward_folds(10, 4, 2) == [(0, 4, 4, 6), (2, 6, 6, 8), (4, 8, 8, 10)]
@@ -0,0 +1,102 @@
+## This code checks the cumulative-sum ledger of portfolio.py against the bar-by-bar loop of the original apply_trades.
+## Author: Miguel Opeña
+## Version: 1.0.1
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# portfolio.py imports the plotting modules
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+
+import portfolio
+import trade_signals
+
+def legacy_apply_trades(all_prices, codes, initialval=100000, seed=0.1, numtrades=1, transaction=7):
+	""" Loop of the original portfolio.apply_trades, on the consolidated price column.
+		Outputs: array of portfolio value, or None where the original returned None
+	"""
+	startval = all_prices[0]
+	if startval > initialval:
+		return None
+	numpositions = int(np.floor(seed * initialval / startval))
+	value = np.full(len(all_prices), initialval - startval * numpositions)
+	for i in range(1, len(all_prices)):
+		if codes[i] == trade_signals.LONG:
+			value[i] = value[i - 1] - all_prices[i] * numtrades - transaction
+			numpositions += numtrades
+		elif codes[i] == trade_signals.HOLD:
+			value[i] = value[i - 1]
+		elif codes[i] == trade_signals.SHORT:
+			value[i] = value[i - 1] + all_prices[i] * numtrades - transaction
+			numpositions -= numtrades
+		elif codes[i] == trade_signals.CLEAR:
+			value[i] = value[i - 1] + all_prices[i] * numpositions
+			if numpositions != 0:
+				value[i] = value[i] - transaction
+			numpositions = 0
+		if value[i - 1] <= 0:
+			return None
+	return value
+
+def make_case(seed, num_dates=300, num_symbols=3):
+	rng = np.random.default_rng(seed)
+	index = pd.date_range("2018-01-01", periods=num_dates)
+	prices = pd.DataFrame(50 * np.exp(np.cumsum(rng.normal(0, 0.02, (num_dates, num_symbols)), axis=0)), index=index)
+	codes = rng.choice([0, 0, 0, 1, -1, 2], size=num_dates).astype(trade_signals.SIGNAL_DTYPE)
+	return prices, codes
+
+@pytest.mark.parametrize("numtrades", [1, 5])
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_apply_trades_matches_loop(seed, numtrades):
+	prices, codes = make_case(seed)
+	expected = legacy_apply_trades(prices.sum(axis=1).to_numpy(), codes, numtrades=numtrades)
+	result = portfolio.apply_trades(prices, trade_signals.to_frame(codes, prices.index), numtrades=numtrades)
+	if expected is None:
+		assert result is None
+	else:
+		assert result.index.equals(prices.index)
+		np.testing.assert_allclose(result.price.to_numpy(), expected)
+
+def test_apply_trades_legacy_codes():
+	prices, codes = make_case(4)
+	trades = pd.DataFrame({'all_trades': trade_signals.to_legacy(codes)}, index=prices.index)
+	expected = legacy_apply_trades(prices.sum(axis=1).to_numpy(), codes)
+	np.testing.assert_allclose(portfolio.apply_trades(prices, trades).price.to_numpy(), expected)
+
+def test_apply_trades_aligns_by_timestamp():
+	prices, codes = make_case(8)
+	expected = legacy_apply_trades(prices.sum(axis=1).to_numpy(), codes)
+	trades = trade_signals.to_frame(codes, prices.index)
+	# Shuffled rows and bars without a signal (read as HOLD) are lined up with the prices by timestamp
+	shuffled = trades.sample(frac=1, random_state=8)
+	np.testing.assert_allclose(portfolio.apply_trades(prices, shuffled).price.to_numpy(), expected)
+	sparse = trades[trades.all_trades != trade_signals.HOLD]
+	np.testing.assert_allclose(portfolio.apply_trades(prices, sparse).price.to_numpy(), expected)
+
+def test_apply_trades_out_of_funds():
+	prices, codes = make_case(5)
+	codes[1:] = trade_signals.LONG
+	assert legacy_apply_trades(prices.sum(axis=1).to_numpy(), codes, numtrades=50) is None
+	assert portfolio.apply_trades(prices, trade_signals.to_frame(codes, prices.index), numtrades=50) is None
+
+def test_apply_trades_insufficient_funds():
+	prices, codes = make_case(6)
+	assert portfolio.apply_trades(prices, trade_signals.to_frame(codes, prices.index), initialval=10) is None
+
+def test_trade_ledger_columns_match_single():
+	prices, _ = make_case(7, num_symbols=4)
+	rng = np.random.default_rng(7)
+	codes = rng.choice([0, 0, 1, -1, 2], size=prices.shape).astype(trade_signals.SIGNAL_DTYPE)
+	values = prices.to_numpy()
+	start_positions = np.floor(10000 / values[0]).astype(np.int64)
+	start_cash = 100000 - values[0] * start_positions
+	cash, positions = portfolio.trade_ledger(values, codes, start_cash, start_positions, numtrades=2)
+	for j in range(values.shape[1]):
+		single_cash, single_positions = portfolio.trade_ledger(values[:, j], codes[:, j], start_cash[j], start_positions[j], numtrades=2)
+		np.testing.assert_allclose(cash[:, j], single_cash)
+		np.testing.assert_array_equal(positions[:, j], single_positions)
+		expected = legacy_apply_trades(values[:, j], codes[:, j], seed=10000 / 100000, numtrades=2)
+		if expected is not None:
+			np.testing.assert_allclose(single_cash, expected)
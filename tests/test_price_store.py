@@ -0,0 +1,17 @@
+## This code checks date-range reads from the price store against reading the CSV files it was built from.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import pytest
+
+from conftest import RANGES, SYMBOLS, check_same
+import download
+import price_store
+
+@pytest.mark.parametrize("start,end", RANGES)
+def test_price_store_matches_csv(daily_folder, tmp_path, start, end):
+	store = price_store.migrate_folder(daily_folder, str(tmp_path / "store"))
+	csv_loader = download.CLoader(daily_folder, use_cache=False)
+	store_loader = download.CLoader(daily_folder, store=store, use_cache=False)
+	for symbol in SYMBOLS:
+		check_same(store_loader.load_single_drive(symbol, start=start, end=end), csv_loader.load_single_drive(symbol, start=start, end=end))
@@ -0,0 +1,36 @@
+## This code checks date-range reads from the shared panel against reading the CSV files it was built from.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import numpy as np
+import pytest
+
+from conftest import RANGES, SYMBOLS, check_same
+import download
+import io_support
+import shared_panel
+
+@pytest.mark.parametrize("start,end", RANGES)
+def test_shared_panel_matches_csv(daily_folder, tmp_path, start, end):
+	csv_loader = download.CLoader(daily_folder, use_cache=False)
+	panel = shared_panel.build_panel(csv_loader, SYMBOLS, str(tmp_path / "panel"))
+	for symbol in SYMBOLS:
+		expected = csv_loader.load_single_drive(symbol, start=start, end=end)
+		check_same(panel.read(io_support.get_file_stem(symbol), start=start, end=end), expected)
+		# Rows of the panel's date range line up with the CSV rows on the panel's calendar
+		lo, hi = panel.date_range(start, end)
+		values = panel.get_symbol(symbol)[lo:hi, panel.field_map['close']]
+		assert np.count_nonzero(~np.isnan(values)) == len(expected)
+
+def test_shared_panel_forex_has_no_volume(daily_folder, tmp_path):
+	panel = shared_panel.build_panel(download.CLoader(daily_folder, use_cache=False), SYMBOLS, str(tmp_path / "panel"))
+	assert np.isnan(panel.get_panel([('EUR', 'USD')], field='volume').to_numpy()).all()
+	assert not np.isnan(panel.get_panel(['AAA'], field='volume').to_numpy()).all()
+
+def test_shared_panel_rebuild_keeps_open_readers(daily_folder, tmp_path):
+	loader = download.CLoader(daily_folder, use_cache=False)
+	first = shared_panel.build_panel(loader, ['AAA'], str(tmp_path / "panel"))
+	second = shared_panel.build_panel(loader, ['AAA', 'BBB'], str(tmp_path / "panel"))
+	# The first reader keeps the build it opened; new readers see the rebuild
+	assert first.symbols == ['AAA'] and first.get_array('close').shape[1] == 1
+	assert shared_panel.CSharedPanel(str(tmp_path / "panel")).symbols == second.symbols == ['AAA', 'BBB']
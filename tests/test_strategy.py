@@ -0,0 +1,108 @@
+## This code checks the array-based signals of strategy.py against the bar-by-bar loops they replaced.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import numpy as np
+import pandas as pd
+import pytest
+import warnings
+
+import strategy
+import trade_signals
+
+def legacy_crossover(trend, baseline, switch=False):
+	""" Loop of the original strategy.crossover, on plain arrays. """
+	signals = np.zeros(len(trend), dtype=int)
+	was_greater = trend[0] > baseline[0]
+	for i in range(len(trend)):
+		if trend[i] < baseline[i] and was_greater:
+			was_greater = not was_greater
+			signals[i] = 1
+		elif trend[i] > baseline[i] and not was_greater:
+			was_greater = not was_greater
+			signals[i] = -1
+	return -signals if switch else signals
+
+def legacy_zscore(trend, baseline, zscores=[-1,0.5,1], switch=False):
+	""" Loop of the original strategy.zscore_distance, on plain arrays (CLEAR written as 2 instead of 'X'). """
+	signals = np.zeros(len(trend), dtype=int)
+	zscore_running = (trend - baseline) / pd.Series(trend).std()
+	for i in range(len(trend)):
+		if zscore_running[i] < zscores[0]:
+			signals[i] = -1 if switch else 1
+		elif zscore_running[i] > zscores[-1]:
+			signals[i] = 1 if switch else -1
+		elif abs(zscore_running[i]) < zscores[1]:
+			signals[i] = trade_signals.CLEAR
+	return signals
+
+def make_pairs(seed, num_dates=500, num_pairs=6):
+	""" Random walks with their moving averages, rounded so that ties occur, and with NaN warm-up rows. """
+	rng = np.random.default_rng(seed)
+	prices = pd.DataFrame(100 + np.cumsum(rng.normal(0, 1, (num_dates, num_pairs)), axis=0)).round(1)
+	trend = prices.rolling(5).mean().round(1).to_numpy(copy=True)
+	baseline = prices.rolling(20).mean().round(1).to_numpy(copy=True)
+	return trend, baseline
+
+@pytest.mark.parametrize("switch", [False, True])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_crossover_signals_match_loop(seed, switch):
+	trend, baseline = make_pairs(seed)
+	signals = strategy.crossover_signals(trend, baseline, switch=switch)
+	assert signals.dtype == trade_signals.SIGNAL_DTYPE
+	for j in range(trend.shape[1]):
+		np.testing.assert_array_equal(signals[:, j], legacy_crossover(trend[:, j], baseline[:, j], switch=switch))
+
+def test_crossover_starts_above_baseline():
+	trend, baseline = make_pairs(3)
+	# Starts strictly above the baseline, so the first strict cross below is a buy
+	trend[0], baseline[0] = 2.0, 1.0
+	for j in range(trend.shape[1]):
+		np.testing.assert_array_equal(strategy.crossover_signals(trend[:, j], baseline[:, j]), legacy_crossover(trend[:, j], baseline[:, j]))
+
+def test_crossover_frame():
+	trend, baseline = make_pairs(4, num_pairs=1)
+	index = pd.date_range("2018-01-01", periods=len(trend))
+	trades = strategy.crossover(pd.DataFrame({'trend': trend[:, 0], 'baseline': baseline[:, 0]}, index=index))
+	assert list(trades.columns) == ['all_trades']
+	assert trades.index.equals(index)
+	np.testing.assert_array_equal(trades.all_trades.to_numpy(), legacy_crossover(trend[:, 0], baseline[:, 0]))
+
+@pytest.mark.parametrize("switch", [False, True])
+@pytest.mark.parametrize("zscores", [[-1,0.5,1], [-2,0.25,1.5]])
+def test_zscore_signals_match_loop(zscores, switch):
+	trend, baseline = make_pairs(5)
+	signals = strategy.zscore_signals(trend, baseline, zscores=zscores, switch=switch)
+	for j in range(trend.shape[1]):
+		np.testing.assert_array_equal(signals[:, j], legacy_zscore(trend[:, j], baseline[:, j], zscores=zscores, switch=switch))
+
+def test_zscore_distance_frame():
+	trend, baseline = make_pairs(6, num_pairs=1)
+	index = pd.date_range("2018-01-01", periods=len(trend))
+	trades = strategy.zscore_distance(pd.DataFrame({'trend': trend[:, 0], 'baseline': baseline[:, 0]}, index=index))
+	np.testing.assert_array_equal(trade_signals.to_codes(trades), legacy_zscore(trend[:, 0], baseline[:, 0]))
+
+def window_std(values, window=None):
+	""" Standard deviation (ddof=1) of each bar's trailing data, one window at a time. """
+	result = np.full(values.shape, np.nan)
+	min_periods = 2 if window is None else max(2, window)
+	for i in range(len(values)):
+		lo = 0 if window is None else i + 1 - window
+		if lo < 0:
+			continue
+		trailing = values[lo:i + 1]
+		count = np.count_nonzero(~np.isnan(trailing), axis=0)
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore", RuntimeWarning)
+			result[i] = np.where(count >= min_periods, np.nanstd(trailing, axis=0, ddof=1), np.nan)
+	return result
+
+@pytest.mark.parametrize("window", [None, 2, 30])
+def test_running_std_matches_window_loop(window):
+	trend, _ = make_pairs(7)
+	np.testing.assert_allclose(strategy.running_std(trend, window=window), window_std(trend, window=window), rtol=1e-9, atol=1e-12)
+
+def test_running_std_flat_and_1d():
+	values = np.r_[np.nan, 5.0, 5.0, 5.0, 7.0]
+	np.testing.assert_array_equal(strategy.running_std(values, window=2), [np.nan, np.nan, 0.0, 0.0, np.sqrt(2)])
+	np.testing.assert_allclose(strategy.running_std(values), window_std(values))
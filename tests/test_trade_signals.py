@@ -0,0 +1,21 @@
+## This code checks the conversion of trade signals to the dense form in trade_signals.py.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import numpy as np
+import pytest
+
+import trade_signals
+
+def test_to_codes_accepts_all_forms():
+	expected = np.array([1, 0, -1, 2], dtype=trade_signals.SIGNAL_DTYPE)
+	for trades in [np.array([1, 0, -1, 2]), np.array([1., 0., -1., 2.]), np.array([1, 0, -1, 'X'], dtype=object)]:
+		codes = trade_signals.to_codes(trades)
+		assert codes.dtype == trade_signals.SIGNAL_DTYPE
+		assert np.array_equal(codes, expected)
+
+@pytest.mark.parametrize('trades', [np.array([1, 258]), np.array([1., 0.5]), np.array([1., np.nan]), np.array([1, 'Y'], dtype=object)])
+def test_to_codes_rejects_bad_values(trades):
+	# Casting before the check would wrap 258 to 2 and truncate 0.5 and NaN to 0
+	with pytest.raises(ValueError, match=r"rows \[1\]"):
+		trade_signals.to_codes(trades)
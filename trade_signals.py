@@ -0,0 +1,94 @@
+## This code defines the trade signals passed from strategy.py to portfolio.py.
+## Dense form: one int8 code per bar (1 buy long, 0 hold, -1 sell short, 2 clear all positions).
+## Event form: only the bars that trade, as (row, code) arrays, for strategies that trade rarely.
+## Author: Miguel Opeña
+## Version: 1.0.1
+
+import logging
+import numpy as np
+import os
+import pandas as pd
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+LONG = 1
+HOLD = 0
+SHORT = -1
+CLEAR = 2
+SIGNAL_DTYPE = np.int8
+# Code used for clearing in older trade dataframes
+LEGACY_CLEAR = 'X'
+
+def to_codes(trades):
+	""" Converts trade signals in any form to the dense int8 form.
+		Inputs: trades dataframe (all_trades column), series or array, with CLEAR written as 2 or 'X'
+		Outputs: int8 array, one code per bar
+	"""
+	if isinstance(trades, pd.DataFrame):
+		trades = trades.all_trades
+	values = np.asarray(trades)
+	if values.dtype == SIGNAL_DTYPE:
+		return values
+	if values.dtype == object:
+		values = np.where(values == LEGACY_CLEAR, CLEAR, values)
+	# Checks the values before the cast, which would wrap large integers and truncate fractions or NaN
+	bad = ~np.isin(values, [LONG, HOLD, SHORT, CLEAR])
+	if bad.any():
+		raise ValueError("Bad trading signal found at rows {}".format(np.flatnonzero(bad)[:10].tolist()))
+	return values.astype(SIGNAL_DTYPE)
+
+def to_frame(codes, index):
+	""" Wraps dense codes into the trades dataframe exchanged by strategy.py and portfolio.py.
+		Inputs: int8 array, timestamp index
+		Outputs: dataframe with an int8 all_trades column
+	"""
+	return pd.DataFrame({'all_trades': np.asarray(codes, dtype=SIGNAL_DTYPE)}, index=index)
+
+def to_legacy(codes):
+	""" Converts dense codes to the older object form, with 'X' for CLEAR. """
+	legacy = np.asarray(codes).astype(object)
+	legacy[np.asarray(codes) == CLEAR] = LEGACY_CLEAR
+	return legacy
+
+def to_events(codes):
+	""" Converts dense codes (1D, or 2D with one column per strategy) to the event form.
+		Outputs: tuple of (rows, codes) for 1D input, or (rows, columns, codes) for 2D input, in row order
+	"""
+	codes = to_codes(codes)
+	if codes.ndim == 1:
+		rows = np.flatnonzero(codes)
+		return rows, codes[rows]
+	rows, columns = np.nonzero(codes)
+	return rows, columns, codes[rows, columns]
+
+def from_events(rows, event_codes, length, columns=None, num_columns=None):
+	""" Converts the event form back to dense codes.
+		Inputs: rows and codes of the events, number of bars, columns of the events and number of columns (for 2D output)
+		Outputs: int8 array, HOLD on every bar without an event
+	"""
+	if columns is None:
+		codes = np.zeros(length, dtype=SIGNAL_DTYPE)
+		codes[rows] = event_codes
+	else:
+		codes = np.zeros((length, num_columns), dtype=SIGNAL_DTYPE)
+		codes[rows, columns] = event_codes
+	return codes
@@ -0,0 +1,119 @@
+## This code holds the US Treasury yield curve as one dates x tenors matrix, and interpolates it for many dates and maturities at once.
+## Rates are stored in decimal form (0.025 for 2.5 percent); tenors are in years.
+## Author: Miguel Opeña
+## Version: 1.0.0
+
+import logging
+import numpy as np
+import os
+import pandas as pd
+
+import download
+
+LOGDIR = "/Users/openamiguel/Desktop/LOG"
+# Initialize logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# Set file path for logger
+handler = logging.FileHandler('{}/equitysim.log'.format(LOGDIR))
+handler.setLevel(logging.DEBUG)
+# Format the logger
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+# Add the new format
+logger.addHandler(handler)
+# Format the console logger
+consoleHandler = logging.StreamHandler()
+consoleHandler.setLevel(logging.INFO)
+consoleHandler.setFormatter(formatter)
+# Add the new format to the logger file
+logger.addHandler(consoleHandler)
+
+logger.info("----------INITIALIZING NEW RUN OF %s----------", os.path.basename(__file__))
+
+# Tenors published by the US Treasury (column names of CMacroDownloader.yield_curve_table), in years
+TENORS = {'1MONTH': 1.0 / 12, '2MONTH': 2.0 / 12, '3MONTH': 0.25, '4MONTH': 4.0 / 12, '6MONTH': 0.5,
+	'1YEAR': 1.0, '2YEAR': 2.0, '3YEAR': 3.0, '5YEAR': 5.0, '7YEAR': 7.0, '10YEAR': 10.0, '20YEAR': 20.0, '30YEAR': 30.0}
+
+class CYieldCurve:
+	""" A class to interpolate a history of yield curves, across dates and tenors at once """
+	def __init__(self, table):
+		""" Builds the curve from a table of yields in percent (dates x tenor columns, as from yield_curve_multi). """
+		columns = sorted((column for column in table.columns if column in TENORS), key=TENORS.get)
+		table = table[columns]
+		table = table[~table.index.duplicated(keep='first')].sort_index()
+		self.dates = pd.DatetimeIndex(pd.to_datetime(table.index), name='timestamp')
+		self.tenor_names = columns
+		self.tenors = np.array([TENORS[column] for column in columns])
+		self.rates = self.fill_tenors(table.to_numpy(dtype=float) / 100.0)
+
+	def fill_tenors(self, rates):
+		""" Fills the tenors missing on a date (not yet issued, or null in the feed) by linear interpolation
+			between that date's neighbouring tenors, and flat beyond the first and last published tenor.
+			Input: dates x tenors array with NaN where missing
+			Output: filled array (dates with no tenor at all stay NaN)
+		"""
+		num_tenors = rates.shape[1]
+		valid = ~np.isnan(rates)
+		columns = np.arange(num_tenors)
+		# Nearest published tenor on each side of every entry, for all dates at once
+		prev_col = np.maximum.accumulate(np.where(valid, columns, -1), axis=1)
+		next_col = np.minimum.accumulate(np.where(valid, columns, num_tenors)[:, ::-1], axis=1)[:, ::-1]
+		prev_col_safe = np.where(prev_col < 0, next_col, prev_col).clip(0, num_tenors - 1)
+		next_col_safe = np.where(next_col >= num_tenors, prev_col, next_col).clip(0, num_tenors - 1)
+		rows = np.arange(rates.shape[0])[:, None]
+		prev_rate = rates[rows, prev_col_safe]
+		next_rate = rates[rows, next_col_safe]
+		span = self.tenors[next_col_safe] - self.tenors[prev_col_safe]
+		weight = np.divide(self.tenors[columns] - self.tenors[prev_col_safe], span, out=np.zeros_like(span), where=span > 0)
+		return np.where(valid, rates, prev_rate + weight * (next_rate - prev_rate))
+
+	def date_rows(self, dates):
+		""" Returns the row of the latest curve published on or before each date (-1 if none). """
+		dates = pd.DatetimeIndex(pd.to_datetime(dates))
+		return self.dates.searchsorted(dates, side='right') - 1
+
+	def interpolate(self, times, dates=None):
+		""" Interpolates rates linearly in tenor (flat beyond the shortest and longest tenor).
+			Inputs: times to maturity in years (1D, same for all dates; or 2D, one row per date),
+				dates (default: every date of the curve; each takes the latest curve on or before it)
+			Outputs: dates x times array of rates in decimal form (NaN before the first curve)
+		"""
+		rates = self.rates
+		if dates is not None:
+			rows = self.date_rows(dates)
+			rates = np.where((rows >= 0)[:, None], self.rates[rows.clip(0)], np.nan)
+		times = np.asarray(times, dtype=float)
+		flat_times = np.clip(times, self.tenors[0], self.tenors[-1])
+		upper = np.searchsorted(self.tenors, flat_times, side='left').clip(1, len(self.tenors) - 1)
+		lower = upper - 1
+		weight = (flat_times - self.tenors[lower]) / (self.tenors[upper] - self.tenors[lower])
+		if times.ndim == 1:
+			return rates[:, lower] + weight * (rates[:, upper] - rates[:, lower])
+		rows = np.arange(rates.shape[0])[:, None]
+		return rates[rows, lower] + weight * (rates[rows, upper] - rates[rows, lower])
+
+	def discount_factors(self, times, dates=None, freq=None):
+		""" Computes discount factors off the curve.
+			Inputs: times to cash flows in years (see interpolate), dates (default: every date of the curve),
+				compounding frequency per year (default: continuous)
+			Outputs: dates x times array of discount factors
+		"""
+		times = np.asarray(times, dtype=float)
+		rates = self.interpolate(times, dates=dates)
+		if freq is None:
+			return np.exp(-rates * times)
+		return (1 + rates / freq) ** (-freq * times)
+
+	def to_frame(self):
+		""" Returns the (filled) curve as a dataframe of decimal rates, one column per tenor. """
+		return pd.DataFrame(self.rates, index=self.dates, columns=self.tenor_names)
+
+def load_curve(start_year=1991, end_year=None, downloader=None):
+	""" Downloads (or reads from cache) the US Treasury yield curve on all tenors for a range of years.
+		Inputs: start year (default: 1991), end year (default: current year), CMacroDownloader (default: a new one)
+		Outputs: CYieldCurve instance
+	"""
+	downloader = download.CMacroDownloader() if downloader is None else downloader
+	end_year = downloader.current_year if end_year is None else end_year
+	return CYieldCurve(downloader.yield_curve_multi(start_year, end_year, maturity=None))